@@ -1,6 +1,6 @@
 """Auto-apply multi-agent system package."""
 
-from .context import AutoApplyContext, FieldDescriptor, AnswerRecord, NavigatorResult
+from .context import AutoApplyContext, FieldDescriptor, FieldKind, AnswerRecord, NavigatorResult
 from .playwright_client import PlaywrightSession, PlaywrightClientError
 from .knowledge_base import KnowledgeBase
 from .application_navigator_agent import ApplicationNavigatorAgent
@@ -14,6 +14,7 @@ from .orchestrator import AutoApplyOrchestrator
 __all__ = [
     "AutoApplyContext",
     "FieldDescriptor",
+    "FieldKind",
     "AnswerRecord",
     "NavigatorResult",
     "PlaywrightSession",
@@ -2,12 +2,23 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import itertools
+import re
+import sys
+from importlib.util import find_spec
 from pathlib import Path
-from collections import defaultdict
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Set, Tuple
+from urllib.parse import urldefrag, urljoin
 from uuid import uuid4
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+try:  # pragma: no cover - optional dependency
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
 
 from .context import ApplyMethod, AutoApplyContext, FieldDescriptor, NavigatorResult
 from .playwright_client import PlaywrightSession, PlaywrightClientError
@@ -15,6 +26,19 @@ from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# HTML compresses roughly 10x; level 3 costs a couple of ms on a 1MB DOM.
+SNAPSHOT_ZSTD_LEVEL = 3
+# lxml's C parser is several times faster than html.parser on large job pages.
+HTML_PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
+# Only these tags (and whatever they contain) are built into the tree, so the
+# <head>, top-level scripts and styles of a job page are never parsed.
+NAV_STRAINER = SoupStrainer(
+    [
+        "button", "a", "form", "input", "textarea", "select", "label", "fieldset", "legend",
+        "h1", "h2", "h3", "h4", "strong", "div", "span",
+    ]
+)
+
 APPLY_KEYWORDS = [
     "apply",
     "proceed",
@@ -40,20 +64,138 @@ COOKIE_ACCEPT_TEXTS = [
     "got it",
 ]
 
+# One alternation scans a label once instead of once per keyword.
+APPLY_RE = re.compile("|".join(map(re.escape, APPLY_KEYWORDS)), re.IGNORECASE)
+COOKIE_ACCEPT_RE = re.compile("|".join(map(re.escape, COOKIE_ACCEPT_TEXTS)), re.IGNORECASE)
+# Per-text patterns in COOKIE_ACCEPT_TEXTS order, so "accept all" wins over a bare "accept".
+COOKIE_ACCEPT_PATTERNS = [re.compile(re.escape(text), re.IGNORECASE) for text in COOKIE_ACCEPT_TEXTS]
+# Only controls can dismiss a banner; a paragraph mentioning "accept" must not be clicked.
+COOKIE_BUTTON_SELECTOR = "button, [role='button'], a"
+
 CONTENT_READY_SELECTORS = [
     "[data-ui='apply-button']",
     "[data-ui='careers-page-content']",
     "a[href*='/apply']",
 ]
+# Inline-SVG fallback text some ATS widgets leave inside labels.
+SVG_FALLBACK_TEXT = "SVGs not supported by this browser."
+FORM_CONTROL_SELECTOR = "input, textarea, select"
+# Backoff between checks for a form revealed by a click; 1.5s in total at worst.
+CLICK_SETTLE_DELAYS = (0.1, 0.2, 0.4, 0.8)
+# Apply links that lead to another URL are loaded in parallel pages, this many at a time.
+MAX_PARALLEL_PAGES = 3
+# Seconds each of those pages waits for a client-rendered form control to appear.
+LINK_FORM_TIMEOUT = 5.0
+
+
+# Distinct <select> option lists remembered per agent (country, university lists recur).
+OPTIONS_CACHE_SIZE = 64
+FIELD_TAGS = frozenset({"input", "textarea", "select"})
+# A form holding only these input types is a site search box or similar, not an application.
+NON_CANDIDATE_INPUT_TYPES = frozenset({"search", "hidden", "submit", "button"})
+# Copied into FieldDescriptor.metadata only when set; readers use metadata.get(key, "").
+METADATA_ATTRS = (
+    "aria-label",
+    "aria-haspopup",
+    "aria-controls",
+    "aria-owns",
+    "aria-autocomplete",
+    "data-question",
+    "data-ui",
+    "data-input-type",
+    "role",
+)
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4"})
+CONTAINER_HINT_CLASS = "styles--3aPac"
+
+
+class ParsedDom:
+    """One DOM snapshot, parsed through :data:`NAV_STRAINER`.
+
+    ``label_for`` maps each ``<label for=...>`` target to the first such
+    label; it is filled while fields are extracted.
+    """
+
+    def __init__(self, html: str, soup: BeautifulSoup) -> None:
+        self.html = html
+        self.soup = soup
+        self.label_for: Dict[str, Tag] = {}
+        self._ids: Dict[str, Tag] | None = None
+        self._full_ids: Dict[str, Tag] | None = None
+
+    def find_id(self, element_id: str) -> Tag | None:
+        """Find by id, re-parsing the whole document if the strainer dropped the node."""
+        if self._ids is None:
+            self._ids = _index_ids(self.soup)
+        node = self._ids.get(element_id)
+        if node is None:
+            if self._full_ids is None:
+                self._full_ids = _index_ids(BeautifulSoup(self.html, HTML_PARSER))
+            node = self._full_ids.get(element_id)
+        return node
+
+
+def _index_ids(soup: BeautifulSoup) -> Dict[str, Tag]:
+    """Map each id to its first element, as ``soup.find(id=...)`` would."""
+    ids: Dict[str, Tag] = {}
+    for tag in soup.find_all(id=True):
+        ids.setdefault(tag["id"], tag)
+    return ids
+
+
+def _css_string(value: str) -> str:
+    """Escape ``value`` for a single-quoted CSS attribute selector."""
+    # Almost no attribute value needs escaping, so skip the replaces in the common case.
+    if "'" not in value and "\\" not in value:
+        return value
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+class _Ancestors(NamedTuple):
+    """What the label heuristics need from a control's nearest enclosing tags.
+
+    Forms are numbered; ``data-question`` containers and ``styles--3aPac``
+    hint containers are reduced to their text when the walk enters them.
+    """
+
+    form: int | None = None
+    label: Tag | None = None
+    fieldset: Tag | None = None
+    question: str | None = None
+    heading: Tag | None = None
+    hint: str | None = None
+
+
+_NO_ANCESTORS = _Ancestors()
+
+
+def _has_hint_class(tag: Tag) -> bool:
+    classes = tag.get("class") or []
+    if isinstance(classes, str):
+        classes = [classes]
+    return any(CONTAINER_HINT_CLASS in cls for cls in classes)
+
+
+def read_snapshot(path: Path) -> str:
+    """Return the HTML of a DOM snapshot written by the navigator, compressed or not."""
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError("Reading .zst DOM snapshots needs the optional 'zstandard' package.")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return data.decode("utf-8")
 
 
 class ApplicationNavigatorAgent:
     """Detects apply flows and extracts form descriptors."""
 
-    def __init__(self, base_path: Path | None = None) -> None:
+    def __init__(self, base_path: Path | None = None, *, preload: bool = True) -> None:
         self.base_path = base_path or Path(__file__).resolve().parents[1]
+        # Warm the session's page before the first goto; a no-op once the session is warm.
+        self.preload = preload
         self.snapshot_dir = self.base_path / "output" / "dom_snapshots"
         self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self._clean_options = lru_cache(maxsize=OPTIONS_CACHE_SIZE)(self._clean_option_pairs)
 
     # -------------------- public API --------------------
     def run(self, context: AutoApplyContext, session: PlaywrightSession) -> NavigatorResult:
@@ -61,6 +203,8 @@ class ApplicationNavigatorAgent:
 
     async def run_async(self, context: AutoApplyContext, session: PlaywrightSession) -> NavigatorResult:
         logger.info("Navigator: loading job URL %s", context.job_url)
+        if self.preload:
+            await session.warmup()
         try:
             await session.goto(context.job_url, wait_until="domcontentloaded")
         except PlaywrightClientError as exc:
@@ -70,19 +214,30 @@ class ApplicationNavigatorAgent:
             await session.goto(context.job_url, wait_until="load")
         await self._dismiss_blocking_ui(session)
         await self._wait_for_primary_content(session)
-        await asyncio.sleep(0.5)
         dom_html = await session.get_dom()
         job_name = context.ensure_job_name()
-        dom_path = self._write_snapshot(job_name, 0, dom_html)
-        logger.info("Navigator: captured initial DOM snapshot at %s", dom_path)
+        # Snapshots are written on worker threads and awaited once the flow is mapped.
+        snapshot_writes = [self._write_snapshot_later(job_name, 0, dom_html)]
 
-        apply_methods = self._detect_apply_methods(dom_html)
+        dom = self._parse(dom_html)
+        apply_methods = self._detect_apply_methods(dom)
         logger.info("Navigator: detected %d potential apply methods", len(apply_methods))
-        fields = self._extract_fields(dom_html, step_index=0)
+        fields = self._extract_fields(dom, step_index=0)
         logger.info("Navigator: extracted %d fields on initial step", len(fields))
+        # Later steps often re-render the step-0 form; only genuinely new fields count.
+        seen_fields = {self._field_fingerprint(field) for field in fields}
+
+        link_targets = self._link_targets(context.job_url, apply_methods)
+        followed = await self._follow_apply_links(
+            session, link_targets, job_name, fields, seen_fields, snapshot_writes
+        )
 
-        # attempt to click first viable apply method to capture subsequent forms
+        # otherwise click apply methods one by one to capture subsequent forms; link
+        # targets stay eligible since some only render their form after a real click
+        page_digest = self._dom_digest(dom_html)
         for idx, apply_method in enumerate(apply_methods, start=1):
+            if followed:
+                break
             if apply_method.selector is None and not apply_method.label:
                 continue
             try:
@@ -91,12 +246,23 @@ class ApplicationNavigatorAgent:
                     apply_method.label or apply_method.selector,
                     apply_method.selector,
                 )
+                controls_before = await self._count_controls(session)
                 await session.click(selector=apply_method.selector, text=apply_method.label)
                 apply_method.clicked = True
-                await asyncio.sleep(2)
+                await self._wait_for_new_controls(session, controls_before)
                 dom_after_click = await session.get_dom()
-                self._write_snapshot(job_name, idx, dom_after_click)
-                new_fields = self._extract_fields(dom_after_click, step_index=idx)
+                digest = self._dom_digest(dom_after_click)
+                if digest == page_digest:
+                    logger.info(
+                        "Navigator: clicking '%s' left the DOM unchanged",
+                        apply_method.label or apply_method.selector,
+                    )
+                    continue
+                page_digest = digest
+                snapshot_writes.append(self._write_snapshot_later(job_name, idx, dom_after_click))
+                new_fields = self._unseen_fields(
+                    self._extract_fields(self._parse(dom_after_click), step_index=idx), seen_fields
+                )
                 if new_fields:
                     logger.info(
                         "Navigator: found %d new fields after clicking '%s'",
@@ -121,6 +287,8 @@ class ApplicationNavigatorAgent:
                 )
                 continue
 
+        dom_path = (await asyncio.gather(*snapshot_writes))[0]
+        logger.info("Navigator: captured initial DOM snapshot at %s", dom_path)
         navigator_result = NavigatorResult(
             job_url=context.job_url,
             job_name=job_name,
@@ -133,21 +301,109 @@ class ApplicationNavigatorAgent:
         return navigator_result
 
     # -------------------- helpers --------------------
+    def _link_targets(self, job_url: str, apply_methods: List[ApplyMethod]) -> Dict[int, str]:
+        """Map apply-method step index to the distinct page URL each link leads to."""
+        targets: Dict[int, str] = {}
+        seen = {urldefrag(job_url).url}
+        for idx, apply_method in enumerate(apply_methods, start=1):
+            href = (apply_method.href or "").strip()
+            if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
+                continue
+            url = urldefrag(urljoin(job_url, href)).url
+            if url.startswith(("http://", "https://")) and url not in seen:
+                seen.add(url)
+                targets[idx] = url
+        return targets
+
+    async def _follow_apply_links(
+        self,
+        session: PlaywrightSession,
+        link_targets: Dict[int, str],
+        job_name: str,
+        fields: List[FieldDescriptor],
+        seen_fields: Set[Tuple],
+        snapshot_writes: List[asyncio.Task],
+    ) -> bool:
+        """Load every apply link in parallel pages and keep the first that shows a form.
+
+        The main page is then sent to that URL so later agents fill the form
+        there. Returns whether any link led to new fields; when none did, the
+        caller falls back to clicking each apply method in turn.
+        """
+        sem = asyncio.Semaphore(MAX_PARALLEL_PAGES)
+
+        async def capture(url: str) -> str | None:
+            async with sem:
+                try:
+                    return await session.fetch_dom(
+                        url, wait_for=FORM_CONTROL_SELECTOR, wait_timeout=LINK_FORM_TIMEOUT
+                    )
+                except PlaywrightClientError as exc:
+                    logger.warning("Navigator: could not load apply link %s (%s)", url, exc)
+                    return None
+
+        doms = await asyncio.gather(*(capture(url) for url in link_targets.values()))
+        for (idx, url), dom_html in zip(link_targets.items(), doms):
+            if dom_html is None:
+                continue
+            snapshot_writes.append(self._write_snapshot_later(job_name, idx, dom_html))
+            new_fields = self._unseen_fields(self._extract_fields(self._parse(dom_html), step_index=idx), seen_fields)
+            if not new_fields:
+                continue
+            logger.info("Navigator: found %d new fields behind apply link %s", len(new_fields), url)
+            fields.extend(new_fields)
+            try:
+                await session.goto(url, wait_until="domcontentloaded")
+            except PlaywrightClientError as exc:
+                logger.warning("Navigator: could not open apply link %s in main page (%s)", url, exc)
+            return True
+        return False
+
+    @staticmethod
+    def _dom_digest(dom_html: str) -> bytes:
+        # Far cheaper than re-parsing a DOM that a no-op click left untouched.
+        return hashlib.blake2b(dom_html.encode("utf-8"), digest_size=8).digest()
+
+    @staticmethod
+    def _field_fingerprint(field: FieldDescriptor) -> Tuple:
+        return field.selector, field.name_attr, field.input_type, field.label
+
+    def _unseen_fields(self, new_fields: List[FieldDescriptor], seen_fields: Set[Tuple]) -> List[FieldDescriptor]:
+        """Drop fields already found on an earlier step, recording the rest as seen."""
+        unseen: List[FieldDescriptor] = []
+        for field in new_fields:
+            fingerprint = self._field_fingerprint(field)
+            if fingerprint not in seen_fields:
+                seen_fields.add(fingerprint)
+                unseen.append(field)
+        return unseen
+
+    def _write_snapshot_later(self, job_name: str, step_index: int, dom_html: str) -> asyncio.Task:
+        return asyncio.create_task(asyncio.to_thread(self._write_snapshot, job_name, step_index, dom_html))
+
     def _write_snapshot(self, job_name: str, step_index: int, dom_html: str) -> Path:
-        path = self.snapshot_dir / f"{job_name}_step{step_index}.html"
-        path.write_text(dom_html)
+        data = dom_html.encode("utf-8")
+        if zstandard is None:
+            path = self.snapshot_dir / f"{job_name}_step{step_index}.html"
+        else:
+            # Compressors are not thread-safe and snapshots are written from worker threads.
+            path = self.snapshot_dir / f"{job_name}_step{step_index}.html.zst"
+            data = zstandard.ZstdCompressor(level=SNAPSHOT_ZSTD_LEVEL).compress(data)
+        path.write_bytes(data)
         logger.debug("Navigator: wrote DOM snapshot %s", path)
         return path
 
-    def _detect_apply_methods(self, dom_html: str) -> List[ApplyMethod]:
-        soup = BeautifulSoup(dom_html, "html.parser")
+    def _parse(self, dom_html: str) -> ParsedDom:
+        """Parse a snapshot once; every extractor reads the same tree."""
+        return ParsedDom(dom_html, BeautifulSoup(dom_html, HTML_PARSER, parse_only=NAV_STRAINER))
+
+    def _detect_apply_methods(self, dom: ParsedDom) -> List[ApplyMethod]:
         methods: List[ApplyMethod] = []
-        for element in soup.find_all(["button", "a"]):
+        for element in dom.soup.find_all(["button", "a"]):
             label = self._clean_text(element.get_text())
             if not label:
                 continue
-            lower_label = label.lower()
-            if not any(keyword in lower_label for keyword in APPLY_KEYWORDS):
+            if not APPLY_RE.search(label):
                 continue
             selector = self._build_selector(element)
             methods.append(
@@ -156,7 +412,7 @@ class ApplicationNavigatorAgent:
                     selector=selector,
                     element_type=element.name,
                     href=element.get("href"),
-                    confidence=0.9 if "apply" in lower_label else 0.6,
+                    confidence=0.9 if "apply" in label.lower() else 0.6,
                 )
             )
         return methods
@@ -175,75 +431,167 @@ class ApplicationNavigatorAgent:
             except PlaywrightClientError:
                 continue
 
-        # Fall back to text-based buttons.
-        for text in COOKIE_ACCEPT_TEXTS:
+        # Fall back to text-based buttons. One regex scan rules out pages with no
+        # accept text at all; otherwise try the texts in priority order.
+        try:
+            dom = await session.get_dom()
+        except PlaywrightClientError:
+            return
+        if not COOKIE_ACCEPT_RE.search(dom):
+            return
+        for pattern in COOKIE_ACCEPT_PATTERNS:
             try:
-                await session.click(text=text)
-                logger.info("Navigator: dismissed blocking UI via text '%s'", text)
-                await asyncio.sleep(0.3)
-                return
+                label = await session.click_first_matching(COOKIE_BUTTON_SELECTOR, pattern)
             except PlaywrightClientError:
                 continue
+            if label is not None:
+                logger.info("Navigator: dismissed blocking UI via text '%s'", label.strip())
+                await asyncio.sleep(0.3)
+                return
 
     async def _wait_for_primary_content(self, session: PlaywrightSession) -> None:
         """Wait for core apply content so that DOM snapshots include real forms."""
 
-        for selector in CONTENT_READY_SELECTORS:
-            try:
-                await session.wait_for_selector(selector, timeout=5)
-                logger.info("Navigator: detected primary content via %s", selector)
+        # A selector list resolves as soon as any of them appears.
+        selector = ", ".join(CONTENT_READY_SELECTORS)
+        try:
+            await session.wait_for_selector(selector, timeout=5)
+            logger.info("Navigator: detected primary content via %s", selector)
+        except PlaywrightClientError:
+            logger.info("Navigator: primary content selectors not found; continuing with raw DOM")
+
+    async def _count_controls(self, session: PlaywrightSession) -> int:
+        try:
+            return await session.count(FORM_CONTROL_SELECTOR)
+        except PlaywrightClientError:
+            return 0
+
+    async def _wait_for_new_controls(self, session: PlaywrightSession, controls_before: int) -> None:
+        """Return as soon as a click has revealed more form controls, or after the last backoff."""
+        for delay in CLICK_SETTLE_DELAYS:
+            await asyncio.sleep(delay)
+            if await self._count_controls(session) > controls_before:
                 return
-            except PlaywrightClientError:
-                continue
-        logger.info("Navigator: primary content selectors not found; continuing with raw DOM")
 
-    def _extract_fields(self, dom_html: str, step_index: int) -> List[FieldDescriptor]:
-        soup = BeautifulSoup(dom_html, "html.parser")
+    def _scan_controls(self, dom: ParsedDom) -> List[Tuple[Tag, int, _Ancestors]]:
+        """Walk the tree once, pairing each form control with its enclosing tags.
+
+        Each tag's ancestor context is derived from its parent's on the way
+        down, so no label lookup has to climb the tree again. Forms marked
+        ``role="search"`` or holding nothing but search/hidden/button inputs
+        are skipped; controls outside any ``<form>`` only count when no form
+        has a real candidate.
+        """
+        contexts: Dict[int, _Ancestors] = {}
+        controls: List[Tuple[Tag, _Ancestors]] = []
+        search_forms: Set[int] = set()
+        candidate_forms: Set[int] = set()
+        form_count = 0
+        # Most ATSes use neither; a substring test on the raw HTML saves two checks per tag.
+        check_questions = "data-question" in dom.html
+        check_hints = CONTAINER_HINT_CLASS in dom.html
+        for tag in dom.soup.find_all(True):
+            ancestors = contexts.get(id(tag.parent), _NO_ANCESTORS)
+            name = tag.name
+            if name in FIELD_TAGS:
+                controls.append((tag, ancestors))
+                if ancestors.form is not None and (
+                    name != "input" or (tag.get("type") or "").lower() not in NON_CANDIDATE_INPUT_TYPES
+                ):
+                    candidate_forms.add(ancestors.form)
+            if name == "form":
+                if (tag.get("role") or "").lower() == "search":
+                    search_forms.add(form_count)
+                ancestors = ancestors._replace(form=form_count)
+                form_count += 1
+            elif name == "label":
+                ancestors = ancestors._replace(label=tag)
+                target = tag.get("for")
+                if target:
+                    dom.label_for.setdefault(target, tag)
+            elif name == "fieldset":
+                ancestors = ancestors._replace(fieldset=tag)
+            elif name in HEADING_TAGS:
+                ancestors = ancestors._replace(heading=tag)
+            if check_questions and tag.has_attr("data-question"):
+                ancestors = ancestors._replace(question=tag.get("data-question"))
+            if check_hints and _has_hint_class(tag):
+                # Worked out once per container rather than once per field inside it.
+                ancestors = ancestors._replace(hint=self._container_hint(tag))
+            contexts[id(tag)] = ancestors
+        candidate_forms -= search_forms
+        if candidate_forms:
+            return [
+                (element, ancestors.form, ancestors)
+                for element, ancestors in controls
+                if ancestors.form in candidate_forms
+            ]
+        return [(element, 0, ancestors) for element, ancestors in controls if ancestors.form is None]
+
+    def _extract_fields(self, dom: ParsedDom, step_index: int) -> List[FieldDescriptor]:
         fields: List[FieldDescriptor] = []
-        forms = soup.find_all("form") or [soup]
-        radio_groups: Dict[str, List[Tuple]] = defaultdict(list)
-        for form_idx, form in enumerate(forms):
-            candidates = form.find_all(["input", "textarea", "select"])
-            for element in candidates:
-                input_type = (element.get("type") or "").lower()
-                if input_type in {"hidden", "submit", "button"}:
-                    continue
-                if element.name == "input" and input_type == "radio":
-                    group_key = element.get("name") or element.get("id") or f"radio-{uuid4()}"
-                    radio_groups[group_key].append((element, form_idx, step_index))
-                    continue
-                field = self._build_field_descriptor(
-                    soup=soup,
-                    element=element,
-                    form_idx=form_idx,
-                    step_index=step_index,
-                )
-                fields.append(field)
+        # Radios are grouped by name; a group's form is the one its first radio sits in.
+        radio_groups: Dict[str, List[Tuple[Tag, _Ancestors]]] = {}
+        radio_forms: Dict[str, int] = {}
+        unnamed_radios = itertools.count()
+        for element, form_idx, ancestors in self._scan_controls(dom):
+            input_type = (element.get("type") or "").lower()
+            if input_type in {"hidden", "submit", "button"}:
+                continue
+            if element.name == "input" and input_type == "radio":
+                group_key = element.get("name") or element.get("id") or f"__radio_{next(unnamed_radios)}"
+                if group_key not in radio_groups:
+                    radio_groups[group_key] = []
+                    radio_forms[group_key] = form_idx
+                radio_groups[group_key].append((element, ancestors))
+                continue
+            field = self._build_field_descriptor(
+                dom=dom,
+                element=element,
+                ancestors=ancestors,
+                form_idx=form_idx,
+                step_index=step_index,
+            )
+            fields.append(field)
 
         for group_key, group_entries in radio_groups.items():
-            radio_field = self._build_radio_descriptor(group_key, group_entries, soup)
+            radio_field = self._build_radio_descriptor(
+                dom, group_key, group_entries, form_idx=radio_forms[group_key], step_index=step_index
+            )
             if radio_field:
                 fields.append(radio_field)
         return fields
 
-    def _build_field_descriptor(self, soup, element, form_idx: int, step_index: int) -> FieldDescriptor:
+    def _build_field_descriptor(
+        self,
+        dom: ParsedDom,
+        element,
+        ancestors: _Ancestors,
+        form_idx: int,
+        step_index: int,
+    ) -> FieldDescriptor:
         field_id = (
             element.get("name")
             or element.get("id")
             or element.get("data-ui")
             or str(uuid4())
         )
-        label_text = self._normalize_label(self._find_label(soup, element, field_id))
+        label_text = self._find_label(dom, element, field_id, ancestors)
         placeholder = element.get("placeholder")
         question = label_text or placeholder or element.get("aria-label") or ""
         options, option_values = self._extract_options(element)
         input_type = element.name + (f":{element.get('type')}" if element.name == "input" and element.get("type") else "")
         selector = self._build_selector(element)
+        attrs = element.attrs
+        metadata = {"form_index": sys.intern(str(form_idx))}
+        metadata.update((key, attrs[key]) for key in METADATA_ATTRS if attrs.get(key))
+        if "readonly" in attrs:
+            metadata["readonly"] = "true"
         return FieldDescriptor(
             field_id=field_id,
             label=label_text or element.get("aria-label") or placeholder or field_id,
             question=question,
-            input_type=input_type,
+            input_type=sys.intern(input_type),
             step_index=step_index or form_idx,
             required=element.has_attr("required"),
             selector=selector,
@@ -252,38 +600,34 @@ class ApplicationNavigatorAgent:
             options=options,
             option_values=option_values,
             option_selectors={},
-            metadata={
-                "form_index": str(form_idx),
-                "aria-label": element.get("aria-label", ""),
-                "aria-haspopup": element.get("aria-haspopup", ""),
-                "aria-controls": element.get("aria-controls", ""),
-                "aria-owns": element.get("aria-owns", ""),
-                "aria-autocomplete": element.get("aria-autocomplete", ""),
-                "data-question": element.get("data-question", ""),
-                "data-ui": element.get("data-ui", ""),
-                "data-input-type": element.get("data-input-type", ""),
-                "role": element.get("role", ""),
-                "readonly": "true" if element.has_attr("readonly") else "",
-            },
+            metadata=metadata,
         )
 
-    def _build_radio_descriptor(self, group_key: str, entries: List[Tuple], soup) -> FieldDescriptor | None:
+    def _build_radio_descriptor(
+        self,
+        dom: ParsedDom,
+        group_key: str,
+        entries: List[Tuple[Tag, _Ancestors]],
+        *,
+        form_idx: int,
+        step_index: int,
+    ) -> FieldDescriptor | None:
         if not entries:
             return None
-        first_element, form_idx, step_index = entries[0]
-        question = self._normalize_label(
-            self._find_group_label(soup, first_element)
-            or self._aria_reference_text(soup, first_element)
-            or self._find_container_hint(first_element)
+        first_element, first_ancestors = entries[0]
+        question = (
+            self._find_group_label(dom, first_ancestors)
+            or self._aria_reference_text(dom, first_element)
+            or self._find_container_hint(first_ancestors)
         )
         options: List[str] = []
         option_values: Dict[str, str] = {}
         option_selectors: Dict[str, str] = {}
         required = False
-        for element, _, _ in entries:
-            option_label = self._normalize_label(
-                self._find_label(soup, element, element.get("id") or "")
-            ) or (element.get("value") or "Option")
+        for element, ancestors in entries:
+            option_label = self._find_label(dom, element, element.get("id") or "", ancestors) or (
+                element.get("value") or "Option"
+            )
             selector = self._build_selector(element, prefer_unique=True)
             if not selector:
                 continue
@@ -313,127 +657,121 @@ class ApplicationNavigatorAgent:
             },
         )
 
-    def _find_label(self, soup: BeautifulSoup, element, field_id: str) -> str:
-        aria_label_text = self._aria_reference_text(soup, element)
+    def _find_label(self, dom: ParsedDom, element, field_id: str, ancestors: _Ancestors) -> str:
+        aria_label_text = self._aria_reference_text(dom, element)
         if aria_label_text:
             return aria_label_text
         if field_id:
-            label = soup.find("label", attrs={"for": field_id})
+            label = dom.label_for.get(field_id)
             if label:
                 return self._clean_text(label.get_text())
-        parent_label = element.find_parent("label")
-        if parent_label:
-            return self._clean_text(parent_label.get_text())
-        container_hint = self._find_container_hint(element)
+        if ancestors.label:
+            return self._clean_text(ancestors.label.get_text())
+        container_hint = self._find_container_hint(ancestors)
         if container_hint:
             return container_hint
         return ""
 
-    def _aria_reference_text(self, soup: BeautifulSoup, element) -> str:
+    def _aria_reference_text(self, dom: ParsedDom, element) -> str:
         aria_labelledby = element.get("aria-labelledby")
         if not aria_labelledby:
             return ""
         pieces = []
         for ref in aria_labelledby.split():
-            node = soup.find(id=ref)
+            node = dom.find_id(ref)
             if node:
                 pieces.append(self._clean_text(node.get_text()))
         return " ".join(filter(None, pieces))
 
-    def _find_container_hint(self, element) -> str:
-        def class_matches(tag) -> bool:
-            classes = tag.get("class") or []
-            if isinstance(classes, str):
-                classes = [classes]
-            return any("styles--3aPac" in cls for cls in classes)
-
-        ancestor = element.find_parent(class_matches)
-        if ancestor:
-            strong_nodes = ancestor.find_all("strong")
-            for node in strong_nodes:
-                text = self._clean_text(node.get_text())
-                if text and text != "*":
-                    return text
-            text = self._clean_text(ancestor.get_text())
-            if text:
+    def _container_hint(self, container: Tag) -> str:
+        for node in container.find_all("strong"):
+            text = self._clean_text(node.get_text())
+            if text and text != "*":
                 return text
-        ancestor = element.find_parent(attrs={"data-question": True})
-        if ancestor and ancestor.get("data-question"):
-            return self._clean_text(ancestor.get("data-question"))
+        return self._clean_text(container.get_text())
+
+    def _find_container_hint(self, ancestors: _Ancestors) -> str:
+        if ancestors.hint:
+            return ancestors.hint
+        if ancestors.question:
+            return self._clean_text(ancestors.question)
         return ""
 
-    def _find_group_label(self, soup: BeautifulSoup, element) -> str:
-        fieldset = element.find_parent("fieldset")
+    def _find_group_label(self, dom: ParsedDom, ancestors: _Ancestors) -> str:
+        fieldset = ancestors.fieldset
         if fieldset:
-            aria_label = self._aria_reference_text(soup, fieldset)
+            aria_label = self._aria_reference_text(dom, fieldset)
             if aria_label:
                 return aria_label
             legend = fieldset.find("legend")
             if legend:
                 return self._clean_text(legend.get_text())
-        container = element.find_parent(attrs={"data-question": True})
-        if container and container.get("data-question"):
-            return self._clean_text(container.get("data-question"))
-        parent_heading = element.find_parent(["h1", "h2", "h3", "h4"])
+        if ancestors.question:
+            return self._clean_text(ancestors.question)
+        parent_heading = ancestors.heading
         if parent_heading:
             return self._clean_text(parent_heading.get_text())
         return ""
 
     def _build_selector(self, element, prefer_unique: bool = False) -> str | None:
+        # Read the attribute dict once; each Tag.get goes through extra indirection.
+        attrs = element.attrs
+        name_attr = attrs.get("name")
+        element_id = attrs.get("id")
         if prefer_unique:
-            name_attr = element.get("name")
-            value_attr = element.get("value")
+            value_attr = attrs.get("value")
             if name_attr and value_attr:
-                return f"input[name='{name_attr}'][value='{value_attr}']"
-            element_id = element.get("id")
+                return f"input[name='{_css_string(name_attr)}'][value='{_css_string(value_attr)}']"
             if element_id:
                 return f"#{element_id}"
-        name_attr = element.get("name")
-        if name_attr and not prefer_unique:
-            return f"[name='{name_attr}']"
-        data_ui = element.get("data-ui")
+        elif name_attr:
+            return f"[name='{_css_string(name_attr)}']"
+        data_ui = attrs.get("data-ui")
         if data_ui:
-            return f"[data-ui='{data_ui}']"
-        data_testid = element.get("data-testid")
+            return f"[data-ui='{_css_string(data_ui)}']"
+        data_testid = attrs.get("data-testid")
         if data_testid:
-            return f"[data-testid='{data_testid}']"
-        element_id = element.get("id")
+            return f"[data-testid='{_css_string(data_testid)}']"
         if element_id:
             return f"#{element_id}"
-        aria_labelledby = element.get("aria-labelledby")
+        aria_labelledby = attrs.get("aria-labelledby")
         if aria_labelledby:
             first = aria_labelledby.split()[0]
-            return f"[aria-labelledby~='{first}']"
-        classes = element.get("class")
+            return f"[aria-labelledby~='{_css_string(first)}']"
+        classes = attrs.get("class")
         if classes:
             class_list = classes if isinstance(classes, list) else [classes]
             return "." + ".".join(class_list[:3])
-        placeholder = element.get("placeholder")
+        placeholder = attrs.get("placeholder")
         if placeholder:
-            return f"[placeholder='{placeholder}']"
+            return f"[placeholder='{_css_string(placeholder)}']"
         if name_attr:
-            return f"[name='{name_attr}']"
+            return f"[name='{_css_string(name_attr)}']"
         return None
 
     def _extract_options(self, element) -> Tuple[List[str], Dict[str, str]]:
         if element.name != "select":
             return [], {}
+        raw_options = tuple((option.get_text(), option.get("value")) for option in element.find_all("option"))
+        options, option_values = self._clean_options(raw_options)
+        # Copies, so a caller editing one descriptor cannot corrupt the cached list.
+        return list(options), dict(option_values)
+
+    def _clean_option_pairs(
+        self, raw_options: Tuple[Tuple[str, str | None], ...]
+    ) -> Tuple[Tuple[str, ...], Dict[str, str]]:
         options: List[str] = []
         option_values: Dict[str, str] = {}
-        for option in element.find_all("option"):
-            label = self._clean_text(option.get_text())
+        for text, value in raw_options:
+            label = self._clean_text(text)
             if not label:
                 continue
-            value = option.get("value") or label
             options.append(label)
-            option_values[label] = value
-        return options, option_values
+            option_values[label] = value or label
+        return tuple(options), option_values
 
     def _clean_text(self, text: str | None) -> str:
+        # Every label source goes through here, so nothing downstream re-cleans.
         if not text:
             return ""
-        cleaned = " ".join(text.split())
-        return cleaned.replace("SVGs not supported by this browser.", "").strip()
-
-    def _normalize_label(self, text: str) -> str:
-        return text.replace("SVGs not supported by this browser.", "").strip()
+        return " ".join(text.split()).replace(SVG_FALLBACK_TEXT, "").strip()
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import asyncio
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List
 
-from .context import AnswerRecord, AutoApplyContext, FieldDescriptor, NavigatorResult
+from .context import AnswerRecord, AutoApplyContext, FieldDescriptor, FieldKind, NavigatorResult
 from .playwright_client import PlaywrightSession, PlaywrightClientError
 from .user_input_agent import PendingUserInputError
 from utils.logging import get_logger
@@ -14,8 +15,10 @@ from utils.logging import get_logger
 logger = get_logger(__name__)
 
 SUBMIT_KEYWORDS = ["submit", "finish", "send", "apply", "complete"]
-TRUTHY_VALUES = {"1", "true", "yes", "y"}
-FALSY_VALUES = {"0", "false", "no", "n"}
+SUBMIT_RE = re.compile("|".join(map(re.escape, SUBMIT_KEYWORDS)), re.IGNORECASE)
+SUBMIT_CANDIDATES = "button, a"
+TRUTHY_VALUES = frozenset({"1", "true", "yes", "y"})
+FALSY_VALUES = frozenset({"0", "false", "no", "n"})
 
 
 @dataclass
@@ -61,24 +64,25 @@ class ApplicationSubmitAgent:
         submission_log: List[str] = []
         for field in navigator_result.fields:
             record = context.answers.get(field.field_id)
-            if not record or (not record.answer and not self._is_checkbox(field) and field.required):
+            kind = field.kind
+            if not record or (not record.answer and kind is not FieldKind.CHECKBOX and field.required):
                 raise PendingUserInputError(f"Missing validated answer for required field {field.field_id}")
             if not record or not record.answer:
                 submission_log.append(f"Skipped {field.label}: no answer provided")
                 logger.info("Submit: skipping %s (no answer)", field.label)
                 continue
             try:
-                if self._is_cv_upload(field):
+                if kind is FieldKind.CV_UPLOAD:
                     logger.info("Submit: uploading CV for field %s", field.label)
                     await session.upload_file(field.selector or f"[name='{field.name_attr}']", str(context.cv_path))
                     submission_log.append(f"Uploaded CV for {field.label}")
                     continue
-                if self._is_cover_letter_upload(field):
+                if kind is FieldKind.COVER_LETTER_UPLOAD:
                     logger.info("Submit: uploading cover letter for field %s", field.label)
                     await session.upload_file(field.selector or f"[name='{field.name_attr}']", str(context.cover_letter_path))
                     submission_log.append(f"Uploaded cover letter for {field.label}")
                     continue
-                if self._is_checkbox(field):
+                if kind is FieldKind.CHECKBOX:
                     selector = self._resolve_selector(field)
                     if not selector:
                         submission_log.append(f"Skipped {field.label}: missing selector for checkbox")
@@ -88,7 +92,7 @@ class ApplicationSubmitAgent:
                     await session.set_checkbox(selector, checked)
                     submission_log.append(f"Set checkbox {field.label}={'ON' if checked else 'OFF'}")
                     continue
-                if self._is_radio(field):
+                if kind is FieldKind.RADIO:
                     selector = self._resolve_option_selector(field, record.answer)
                     if not selector:
                         submission_log.append(f"Skipped {field.label}: option '{record.answer}' not found")
@@ -97,7 +101,7 @@ class ApplicationSubmitAgent:
                     await session.click(selector=selector)
                     submission_log.append(f"Selected {field.label}: {record.answer}")
                     continue
-                if self._is_select(field):
+                if kind is FieldKind.SELECT:
                     selector = self._resolve_selector(field)
                     if not selector:
                         submission_log.append(f"Skipped {field.label}: missing selector for select")
@@ -107,7 +111,7 @@ class ApplicationSubmitAgent:
                     await session.select_option(selector, value=option_value, label=None if option_value else record.answer)
                     submission_log.append(f"Selected option for {field.label}: {record.answer}")
                     continue
-                if self._is_combobox(field):
+                if kind is FieldKind.COMBOBOX:
                     selector = self._resolve_selector(field)
                     if not selector:
                         submission_log.append(f"Skipped {field.label}: missing selector for combobox")
@@ -153,76 +157,23 @@ class ApplicationSubmitAgent:
 
     async def _click_submit(self, session: PlaywrightSession, submission_log: List[str]) -> None:
         try:
-            dom = await session.get_dom()
+            clicked = await session.click_first_matching(SUBMIT_CANDIDATES, SUBMIT_RE)
         except PlaywrightClientError:
-            submission_log.append("Could not retrieve DOM before submit")
-            logger.warning("Submit: unable to read DOM prior to submit click")
+            submission_log.append("Could not query the page for a submit button")
+            logger.warning("Submit: unable to query submit buttons")
+            return
+        if clicked is not None:
+            submission_log.append(f"Clicked submit button: {clicked.strip()}")
+            logger.info("Submit: clicked submit button '%s'", clicked.strip())
             return
-        from bs4 import BeautifulSoup  # local import to avoid global dependency cost
-
-        soup = BeautifulSoup(dom, "html.parser")
-        for button in soup.find_all(["button", "a"]):
-            text = " ".join((button.get_text() or "").split()).lower()
-            if any(keyword in text for keyword in SUBMIT_KEYWORDS):
-                selector = self._build_selector(button)
-                try:
-                    await session.click(selector=selector, text=button.get_text())
-                    submission_log.append(f"Clicked submit button: {button.get_text().strip()}")
-                    logger.info("Submit: clicked submit button '%s'", button.get_text().strip())
-                    return
-                except Exception:  # pragma: no cover - runtime integration
-                    continue
         submission_log.append("No submit button detected; manual review may be required")
         logger.warning("Submit: no submit button detected in DOM")
 
-    def _build_selector(self, element) -> str | None:
-        element_id = element.get("id")
-        if element_id:
-            return f"#{element_id}"
-        classes = element.get("class")
-        if classes:
-            return "." + ".".join(classes[:3])
-        return None
-
-    def _is_cv_upload(self, field: FieldDescriptor) -> bool:
-        if "file" in field.input_type:
-            return True
-        label = field.label.lower()
-        return any(keyword in label for keyword in ["cv", "résumé", "resume", "curriculum"]) or "upload" in label
-
-    def _is_cover_letter_upload(self, field: FieldDescriptor) -> bool:
-        label = field.label.lower()
-        return "file" in field.input_type and "cover letter" in label
-
-    def _is_checkbox(self, field: FieldDescriptor) -> bool:
-        return "checkbox" in (field.input_type or "")
-
-    def _is_radio(self, field: FieldDescriptor) -> bool:
-        return "radio" in (field.input_type or "")
-
-    def _is_select(self, field: FieldDescriptor) -> bool:
-        input_type = field.input_type or ""
-        return input_type.startswith("select")
-
-    def _is_combobox(self, field: FieldDescriptor) -> bool:
-        metadata = field.metadata or {}
-        role = metadata.get("role", "").lower()
-        aria_has_popup = metadata.get("aria-haspopup", "").lower()
-        readonly = metadata.get("readonly", "").lower()
-        data_input_type = metadata.get("data-input-type", "").lower()
-        if role == "combobox" or aria_has_popup == "listbox":
-            return True
-        if data_input_type == "select" and "input" in (field.input_type or ""):
-            return True
-        if readonly in {"true", "1", "yes"} and "input" in (field.input_type or "") and metadata.get("aria-controls"):
-            return True
-        return False
-
     def _has_valid_answer(self, context: AutoApplyContext, field: FieldDescriptor) -> bool:
         record = context.answers.get(field.field_id)
         if not record:
             return False
-        if self._is_checkbox(field):
+        if field.kind is FieldKind.CHECKBOX:
             return True  # unchecked allowed as False
         return bool(record.answer)
 
@@ -1,12 +1,16 @@
 """Shared dataclasses and helpers for the auto-apply multi-agent stack."""
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional
 
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+CV_UPLOAD_RE = re.compile(r"cv|résumé|resume|curriculum|upload", re.IGNORECASE)
+READONLY_VALUES = frozenset({"true", "1", "yes"})
 
 
 @dataclass(slots=True)
@@ -22,6 +26,48 @@ class ApplyMethod:
     notes: str | None = None
 
 
+class FieldKind(Enum):
+    """How the submit agent fills a field."""
+
+    TEXT = "text"
+    CHECKBOX = "checkbox"
+    RADIO = "radio"
+    SELECT = "select"
+    COMBOBOX = "combobox"
+    CV_UPLOAD = "cv_upload"
+    COVER_LETTER_UPLOAD = "cover_letter_upload"
+
+
+def _is_combobox(input_type: str, metadata: Dict[str, str]) -> bool:
+    if metadata.get("role", "").lower() == "combobox" or metadata.get("aria-haspopup", "").lower() == "listbox":
+        return True
+    if "input" not in input_type:
+        return False
+    if metadata.get("data-input-type", "").lower() == "select":
+        return True
+    return metadata.get("readonly", "").lower() in READONLY_VALUES and bool(metadata.get("aria-controls"))
+
+
+def classify_field(input_type: str, label: str, metadata: Dict[str, str]) -> FieldKind:
+    """File inputs first, then the control type, then CV-sounding labels on anything else."""
+    input_type = input_type or ""
+    if "file" in input_type:
+        if "cover letter" in label.lower():
+            return FieldKind.COVER_LETTER_UPLOAD
+        return FieldKind.CV_UPLOAD
+    if "checkbox" in input_type:
+        return FieldKind.CHECKBOX
+    if "radio" in input_type:
+        return FieldKind.RADIO
+    if input_type.startswith("select"):
+        return FieldKind.SELECT
+    if _is_combobox(input_type, metadata or {}):
+        return FieldKind.COMBOBOX
+    if CV_UPLOAD_RE.search(label):
+        return FieldKind.CV_UPLOAD
+    return FieldKind.TEXT
+
+
 @dataclass(slots=True)
 class FieldDescriptor:
     """Normalized form field description used across agents."""
@@ -39,6 +85,11 @@ class FieldDescriptor:
     option_values: Dict[str, str] = field(default_factory=dict)
     option_selectors: Dict[str, str] = field(default_factory=dict)
     metadata: Dict[str, str] = field(default_factory=dict)
+    # Worked out once here rather than by string checks on every submission.
+    kind: FieldKind = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.kind = classify_field(self.input_type, self.label, self.metadata)
 
     def to_prompt_dict(self) -> Dict[str, object]:
         return {
@@ -14,12 +14,15 @@ from .application_writer_agent import ApplicationWriterAgent
 from .context import AnswerRecord, AutoApplyContext, FieldDescriptor
 from .failure_writer_agent import FailureWriterAgent
 from .knowledge_base import KnowledgeBase
-from .playwright_client import PlaywrightSession, PlaywrightClientError
+from .playwright_client import PlaywrightSession, PlaywrightSessionConfig, PlaywrightClientError
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 from .user_input_agent import PendingUserInputError, UserInputRequiredAgent
 
+# Session cookies may include logged-in ATS sessions, so they live in the git-ignored cache.
+BROWSER_STATE_PATH = Path(__file__).resolve().parents[2] / "data" / "cache" / "auto_apply_state.json"
+
 
 class AutoApplyOrchestrator:
     """High-level orchestrator for the auto_apply_to_job workflow."""
@@ -28,6 +31,10 @@ class AutoApplyOrchestrator:
         self.base_path = base_path or Path(__file__).resolve().parents[1]
         self.knowledge_base = KnowledgeBase(self.base_path)
         self.navigator = ApplicationNavigatorAgent(self.base_path)
+        # Cookies and consent choices survive between applications instead of starting cold each time.
+        self.session_config = PlaywrightSessionConfig(
+            storage_state_path=BROWSER_STATE_PATH
+        )
         self.answer_agent = AnswerValidityAgent(self.base_path)
         self.user_input_agent = UserInputRequiredAgent(self.base_path)
         self.submit_agent = ApplicationSubmitAgent(self.base_path)
@@ -78,7 +85,7 @@ class AutoApplyOrchestrator:
     async def run_async(self, context: AutoApplyContext, wait_for_user: bool = True) -> Dict[str, object]:
         try:
             logger.info("AutoApply: starting workflow for %s", context.job_url)
-            async with PlaywrightSession() as session:
+            async with PlaywrightSession(self.session_config) as session:
                 logger.info("AutoApply: Step 1/4 navigator running")
                 navigator_result = await self.navigator.run_async(context, session)
                 if not navigator_result.has_apply_flow:
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Pattern
 
 from playwright.async_api import (  # type: ignore[import]
     Error as PlaywrightError,
@@ -11,6 +12,10 @@ from playwright.async_api import (  # type: ignore[import]
     async_playwright,
 )
 
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
 
 class PlaywrightClientError(RuntimeError):
     """Raised when a Playwright browser interaction fails."""
@@ -23,6 +28,8 @@ class PlaywrightSessionConfig:
     navigation_timeout_ms: int = 90_000
     action_timeout_ms: int = 20_000
     slow_mo: Optional[int] = None
+    # Cookies/local storage carried from one session to the next; None keeps every session fresh.
+    storage_state_path: Optional[Path] = None
 
 
 class PlaywrightSession:
@@ -33,6 +40,7 @@ class PlaywrightSession:
         self._playwright = None
         self._browser = None
         self._context = None
+        self._warmed = False
         self.page = None
 
     async def __aenter__(self) -> "PlaywrightSession":
@@ -42,7 +50,9 @@ class PlaywrightSession:
             headless=self.config.headless,
             slow_mo=self.config.slow_mo,
         )
-        self._context = await self._browser.new_context()
+        state_path = self.config.storage_state_path
+        storage_state = str(state_path) if state_path and state_path.exists() else None
+        self._context = await self._browser.new_context(storage_state=storage_state)
         self.page = await self._context.new_page()
         self.page.set_default_navigation_timeout(self.config.navigation_timeout_ms)
         self.page.set_default_timeout(self.config.action_timeout_ms)
@@ -51,6 +61,17 @@ class PlaywrightSession:
     async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - cleanup path
         await self._close()
 
+    async def warmup(self) -> None:
+        """Load ``about:blank`` once so the renderer is up before the first real navigation."""
+        await self._ensure_page()
+        if self._warmed:
+            return
+        try:
+            await self.page.goto("about:blank")
+        except PlaywrightError as exc:  # pragma: no cover - runtime interaction
+            raise PlaywrightClientError(f"Warmup failed: {exc}") from exc
+        self._warmed = True
+
     async def goto(self, url: str, wait_until: str = "networkidle") -> None:
         await self._ensure_page()
         try:
@@ -58,6 +79,35 @@ class PlaywrightSession:
         except (PlaywrightTimeoutError, PlaywrightError) as exc:  # pragma: no cover - network dependent
             raise PlaywrightClientError(f"Navigation failed for {url}: {exc}") from exc
 
+    async def fetch_dom(
+        self,
+        url: str,
+        wait_until: str = "domcontentloaded",
+        wait_for: str | None = None,
+        wait_timeout: float = 5,
+    ) -> str:
+        """Load ``url`` in a throwaway page of the same context and return its DOM.
+
+        Lets callers look at several pages at once without moving :attr:`page`.
+        When ``wait_for`` is given, waits up to ``wait_timeout`` seconds for a
+        matching element so client-rendered content lands in the DOM; the page
+        is returned as-is if it never appears.
+        """
+        await self._ensure_page()
+        page = await self._context.new_page()
+        try:
+            await page.goto(url, wait_until=wait_until)
+            if wait_for:
+                try:
+                    await page.wait_for_selector(wait_for, timeout=int(wait_timeout * 1000))
+                except PlaywrightTimeoutError:
+                    logger.debug("No %s on %s after %.1fs", wait_for, url, wait_timeout)
+            return await page.content()
+        except (PlaywrightTimeoutError, PlaywrightError) as exc:  # pragma: no cover - network dependent
+            raise PlaywrightClientError(f"Unable to load {url}: {exc}") from exc
+        finally:
+            await page.close()
+
     async def get_dom(self) -> str:
         await self._ensure_page()
         try:
@@ -65,7 +115,7 @@ class PlaywrightSession:
         except PlaywrightError as exc:  # pragma: no cover - network dependent
             raise PlaywrightClientError(f"Unable to read DOM: {exc}") from exc
 
-    async def click(self, selector: str | None = None, text: str | None = None) -> None:
+    async def click(self, selector: str | None = None, text: str | Pattern[str] | None = None) -> None:
         await self._ensure_page()
         if not selector and not text:
             raise ValueError("Provide selector or text to click")
@@ -83,6 +133,29 @@ class PlaywrightSession:
         except PlaywrightError as exc:  # pragma: no cover - runtime interaction
             raise PlaywrightClientError(f"Click failed for selector={selector} text={text}: {exc}") from exc
 
+    async def click_first_matching(self, selector: str, text: Pattern[str]) -> str | None:
+        """Click the first element matching ``selector`` whose text matches ``text``.
+
+        Candidates are filtered by the browser's selector engine and tried in
+        document order; one that cannot be clicked is skipped. Returns the
+        clicked element's text, or ``None`` when nothing could be clicked.
+        """
+        await self._ensure_page()
+        try:
+            candidates = self.page.locator(selector).filter(has_text=text)
+            total = await candidates.count()
+        except PlaywrightError as exc:  # pragma: no cover - runtime interaction
+            raise PlaywrightClientError(f"Query failed for {selector}: {exc}") from exc
+        for index in range(total):
+            candidate = candidates.nth(index)
+            try:
+                label = await candidate.inner_text()
+                await candidate.click()
+                return label
+            except PlaywrightError:  # pragma: no cover - runtime interaction
+                continue
+        return None
+
     async def fill(self, selector: str, value: str) -> None:
         await self._ensure_page()
         try:
@@ -165,6 +238,14 @@ class PlaywrightSession:
         except PlaywrightTimeoutError as exc:
             raise PlaywrightClientError(f"Timeout waiting for selector {selector}") from exc
 
+    async def count(self, selector: str) -> int:
+        """Number of elements currently matching ``selector``; does not wait."""
+        await self._ensure_page()
+        try:
+            return await self.page.locator(selector).count()
+        except PlaywrightError as exc:  # pragma: no cover - runtime interaction
+            raise PlaywrightClientError(f"Count failed for {selector}: {exc}") from exc
+
     async def upload_file(self, selector: str, file_path: str) -> None:
         await self._ensure_page()
         try:
@@ -179,6 +260,13 @@ class PlaywrightSession:
     async def _close(self) -> None:
         if self.page:
             await self.page.close()
+        state_path = self.config.storage_state_path
+        if self._context and state_path:
+            try:
+                state_path.parent.mkdir(parents=True, exist_ok=True)
+                await self._context.storage_state(path=str(state_path))
+            except PlaywrightError as exc:  # the next session just starts without cookies
+                logger.warning("Could not save browser state to %s: %s", state_path, exc)
         if self._context:
             await self._context.close()
         if self._browser:
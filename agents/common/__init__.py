@@ -1,5 +1,6 @@
 """Common/shared agents - utilities used across the pipeline."""
 
+from .agent_base import AgentBase
 from .gemini_client import GeminiClient, GeminiConfig
 from .profile_agent import ProfileAgent
 from .orchestrator_agent import OrchestratorAgent
@@ -8,6 +9,7 @@ from .role_analysis_agent import RoleAnalysisAgent
 from .csv_writer_agent import CSVWriterAgent
 
 __all__ = [
+    "AgentBase",
     "GeminiClient",
     "GeminiConfig",
     "ProfileAgent",
@@ -0,0 +1,63 @@
+"""Shared base for agents that read the candidate profile and write to data/output."""
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+BASE_PATH = Path(__file__).resolve().parents[2]
+OUTPUT_DIR = BASE_PATH / "data" / "output"
+PROFILE_PATH = BASE_PATH / "data" / "profile.md"
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@lru_cache(maxsize=16)
+def _read_text(path: Path, mtime_ns: Optional[int]) -> Optional[str]:
+    return None if mtime_ns is None else path.read_text()
+
+
+def read_cached_text(path: Path) -> Optional[str]:
+    """Return the text of ``path``, or ``None`` when it is missing.
+
+    Reads are cached on the file's mtime, so a long-lived process picks up
+    edits (and a file created after a miss) for the price of one ``stat``.
+    """
+    try:
+        mtime_ns: Optional[int] = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _read_text(path, mtime_ns)
+
+
+class AgentBase:
+    """Resolves project paths once and shares the profile text between agents.
+
+    Agents built against the default project root reuse the module-level
+    paths instead of walking ``__file__`` on every construction, the output
+    directory is created at most once per process, and the profile is read
+    once per path and version no matter how many agents are instantiated.
+    """
+
+    def __init__(self, base_path: Path | None = None) -> None:
+        if base_path is None:
+            self.base_path = BASE_PATH
+            self.output_dir = OUTPUT_DIR
+            self.profile_file = PROFILE_PATH
+        else:
+            self.base_path = base_path
+            self.output_dir = base_path / "data" / "output"
+            self.profile_file = base_path / "data" / "profile.md"
+        _ensure_dir(self.output_dir)
+
+    @classmethod
+    def get_profile(cls, profile_file: Path = PROFILE_PATH) -> Optional[str]:
+        """Return the cached profile text, or ``None`` when the file is missing."""
+        return read_cached_text(profile_file)
+
+
+__all__ = ["AgentBase", "BASE_PATH", "OUTPUT_DIR", "PROFILE_PATH", "read_cached_text"]
@@ -3,7 +3,10 @@ from __future__ import annotations
 
 import csv
 from pathlib import Path
-from typing import Dict
+from typing import Iterable, Tuple
+
+HEADER = ["Company", "Role", "ForMeScore", "ForThemScore", "Insight"]
+CSVRow = Tuple[str, str, float, float, str]
 
 
 class CSVWriterAgent:
@@ -20,15 +23,22 @@ class CSVWriterAgent:
         for_them_score: float,
         insight: str,
     ) -> str:
+        self.append_rows([(company, role, for_me_score, for_them_score, insight)])
+        return ",".join(
+            [company, role, f"{for_me_score:.2f}", f"{for_them_score:.2f}", insight]
+        )
+
+    def append_rows(self, rows: Iterable[CSVRow]) -> None:
+        """Append many rows with a single open of the CSV file."""
         write_header = not self.output_file.exists()
         with self.output_file.open("a", newline="") as csvfile:
             writer = csv.writer(csvfile)
             if write_header:
-                writer.writerow(["Company", "Role", "ForMeScore", "ForThemScore", "Insight"])
-            writer.writerow([company, role, round(for_me_score, 2), round(for_them_score, 2), insight])
-        return ",".join(
-            [company, role, f"{for_me_score:.2f}", f"{for_them_score:.2f}", insight]
-        )
+                writer.writerow(HEADER)
+            writer.writerows(
+                [company, role, round(for_me_score, 2), round(for_them_score, 2), insight]
+                for company, role, for_me_score, for_them_score, insight in rows
+            )
 
 
 if __name__ == "__main__":
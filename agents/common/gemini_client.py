@@ -1,13 +1,21 @@
 """Shared Gemini 2.5 client helpers for the job application engine."""
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import httpx
+import orjson
 import requests
 
+from agents.common import llm_cache
+from agents.common.rate_limiter import gemini_throttle, retry_delay
+from agents.common.text_utils import strip_code_fence
 from utils.logging import get_logger
 
 try:  # pragma: no cover - mock helper is optional
@@ -19,6 +27,10 @@ except Exception:  # pragma: no cover - fallback when module missing
     def get_mock_response(*_, **__):  # type: ignore
         return None
 
+# Opt every JSON request into the on-disk response cache, so re-running an
+# evaluation over mostly unchanged roles only pays for the new ones.
+RESPONSE_CACHE_ENABLED = os.getenv("GEMINI_CACHE", "").lower() in {"1", "true", "yes"}
+
 
 @dataclass
 class GeminiConfig:
@@ -27,6 +39,13 @@ class GeminiConfig:
     temperature: float = 0.0
     json_mode: bool = False
     mock_bucket: str | None = None
+    # Reuse on-disk responses for identical requests, even at non-zero temperature.
+    cache_responses: bool = False
+    # Request bounds. ``timeout=None`` falls back to GEMINI_TIMEOUT; ``max_output_tokens``
+    # must leave room for thinking tokens on 2.5 models, which count against it.
+    timeout: float | None = None
+    max_retries: int = 3
+    max_output_tokens: int | None = None
 
 
 class GeminiClient:
@@ -34,6 +53,9 @@ class GeminiClient:
 
     BASE_URL = os.getenv("GEMINI_API_BASE", "https://generativelanguage.googleapis.com/v1beta")
     TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT", "30"))
+    # Shared by every client so thread-pooled callers cannot exceed the API's concurrency budget.
+    REQUEST_SLOTS = threading.BoundedSemaphore(int(os.getenv("GEMINI_MAX_CONCURRENT", "32")))
+    RETRYABLE_STATUS = frozenset({429, 500, 503})
 
     def __init__(self, config: GeminiConfig) -> None:
         api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
@@ -43,7 +65,12 @@ class GeminiClient:
             )
         self.api_key = api_key
         self.config = config
+        # Resolve mock mode once; production clients never consult the mock store.
+        self.mock_bucket = config.mock_bucket if mock_enabled() else None
         self.logger = get_logger(__name__)
+        # Pooled connections for the async path, opened on first use in each event loop.
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
     def generate_text(
         self,
@@ -51,8 +78,16 @@ class GeminiClient:
         *,
         temperature: Optional[float] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        cached_content: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
     ) -> str:
-        response_text = self._generate(prompt, temperature=temperature, metadata=metadata)
+        response_text = self._generate(
+            prompt,
+            temperature=temperature,
+            metadata=metadata,
+            cached_content=cached_content,
+            max_output_tokens=max_output_tokens,
+        )
         if not response_text:
             raise RuntimeError("Gemini response had no text content.")
         return response_text
@@ -63,42 +98,280 @@ class GeminiClient:
         *,
         temperature: Optional[float] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        cached_content: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
+        """Return the parsed JSON reply to ``prompt``.
+
+        With ``stream=True`` the reply is read over server-sent events, so the
+        read timeout applies between chunks rather than to the whole
+        generation and progress is logged as the object arrives.
+        """
         response_text = self._generate(
             prompt,
             temperature=temperature,
             response_mime_type="application/json",
             metadata=metadata,
+            cached_content=cached_content,
+            max_output_tokens=max_output_tokens,
+            stream=stream,
         )
         if not response_text:
             raise RuntimeError("Gemini JSON response had no text content.")
         return self._parse_json(response_text)
 
-    def _generate(
+    def stream_text(
         self,
         prompt: str,
         *,
         temperature: Optional[float] = None,
-        response_mime_type: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        cached_content: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """Yield the reply to ``prompt`` chunk by chunk as Gemini generates it.
+
+        Mock and cached replies arrive as a single chunk.
+        """
+        return self._iter_generate(
+            prompt,
+            temperature=temperature,
+            metadata=metadata,
+            cached_content=cached_content,
+            max_output_tokens=max_output_tokens,
+            stream=True,
+        )
+
+    async def agenerate_text(
+        self,
+        prompt: str,
+        *,
+        temperature: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        cached_content: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
     ) -> str:
-        if mock_enabled() and self.config.mock_bucket:
-            mock_value = get_mock_response(
-                self.config.mock_bucket,
-                metadata=metadata or {},
-                prompt=prompt,
+        """Async variant of :meth:`generate_text` on a non-blocking HTTP client."""
+        response_text = await self._agenerate(
+            prompt,
+            temperature=temperature,
+            metadata=metadata,
+            cached_content=cached_content,
+            max_output_tokens=max_output_tokens,
+        )
+        if not response_text:
+            raise RuntimeError("Gemini response had no text content.")
+        return response_text
+
+    async def agenerate_json(
+        self,
+        prompt: str,
+        *,
+        temperature: Optional[float] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        cached_content: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
+        stream: bool = False,
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`generate_json` on a non-blocking HTTP client."""
+        response_text = await self._agenerate(
+            prompt,
+            temperature=temperature,
+            response_mime_type="application/json",
+            metadata=metadata,
+            cached_content=cached_content,
+            max_output_tokens=max_output_tokens,
+            stream=stream,
+        )
+        if not response_text:
+            raise RuntimeError("Gemini JSON response had no text content.")
+        return self._parse_json(response_text)
+
+    def create_cache(self, contents: List[str], *, ttl_seconds: int = 3600) -> Optional[str]:
+        """Upload a shared prompt prefix as Gemini cached content.
+
+        The system instruction travels with the cache, so requests that pass the
+        returned name via ``cached_content`` only need to send their delta.
+        Returns ``None`` in mock mode or when the API refuses the cache (for
+        example because the prefix is below the model's minimum token count);
+        callers should then fall back to inlining the prefix.
+        """
+        if self.mock_bucket:
+            return None
+        payload: Dict[str, Any] = {
+            "model": f"models/{self.config.model}",
+            "contents": [{"role": "user", "parts": [{"text": text}]} for text in contents if text],
+            "ttl": f"{ttl_seconds}s",
+        }
+        if self.config.system_instruction:
+            payload["systemInstruction"] = {
+                "role": "system",
+                "parts": [{"text": self.config.system_instruction}],
+            }
+        try:
+            with self.REQUEST_SLOTS:
+                response = requests.post(
+                    f"{self.BASE_URL}/cachedContents",
+                    params={"key": self.api_key},
+                    json=payload,
+                    timeout=self.TIMEOUT_SECONDS,
+                )
+        except requests.RequestException as exc:
+            self.logger.warning("Gemini context cache request failed: %s", exc)
+            return None
+        if response.status_code >= 400:
+            self.logger.warning(
+                "Gemini context cache not created (%s): %s",
+                response.status_code,
+                response.text[:200],
             )
-            if mock_value is not None:
-                if isinstance(mock_value, (dict, list)):
-                    return json.dumps(mock_value)
-                return str(mock_value)
+            return None
+        return response.json().get("name")
+
+    def _generate(self, prompt: str, *, stream: bool = False, **options: Any) -> str:
+        return "".join(self._iter_generate(prompt, stream=stream, **options)).strip()
+
+    def _iter_generate(
+        self,
+        prompt: str,
+        *,
+        temperature: Optional[float] = None,
+        response_mime_type: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        cached_content: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
+        stream: bool = False,
+    ) -> Iterator[str]:
+        mock_reply = self._mock_reply(prompt, metadata)
+        if mock_reply is not None:
+            yield mock_reply
+            return
 
-        url = f"{self.BASE_URL}/models/{self.config.model}:generateContent"
+        effective_temperature = temperature if temperature is not None else self.config.temperature
+        cache_key = self._response_cache_key(prompt, effective_temperature, response_mime_type, cached_content)
+        if cache_key:
+            cached = llm_cache.lookup(cache_key, bucket=self.config.mock_bucket or "gemini")
+            if cached is not None:
+                yield cached
+                return
+
+        url, payload = self._build_request(
+            prompt,
+            temperature=effective_temperature,
+            response_mime_type=response_mime_type,
+            cached_content=cached_content,
+            max_output_tokens=max_output_tokens,
+            stream=stream,
+        )
+        response = self._post_with_retries(url, payload, prompt, stream=stream)
+        try:
+            self._raise_for_status(response)
+            gemini_throttle.record_success()
+            if stream:
+                pieces: List[str] = []
+                received = 0
+                for line in response.iter_lines(decode_unicode=True):
+                    text = self._sse_text(line)
+                    if not text:
+                        continue
+                    pieces.append(text)
+                    received += len(text)
+                    self.logger.debug("Gemini stream: %d chars received", received)
+                    yield text
+                response_text = "".join(pieces).strip()
+            else:
+                response_text = self._response_text(orjson.loads(response.content))
+                yield response_text
+        finally:
+            response.close()
+        if cache_key and response_text:
+            llm_cache.store(cache_key, response_text, bucket=self.config.mock_bucket or "gemini")
+
+    async def _agenerate(
+        self,
+        prompt: str,
+        *,
+        temperature: Optional[float] = None,
+        response_mime_type: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        cached_content: Optional[str] = None,
+        max_output_tokens: Optional[int] = None,
+        stream: bool = False,
+    ) -> str:
+        mock_reply = self._mock_reply(prompt, metadata)
+        if mock_reply is not None:
+            return mock_reply.strip()
+
+        effective_temperature = temperature if temperature is not None else self.config.temperature
+        cache_key = self._response_cache_key(prompt, effective_temperature, response_mime_type, cached_content)
+        if cache_key:
+            cached = llm_cache.lookup(cache_key, bucket=self.config.mock_bucket or "gemini")
+            if cached is not None:
+                return cached.strip()
+
+        url, payload = self._build_request(
+            prompt,
+            temperature=effective_temperature,
+            response_mime_type=response_mime_type,
+            cached_content=cached_content,
+            max_output_tokens=max_output_tokens,
+            stream=stream,
+        )
+        response_text = await self._apost_with_retries(url, payload, prompt, stream=stream)
+        if cache_key and response_text:
+            llm_cache.store(cache_key, response_text, bucket=self.config.mock_bucket or "gemini")
+        return response_text
+
+    def _mock_reply(self, prompt: str, metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+        if not self.mock_bucket:
+            return None
+        mock_value = get_mock_response(
+            self.mock_bucket,
+            metadata=metadata or {},
+            prompt=prompt,
+        )
+        if mock_value is None:
+            return None
+        return json.dumps(mock_value) if isinstance(mock_value, (dict, list)) else str(mock_value)
+
+    def _response_cache_key(
+        self,
+        prompt: str,
+        temperature: float,
+        response_mime_type: Optional[str],
+        cached_content: Optional[str],
+    ) -> Optional[str]:
+        if not (self.config.cache_responses or (RESPONSE_CACHE_ENABLED and response_mime_type == "application/json")):
+            return None
+        return llm_cache.cache_key(
+            "\n".join(filter(None, (self.config.system_instruction, response_mime_type, cached_content, prompt))),
+            model=self.config.model,
+            temperature=temperature,
+        )
+
+    def _build_request(
+        self,
+        prompt: str,
+        *,
+        temperature: float,
+        response_mime_type: Optional[str],
+        cached_content: Optional[str],
+        max_output_tokens: Optional[int],
+        stream: bool,
+    ) -> Tuple[str, Dict[str, Any]]:
+        if stream:
+            url = f"{self.BASE_URL}/models/{self.config.model}:streamGenerateContent?alt=sse"
+        else:
+            url = f"{self.BASE_URL}/models/{self.config.model}:generateContent"
         generation_config: Dict[str, Any] = {
-            "temperature": temperature if temperature is not None else self.config.temperature,
+            "temperature": temperature,
         }
         if response_mime_type:
             generation_config["responseMimeType"] = response_mime_type
+        output_limit = max_output_tokens or self.config.max_output_tokens
+        if output_limit:
+            generation_config["maxOutputTokens"] = output_limit
 
         payload: Dict[str, Any] = {
             "contents": [
@@ -109,49 +382,171 @@ class GeminiClient:
             ],
             "generationConfig": generation_config,
         }
-        if self.config.system_instruction:
+        if cached_content:
+            payload["cachedContent"] = cached_content
+        elif self.config.system_instruction:
             payload["systemInstruction"] = {
                 "role": "system",
                 "parts": [{"text": self.config.system_instruction}],
             }
+        return url, payload
 
-        params = {"key": self.api_key}
-        response = requests.post(
-            url,
-            params=params,
-            json=payload,
-            timeout=self.TIMEOUT_SECONDS,
+    def _raise_for_status(self, response: requests.Response | httpx.Response) -> None:
+        if response.status_code < 400:
+            return
+        self.logger.error(
+            "Gemini API error %s: %s",
+            response.status_code,
+            response.text,
         )
-        if response.status_code >= 400:
-            self.logger.error(
-                "Gemini API error %s: %s",
-                response.status_code,
-                response.text,
-            )
-            raise RuntimeError(
-                f"Gemini API request failed with status {response.status_code}: {response.text}"
-            )
-        data = response.json()
+        raise RuntimeError(
+            f"Gemini API request failed with status {response.status_code}: {response.text}"
+        )
+
+    @staticmethod
+    def _candidate_texts(data: Dict[str, Any]) -> List[str]:
         candidates = data.get("candidates", [])
         if not candidates:
-            return ""
+            return []
         parts = candidates[0].get("content", {}).get("parts", [])
-        texts = [part.get("text", "") for part in parts if isinstance(part, dict)]
-        return "\n".join(filter(None, texts)).strip()
+        return [part.get("text", "") for part in parts if isinstance(part, dict)]
+
+    @classmethod
+    def _response_text(cls, data: Dict[str, Any]) -> str:
+        return "\n".join(filter(None, cls._candidate_texts(data))).strip()
+
+    @classmethod
+    def _sse_text(cls, line: str) -> str:
+        """Text carried by one ``data:`` line of a ``streamGenerateContent?alt=sse`` reply."""
+        if not line or not line.startswith("data:"):
+            return ""
+        return "".join(cls._candidate_texts(orjson.loads(line[len("data:"):])))
+
+    def _post_with_retries(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        prompt: str,
+        *,
+        stream: bool = False,
+    ) -> requests.Response:
+        """POST with jittered exponential backoff on rate limits, 5xx and timeouts."""
+        params = {"key": self.api_key}
+        timeout = self.config.timeout or self.TIMEOUT_SECONDS
+        attempt = 0
+        while True:
+            out_of_retries = attempt >= self.config.max_retries
+            gemini_throttle.wait_sync(prompt)
+            try:
+                with self.REQUEST_SLOTS:
+                    response = requests.post(url, params=params, json=payload, timeout=timeout, stream=stream)
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                if out_of_retries:
+                    raise
+                delay = retry_delay(attempt)
+                self.logger.warning("Gemini request failed (%s); retrying in %.1fs", exc, delay)
+                time.sleep(delay)
+            else:
+                if response.status_code not in self.RETRYABLE_STATUS or out_of_retries:
+                    return response
+                delay = self._retry_after(response) or retry_delay(attempt)
+                response.close()
+                self.logger.warning("Gemini API returned %s; retrying in %.1fs", response.status_code, delay)
+                if response.status_code == 429:
+                    # The shared bucket pauses every caller, not just this thread.
+                    gemini_throttle.backoff(delay)
+                else:
+                    time.sleep(delay)
+            attempt += 1
+
+    async def _apost_with_retries(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        prompt: str,
+        *,
+        stream: bool = False,
+    ) -> str:
+        """Async counterpart of :meth:`_post_with_retries`; returns the reply text."""
+        params = {"key": self.api_key}
+        client = self._http_client()
+        attempt = 0
+        while True:
+            out_of_retries = attempt >= self.config.max_retries
+            await gemini_throttle.wait(prompt)
+            try:
+                async with client.stream("POST", url, params=params, json=payload) as response:
+                    if response.status_code not in self.RETRYABLE_STATUS or out_of_retries:
+                        if response.status_code >= 400:
+                            await response.aread()
+                            self._raise_for_status(response)
+                        gemini_throttle.record_success()
+                        if stream:
+                            return "".join([self._sse_text(line) async for line in response.aiter_lines()]).strip()
+                        return self._response_text(orjson.loads(await response.aread()))
+                    await response.aread()
+                    delay = self._retry_after(response) or retry_delay(attempt)
+            except httpx.TransportError as exc:
+                if out_of_retries:
+                    raise
+                delay = retry_delay(attempt)
+                self.logger.warning("Gemini request failed (%s); retrying in %.1fs", exc, delay)
+                await asyncio.sleep(delay)
+            else:
+                self.logger.warning("Gemini API returned %s; retrying in %.1fs", response.status_code, delay)
+                if response.status_code == 429:
+                    # The shared bucket pauses every caller, not just this coroutine.
+                    gemini_throttle.backoff(delay)
+                else:
+                    await asyncio.sleep(delay)
+            attempt += 1
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the pooled async client, so requests reuse connections and TLS sessions.
+
+        An ``AsyncClient`` belongs to the event loop it first ran on; a later
+        ``asyncio.run`` gets a fresh one.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(timeout=self.config.timeout or self.TIMEOUT_SECONDS)
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the pooled async connections; the next async request opens new ones."""
+        client, self._async_client = self._async_client, None
+        if client is not None and self._async_client_loop is asyncio.get_running_loop():
+            await client.aclose()
+
+    @staticmethod
+    def _retry_after(response: requests.Response | httpx.Response) -> Optional[float]:
+        """Seconds to wait from ``Retry-After`` or the error's ``RetryInfo.retryDelay``."""
+        header = response.headers.get("Retry-After")
+        if header:
+            try:
+                return float(header)
+            except ValueError:
+                pass
+        try:
+            details = response.json().get("error", {}).get("details", [])
+        except ValueError:
+            return None
+        for detail in details:
+            delay = detail.get("retryDelay") if isinstance(detail, dict) else None
+            if isinstance(delay, str) and delay.endswith("s"):
+                try:
+                    return float(delay[:-1])
+                except ValueError:
+                    continue
+        return None
 
     @staticmethod
     def _parse_json(payload: str) -> Dict[str, Any]:
-        cleaned = payload.strip()
-        if cleaned.startswith("```"):
-            lines = cleaned.splitlines()
-            if lines and lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].startswith("```"):
-                lines = lines[:-1]
-            cleaned = "\n".join(lines).strip()
+        cleaned = strip_code_fence(payload)
         try:
-            return json.loads(cleaned)
-        except json.JSONDecodeError as exc:
+            return orjson.loads(cleaned)
+        except orjson.JSONDecodeError as exc:
             # Log the full payload for debugging
             from utils.logging import get_logger
             logger = get_logger(__name__)
@@ -1,18 +1,49 @@
 """Insight Generator Agent: synthesizes scores via Gemini."""
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
 from typing import Dict
 
+import orjson
+
 try:
     from .gemini_client import GeminiClient, GeminiConfig
 except ImportError:  # pragma: no cover - script execution fallback
     from gemini_client import GeminiClient, GeminiConfig
 
 
+_PROMPT_TEMPLATE = dedent(
+    """
+    Combine the candidate preference score (for_me_output) with the employer-fit score (for_them_output).
+    Produce a concise insight referencing the role/company plus two short bullet-style lists: strengths and risks.
+    Recommendation must be one of ["Apply", "Apply with caution", "Skip"].
+
+    Return ONLY JSON:
+    {{
+      "insight": "one sentence",
+      "strengths": ["..."],
+      "risks": ["..."],
+      "recommendation": "..."
+    }}
+
+    Role JSON:
+    {role_json}
+
+    For-Me Output:
+    {for_me_json}
+
+    For-Them Output:
+    {for_them_json}
+    """
+).strip()
+
+
+def _dumps(value: Dict[str, object]) -> str:
+    return orjson.dumps(value, default=str).decode()
+
+
 @dataclass
 class InsightResult:
     insight: str
@@ -43,38 +74,46 @@ class InsightGeneratorAgent:
         for_me_output: Dict[str, object],
         for_them_output: Dict[str, object],
     ) -> InsightResult:
-        prompt = dedent(
-            f"""
-            Combine the candidate preference score (for_me_output) with the employer-fit score (for_them_output).
-            Produce a concise insight referencing the role/company plus two short bullet-style lists: strengths and risks.
-            Recommendation must be one of ["Apply", "Apply with caution", "Skip"].
-
-            Return ONLY JSON:
-            {{
-              "insight": "one sentence",
-              "strengths": ["..."],
-              "risks": ["..."],
-              "recommendation": "..."
-            }}
-
-            Role JSON:
-            {json.dumps(role_payload, indent=2)}
-
-            For-Me Output:
-            {json.dumps(for_me_output, indent=2)}
-
-            For-Them Output:
-            {json.dumps(for_them_output, indent=2)}
-            """
-        ).strip()
-
         response = self.client.generate_json(
-            prompt,
-            metadata={
-                "role": role_payload.get("role"),
-                "company": role_payload.get("company"),
-            },
+            self._prompt(role_payload, for_me_output, for_them_output),
+            metadata=self._metadata(role_payload),
+        )
+        return self._to_result(response)
+
+    async def asynthesize(
+        self,
+        role_payload: Dict[str, object],
+        for_me_output: Dict[str, object],
+        for_them_output: Dict[str, object],
+    ) -> InsightResult:
+        """Async variant of :meth:`synthesize`."""
+        response = await self.client.agenerate_json(
+            self._prompt(role_payload, for_me_output, for_them_output),
+            metadata=self._metadata(role_payload),
+        )
+        return self._to_result(response)
+
+    @staticmethod
+    def _prompt(
+        role_payload: Dict[str, object],
+        for_me_output: Dict[str, object],
+        for_them_output: Dict[str, object],
+    ) -> str:
+        return _PROMPT_TEMPLATE.format(
+            role_json=_dumps(role_payload),
+            for_me_json=_dumps(for_me_output),
+            for_them_json=_dumps(for_them_output),
         )
+
+    @staticmethod
+    def _metadata(role_payload: Dict[str, object]) -> Dict[str, object]:
+        return {
+            "role": role_payload.get("role"),
+            "company": role_payload.get("company"),
+        }
+
+    @staticmethod
+    def _to_result(response: Dict[str, object]) -> InsightResult:
         narrative = response.get("insight") or "No insight returned"
         strengths = response.get("strengths", [])
         risks = response.get("risks", [])
@@ -0,0 +1,60 @@
+"""Content-addressed on-disk cache for LLM responses.
+
+Responses are stored as ``<cache_dir>/<bucket>/<key[:2]>/<key>.json`` where the
+key is the SHA-256 of model, temperature and prompt, so re-running a pipeline
+over unchanged inputs never re-issues the same request.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = Path(os.getenv("JOB_FINDER_LLM_CACHE_DIR", PROJECT_ROOT / "data" / "cache" / "llm"))
+CACHE_DISABLED = os.getenv("JOB_FINDER_LLM_CACHE", "1") == "0"
+
+
+def cache_key(prompt: str, *, model: str, temperature: float) -> str:
+    return hashlib.sha256(f"{model}|{temperature}|{prompt}".encode("utf-8")).hexdigest()
+
+
+def _cache_path(key: str, bucket: str, cache_dir: Path | None) -> Path:
+    return (cache_dir or CACHE_DIR) / bucket / key[:2] / f"{key}.json"
+
+
+def lookup(key: str, *, bucket: str, cache_dir: Path | None = None) -> Optional[str]:
+    """Return the cached response for ``key`` or ``None`` on a miss."""
+    if CACHE_DISABLED:
+        return None
+    path = _cache_path(key, bucket, cache_dir)
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))["response"]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError):
+        logger.warning("Ignoring unreadable LLM cache entry %s", path)
+        return None
+
+
+def store(key: str, response: str, *, bucket: str, cache_dir: Path | None = None) -> None:
+    if CACHE_DISABLED:
+        return
+    path = _cache_path(key, bucket, cache_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a half-written entry.
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"response": response}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning("Could not write LLM cache entry %s: %s", path, exc)
+
+
+__all__ = ["CACHE_DIR", "cache_key", "lookup", "store"]
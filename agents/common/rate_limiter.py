@@ -0,0 +1,125 @@
+"""Token-bucket throttling for Gemini requests.
+
+Buckets pre-throttle callers so bursts of concurrent work stay under the
+configured requests- and tokens-per-minute budgets instead of tripping 429s.
+A reservation is computed under a plain lock and the wait happens outside
+it, so the same bucket is safe from coroutines and worker threads alike.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Optional
+
+GEMINI_RPM = float(os.getenv("GEMINI_RPM", "300"))
+GEMINI_TPM = float(os.getenv("GEMINI_TPM", "1000000"))
+# Where a 429 carries no retry hint, pause this long before the next request.
+DEFAULT_RETRY_AFTER_SECONDS = 10.0
+MIN_RATE_FRACTION = 0.1
+RETRY_BASE_SECONDS = 1.0
+RETRY_CAP_SECONDS = 30.0
+
+
+def retry_delay(attempt: int) -> float:
+    """Jittered exponential delay before retry number ``attempt + 1``."""
+    ceiling = min(RETRY_CAP_SECONDS, RETRY_BASE_SECONDS * 2 ** attempt)
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+class TokenBucket:
+    """Refills ``rate_per_min`` tokens per minute up to ``burst`` tokens.
+
+    The rate shrinks multiplicatively on :meth:`backoff` and creeps back to
+    the configured ceiling on each :meth:`record_success`.
+    """
+
+    def __init__(self, rate_per_min: float, burst: float | None = None) -> None:
+        self.max_rate = rate_per_min / 60.0
+        self.rate = self.max_rate
+        self.capacity = burst if burst is not None else max(1.0, rate_per_min / 60.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self, amount: float) -> float:
+        """Take ``amount`` tokens now and return how long the caller must wait."""
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire_sync(self, amount: float = 1.0) -> None:
+        delay = self._reserve(amount)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        delay = self._reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def backoff(self, retry_after: Optional[float] = None) -> None:
+        """React to a rate-limit response: pause everyone and halve the rate."""
+        with self._lock:
+            pause = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER_SECONDS
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self.rate = max(self.rate / 2, self.max_rate * MIN_RATE_FRACTION)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate * 1.05)
+
+    def __enter__(self) -> "TokenBucket":
+        self.acquire_sync()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+
+class GeminiThrottle:
+    """Request and token buckets shared by every Gemini client in the process."""
+
+    def __init__(self, rpm: float = GEMINI_RPM, tpm: float = GEMINI_TPM) -> None:
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm, burst=tpm)
+
+    @staticmethod
+    def estimate_tokens(prompt: str) -> int:
+        # ~4 characters per token is close enough for budgeting.
+        return max(1, len(prompt) // 4)
+
+    def wait_sync(self, prompt: str) -> None:
+        self.requests.acquire_sync()
+        self.tokens.acquire_sync(self.estimate_tokens(prompt))
+
+    async def wait(self, prompt: str) -> None:
+        await self.requests.acquire()
+        await self.tokens.acquire(self.estimate_tokens(prompt))
+
+    def backoff(self, retry_after: Optional[float] = None) -> None:
+        self.requests.backoff(retry_after)
+
+    def record_success(self) -> None:
+        self.requests.record_success()
+
+
+gemini_throttle = GeminiThrottle()
+
+
+__all__ = ["GEMINI_RPM", "GEMINI_TPM", "GeminiThrottle", "TokenBucket", "gemini_throttle", "retry_delay"]
@@ -213,10 +213,10 @@ class RoleAnalysisAgent:
             }}
 
             Role JSON:
-            {json.dumps(role_payload, indent=2)}
+            {json.dumps(role_payload, separators=(",", ":"))}
 
             CV Library:
-            {json.dumps(cv_library, indent=2)}
+            {json.dumps(cv_library, separators=(",", ":"))}
             """
         ).strip()
 
@@ -0,0 +1,108 @@
+"""Embedding-similarity cache for near-duplicate LLM inputs.
+
+Complements :mod:`agents.common.llm_cache`, which only catches byte-identical
+prompts. Texts are embedded with a small sentence-transformers model and kept
+in a FAISS inner-product index under ``<cache_dir>/<bucket>/``; a lookup whose
+cosine similarity clears ``threshold`` returns the payload stored for the
+closest earlier text.
+
+``sentence-transformers`` and ``faiss-cpu`` are optional dependencies; check
+:func:`semantic_cache_available` before constructing a :class:`SemanticCache`.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.logging import get_logger
+
+try:  # pragma: no cover - optional dependency
+    import faiss
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # pragma: no cover - optional dependency
+    faiss = None
+    SentenceTransformer = None
+
+logger = get_logger(__name__)
+
+CACHE_DIR = Path(os.getenv("JOB_FINDER_SEMANTIC_CACHE_DIR", Path.home() / ".cache" / "job-finder" / "semantic"))
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_THRESHOLD = 0.95
+# Postings are near-duplicates long before the end; embedding the head is enough.
+EMBED_CHARS = 2000
+
+
+def semantic_cache_available() -> bool:
+    return faiss is not None and SentenceTransformer is not None
+
+
+@lru_cache(maxsize=1)
+def _model() -> "SentenceTransformer":
+    return SentenceTransformer(MODEL_NAME)
+
+
+class SemanticCache:
+    """Nearest-neighbour payload cache for one logical bucket of prompts."""
+
+    def __init__(
+        self,
+        bucket: str,
+        *,
+        cache_dir: Path | None = None,
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> None:
+        if not semantic_cache_available():
+            raise RuntimeError("Semantic cache needs the optional 'sentence-transformers' and 'faiss-cpu' packages.")
+        self.threshold = threshold
+        self.directory = (cache_dir or CACHE_DIR) / bucket
+        self.index_path = self.directory / "index.faiss"
+        self.payloads_path = self.directory / "payloads.jsonl"
+        self._lock = threading.Lock()
+        self._payloads: List[Dict[str, Any]] = []
+        self._index = None
+        if self.index_path.exists() and self.payloads_path.exists():
+            self._index = faiss.read_index(str(self.index_path))
+            with self.payloads_path.open(encoding="utf-8") as handle:
+                self._payloads = [json.loads(line) for line in handle if line.strip()]
+            if self._index.ntotal != len(self._payloads):
+                logger.warning("Semantic cache at %s is inconsistent; starting afresh", self.directory)
+                self._index, self._payloads = None, []
+
+    def _embed(self, text: str):
+        return _model().encode([text[:EMBED_CHARS]], normalize_embeddings=True).astype("float32")
+
+    def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """Return the payload cached for the most similar earlier text, if close enough."""
+        embedding = self._embed(text)
+        with self._lock:
+            if self._index is None or self._index.ntotal == 0:
+                return None
+            scores, ids = self._index.search(embedding, 1)
+            if scores[0][0] < self.threshold:
+                return None
+            return dict(self._payloads[ids[0][0]])
+
+    def put(self, text: str, payload: Dict[str, Any]) -> None:
+        embedding = self._embed(text)
+        with self._lock:
+            if self._index is None:
+                self._index = faiss.IndexFlatIP(embedding.shape[1])
+            self._index.add(embedding)
+            self._payloads.append(payload)
+
+    def save(self) -> None:
+        with self._lock:
+            if self._index is None:
+                return
+            self.directory.mkdir(parents=True, exist_ok=True)
+            faiss.write_index(self._index, str(self.index_path))
+            with self.payloads_path.open("w", encoding="utf-8") as handle:
+                for payload in self._payloads:
+                    handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+
+
+__all__ = ["DEFAULT_THRESHOLD", "SemanticCache", "semantic_cache_available"]
@@ -0,0 +1,16 @@
+"""Small text helpers shared by the LLM-backed agents."""
+from __future__ import annotations
+
+import re
+
+# Opening fence (with optional language tag), body, optional closing fence at the very end.
+_FENCE = re.compile(r"^\s*```[^\n]*\n(.*?)(?:\n\s*```[^\n]*)?\s*\Z", re.DOTALL)
+
+
+def strip_code_fence(text: str) -> str:
+    """Return ``text`` without a surrounding Markdown code fence, whitespace-stripped."""
+    match = _FENCE.match(text)
+    return match.group(1).strip() if match else text.strip()
+
+
+__all__ = ["strip_code_fence"]
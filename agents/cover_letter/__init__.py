@@ -3,9 +3,11 @@
 from .cover_letter_generator_agent import CoverLetterGeneratorAgent
 from .hr_simulation_agent import HRSimulationAgent
 from .style_extractor_agent import StyleExtractorAgent
+from .batch_runner import run_jobs
 
 __all__ = [
     "CoverLetterGeneratorAgent",
     "HRSimulationAgent",
     "StyleExtractorAgent",
+    "run_jobs",
 ]
@@ -0,0 +1,157 @@
+"""Cover letter revision loop, run for one job or thread-pooled over many at once."""
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from utils.logging import get_logger
+
+try:
+    from agents.cover_letter.cover_letter_generator_agent import DEFAULT_ACCEPT_SCORE, CoverLetterGeneratorAgent
+    from agents.cover_letter.hr_simulation_agent import HRSimulationAgent
+except ImportError:  # pragma: no cover - script execution fallback
+    from .cover_letter_generator_agent import DEFAULT_ACCEPT_SCORE, CoverLetterGeneratorAgent
+    from .hr_simulation_agent import HRSimulationAgent
+
+logger = get_logger(__name__)
+
+# Jobs progressing at once. Request rate is budgeted by gemini_throttle, not by this.
+MAX_WORKERS = int(os.getenv("COVER_LETTER_MAX_WORKERS", "32"))
+DEFAULT_MAX_ITERATIONS = 3
+
+
+def _job_key(job: Dict[str, object], index: int) -> str:
+    raw = str(job.get("id") or f"{job.get('company', '')} {job.get('job_title', '')}")
+    slug = re.sub(r"[^a-z0-9]+", "-", raw.lower()).strip("-")
+    return slug or f"job-{index:02d}"
+
+
+def _format_feedback(feedback: Dict[str, object]) -> str:
+    sections = []
+    for title, key in (
+        ("Positives (keep these)", "positives"),
+        ("Negatives (must fix)", "negatives"),
+        ("Specific suggestions (implement all)", "fix_suggestions"),
+        ("Missing qualifications", "missing_qualifications"),
+    ):
+        items = feedback.get(key) or []
+        if items:
+            sections.append(f"{title}:\n" + "\n".join(f"- {item}" for item in items))
+    sections.append(
+        "Address all negatives and implement all suggestions while preserving the positives."
+    )
+    return f"HR feedback (score {feedback.get('score')}/100)\n\n" + "\n\n".join(sections)
+
+
+def run_job(
+    job: Dict[str, object],
+    *,
+    generator: CoverLetterGeneratorAgent,
+    hr_agent: HRSimulationAgent,
+    job_id: str,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    accept_score: int = DEFAULT_ACCEPT_SCORE,
+) -> Dict[str, object]:
+    """Draft, review and revise a cover letter for a single job.
+
+    ``job`` needs ``job_title``, ``job_description`` and ``company``; ``location``
+    and ``style_notes`` are optional. Revision stops early once the HR review
+    reaches ``accept_score`` with nothing left to fix. The best-scoring draft
+    is returned.
+    """
+    job_title = str(job["job_title"])
+    job_description = str(job["job_description"])
+    company = str(job["company"])
+
+    letter = generator.generate(
+        job_title=job_title,
+        job_description=job_description,
+        company=company,
+        location=job.get("location"),
+        style_notes=job.get("style_notes"),
+        iteration=1,
+        job_id=job_id,
+    )
+    history: List[Dict[str, object]] = []
+    best = {"letter": letter, "score": -1, "iteration": 1}
+    for iteration in range(1, max_iterations + 1):
+        feedback = hr_agent.evaluate(
+            cover_letter=letter,
+            job_title=job_title,
+            job_description=job_description,
+            company=company,
+            iteration=iteration,
+            job_id=job_id,
+        )
+        history.append(feedback)
+        logger.info("Cover letter %s: iteration %d scored %s/100", job_id, iteration, feedback["score"])
+        if feedback["score"] > best["score"]:
+            best = {"letter": letter, "score": feedback["score"], "iteration": iteration}
+        if iteration == max_iterations or not generator.should_revise(feedback, accept_score):
+            break
+        letter = generator.revise(
+            current_letter=letter,
+            feedback=_format_feedback(feedback),
+            iteration=iteration + 1,
+            style_notes=job.get("style_notes"),
+            job_id=job_id,
+        )
+    return {
+        "job_id": job_id,
+        "company": company,
+        "job_title": job_title,
+        "status": "success",
+        "best_letter": best["letter"],
+        "best_score": best["score"],
+        "best_iteration": best["iteration"],
+        "history": history,
+    }
+
+
+def run_jobs(
+    jobs: List[Dict[str, object]],
+    *,
+    base_path: Path | None = None,
+    max_workers: int = MAX_WORKERS,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    accept_score: int = DEFAULT_ACCEPT_SCORE,
+    generator: Optional[CoverLetterGeneratorAgent] = None,
+    hr_agent: Optional[HRSimulationAgent] = None,
+) -> List[Dict[str, object]]:
+    """Run :func:`run_job` for every job concurrently, preserving input order.
+
+    Each job is independent, I/O-bound Gemini work, so a thread pool keeps the
+    API busy. Every request still waits on the shared ``gemini_throttle``
+    (``GEMINI_RPM``/``GEMINI_TPM``), and in-flight requests stay capped by
+    ``GeminiClient.REQUEST_SLOTS``, so more workers never exceed the quota.
+    """
+    if not jobs:
+        return []
+    generator = generator or CoverLetterGeneratorAgent(base_path)
+    hr_agent = hr_agent or HRSimulationAgent(base_path)
+    keys = [_job_key(job, index) for index, job in enumerate(jobs, start=1)]
+    # Repeated postings must not share draft/report filenames.
+    keys = [key if keys.count(key) == 1 else f"{key}-{index}" for index, key in enumerate(keys, start=1)]
+
+    def _run(job: Dict[str, object], job_id: str) -> Dict[str, object]:
+        try:
+            return run_job(
+                job,
+                generator=generator,
+                hr_agent=hr_agent,
+                job_id=job_id,
+                max_iterations=max_iterations,
+                accept_score=accept_score,
+            )
+        except Exception as exc:
+            logger.exception("Cover letter pipeline failed for %s", job_id)
+            return {"job_id": job_id, "status": "error", "error": str(exc)}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+        return list(pool.map(_run, jobs, keys))
+
+
+__all__ = ["run_job", "run_jobs"]
@@ -1,28 +1,142 @@
 """Cover Letter Generator Agent with Gemini-powered drafting."""
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import threading
+import time
 from pathlib import Path
 from textwrap import dedent
 from typing import Dict, Optional
 
 try:
+    from agents.common.agent_base import AgentBase
     from agents.common.gemini_client import GeminiClient, GeminiConfig
 except ImportError:  # pragma: no cover - script execution fallback
+    from ..common.agent_base import AgentBase
     from ..common.gemini_client import GeminiClient, GeminiConfig
 
+try:  # pragma: no cover - optional helper
+    from utils.mock_llm import get_mock_response, mock_enabled
+except Exception:  # pragma: no cover - fallback when module missing
+    def get_mock_response(*_, **__):  # type: ignore
+        return None
 
-class CoverLetterGeneratorAgent:
+    def mock_enabled() -> bool:  # type: ignore
+        return False
+
+
+DEFAULT_ACCEPT_SCORE = 85
+CONTEXT_CACHE_ENABLED = os.getenv("GEMINI_CONTEXT_CACHE", "").lower() in {"1", "true", "yes"}
+CONTEXT_CACHE_TTL_SECONDS = 3600
+FINGERPRINT_MAX_SAMPLES = 2
+FINGERPRINT_MOCK_BUCKET = "style_fingerprint"
+CACHED_CONTEXT_NOTE = "The candidate profile and writing samples are provided in the cached context."
+
+_GEN_TEMPLATE = dedent(
+    """
+    Write a compelling cover letter for this job. Requirements:
+    - 3-4 paragraphs, professional but personable tone
+    - Address specific requirements from the job description
+    - Highlight relevant experience from the candidate's profile
+    - Use UK English
+    - Return only the letter text (no code fences, no commentary)
+
+    **CRITICAL: NEVER fabricate, invent, or embellish experiences, projects, skills, or achievements.**
+    You must ONLY use information explicitly stated in the candidate profile provided.
+    If the candidate lacks certain skills or experiences mentioned in the job posting,
+    focus on transferable skills and genuine experiences - do NOT make up projects or
+    claim proficiency in technologies not listed in their profile. Honesty is paramount.
+
+    === JOB POSTING ===
+    Company: {company}
+    Title: {job_title}
+    {location_str}
+
+    {job_description}
+    === END JOB POSTING ===
+
+    {profile_section}
+
+    {samples_section}
+
+    {style_section}
+
+    {feedback_section}
+    """
+).strip()
+
+_STRUCTURED_TEMPLATE = dedent(
+    """
+    Compose a four-paragraph cover letter in Markdown. Requirements:
+    - Tone and cadence must reflect this style fingerprint: {style_profile}
+    - Address these talking points explicitly: {talking_points}
+    - Cite achievements pulled from this selected CV: {selected_cv}
+    - Reference the candidate profile when relevant
+    - If HR feedback is provided, incorporate it seamlessly: {feedback}
+    - Use UK English.
+    - Use connective phrases already favored by the writer when natural.
+    - Return only the final letter (no code fences, no additional commentary).
+
+    Role summary:
+    {role_summary}
+
+    Candidate Profile:
+    {profile_text}
+    """
+).strip()
+
+_REVISE_TEMPLATE = dedent(
+    """
+    You are editing an existing cover letter. Apply the feedback while keeping the writer's voice intact.
+    Provide only the revised letter text.
+
+    **CRITICAL: NEVER fabricate, invent, or embellish experiences, projects, skills, or achievements.**
+    You may only reference experiences and skills that are already in the letter or are genuine.
+    If addressing feedback requires skills or projects the candidate doesn't have, focus on
+    transferable skills and genuine strengths instead. Do NOT make up projects or technologies.
+
+    {style_section}
+
+    Feedback to address:
+    {feedback}
+
+    Current letter:
+    {current_letter}
+    """
+).strip()
+
+_FINGERPRINT_TEMPLATE = dedent(
+    """
+    Summarize the tone, cadence, sentence structure and favored connective phrases of the
+    author of these writing samples in at most 300 words. The summary will replace the samples
+    when drafting new cover letters, so focus on how the author writes rather than what they
+    wrote about. Return plain prose only.
+
+    {samples}
+    """
+).strip()
+
+
+class CoverLetterGeneratorAgent(AgentBase):
     """Generates cover letters using raw job description and profile."""
 
     REASONING_MODEL = "gemini-2.5-pro"
     STYLE_MODEL = "gemini-2.5-flash"
 
-    def __init__(self, base_path: Path | None = None) -> None:
-        self.base_path = base_path or Path(__file__).resolve().parents[2]
-        self.output_dir = self.base_path / "data" / "output"
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.profile_file = self.base_path / "data" / "profile.md"
+    def __init__(self, base_path: Path | None = None, use_context_cache: Optional[bool] = None) -> None:
+        super().__init__(base_path)
+        self.samples_dir = self.base_path / "data" / "writing_samples"
+        self.fingerprint_file = self.base_path / "data" / "cache" / "style_fingerprint.json"
+        self._fingerprint: tuple[str, Optional[str]] | None = None
+        self._fingerprint_lock = threading.Lock()
+        self._base_meta: Dict[str, object] = {"role": None, "company": None, "iteration": None}
+        self.use_context_cache = CONTEXT_CACHE_ENABLED if use_context_cache is None else use_context_cache
+        self._cache_name: Optional[str] = None
+        self._cache_sections: Optional[tuple[str, str]] = None
+        self._cache_expires_at = 0.0
+        self._cache_lock = threading.Lock()
         self.generator_client = GeminiClient(
             GeminiConfig(
                 model=self.REASONING_MODEL,
@@ -39,6 +153,14 @@ class CoverLetterGeneratorAgent:
                 mock_bucket="cover_letter_revise",
             )
         )
+        self.fingerprint_client = GeminiClient(
+            GeminiConfig(
+                model=self.STYLE_MODEL,
+                system_instruction="Describe an author's writing style concisely so others can imitate it.",
+                temperature=0.2,
+                mock_bucket=FINGERPRINT_MOCK_BUCKET,
+            )
+        )
 
     def generate(
         self,
@@ -49,6 +171,7 @@ class CoverLetterGeneratorAgent:
         style_notes: Optional[str] = None,
         iteration: int = 1,
         feedback: Optional[str] = None,
+        job_id: Optional[str] = None,
     ) -> str:
         """Generate a cover letter from raw job posting data.
         
@@ -60,61 +183,46 @@ class CoverLetterGeneratorAgent:
             style_notes: Writing style guidance (optional)
             iteration: Draft iteration number
             feedback: Previous feedback to incorporate (optional)
+            job_id: Key used to keep drafts of concurrent jobs apart (optional)
         """
         profile = self._load_profile()
-        writing_samples = self._load_writing_samples()
         
         location_str = f"Location: {location}" if location else ""
         style_section = f"Style guidance:\n{style_notes}" if style_notes else ""
         feedback_section = f"Previous feedback to address:\n{feedback}" if feedback else ""
+        profile_section = f"=== CANDIDATE PROFILE ===\n{profile}\n=== END PROFILE ==="
         samples_section = ""
-        if writing_samples:
-            samples_section = f"Writing samples (match this tone and style):\n{chr(10).join(writing_samples[:2])}"
-        
-        prompt = dedent(
-            f"""
-            Write a compelling cover letter for this job. Requirements:
-            - 3-4 paragraphs, professional but personable tone
-            - Address specific requirements from the job description
-            - Highlight relevant experience from the candidate's profile
-            - Use UK English
-            - Return only the letter text (no code fences, no commentary)
-            
-            **CRITICAL: NEVER fabricate, invent, or embellish experiences, projects, skills, or achievements.**
-            You must ONLY use information explicitly stated in the candidate profile below.
-            If the candidate lacks certain skills or experiences mentioned in the job posting,
-            focus on transferable skills and genuine experiences - do NOT make up projects or
-            claim proficiency in technologies not listed in their profile. Honesty is paramount.
-            
-            === JOB POSTING ===
-            Company: {company}
-            Title: {job_title}
-            {location_str}
-            
-            {job_description}
-            === END JOB POSTING ===
-            
-            === CANDIDATE PROFILE ===
-            {profile}
-            === END PROFILE ===
-            
-            {samples_section}
-            
-            {style_section}
-            
-            {feedback_section}
-            """
+        fingerprint = self._style_fingerprint()
+        if fingerprint:
+            samples_section = f"Writing style to match:\n{fingerprint}"
+        else:
+            writing_samples = self._load_writing_samples()
+            if writing_samples:
+                samples_section = (
+                    "Writing samples (match this tone and style):\n"
+                    f"{chr(10).join(writing_samples[:FINGERPRINT_MAX_SAMPLES])}"
+                )
+        cache_name = self._context_cache(profile_section, samples_section) if self.use_context_cache else None
+        if cache_name:
+            profile_section, samples_section = CACHED_CONTEXT_NOTE, ""
+
+        prompt = _GEN_TEMPLATE.format(
+            company=company,
+            job_title=job_title,
+            location_str=location_str,
+            job_description=job_description,
+            profile_section=profile_section,
+            samples_section=samples_section,
+            style_section=style_section,
+            feedback_section=feedback_section,
         ).strip()
 
-        letter = self.generator_client.generate_text(
-            prompt,
-            metadata={
-                "role": job_title,
-                "company": company,
-                "iteration": iteration,
-            },
-        )
-        self._write_iteration(letter, iteration)
+        meta = self._base_meta.copy()
+        meta["role"] = job_title
+        meta["company"] = company
+        meta["iteration"] = iteration
+        letter = self.generator_client.generate_text(prompt, metadata=meta, cached_content=cache_name)
+        self._write_iteration(letter, iteration, job_id)
         return letter
 
     def generate_from_structured(
@@ -130,34 +238,20 @@ class CoverLetterGeneratorAgent:
         selected_cv = profile_package.get("cv_library", {}).get(selected_cv_key, {})
         profile_text = profile_package.get("profile_text", "")
         
-        prompt = dedent(
-            f"""
-            Compose a four-paragraph cover letter in Markdown. Requirements:
-            - Tone and cadence must reflect this style fingerprint: {json.dumps(style_profile, indent=2)}
-            - Address these talking points explicitly: {json.dumps(role_summary.get('mandatory_talking_points', []), indent=2)}
-            - Cite achievements pulled from this selected CV: {json.dumps(selected_cv, indent=2)}
-            - Reference the candidate profile when relevant
-            - If HR feedback is provided, incorporate it seamlessly: {json.dumps(feedback or {}, indent=2)}
-            - Use UK English.
-            - Use connective phrases already favored by the writer when natural.
-            - Return only the final letter (no code fences, no additional commentary).
-
-            Role summary:
-            {json.dumps(role_summary, indent=2)}
-            
-            Candidate Profile:
-            {profile_text}
-            """
+        prompt = _STRUCTURED_TEMPLATE.format(
+            style_profile=json.dumps(style_profile, indent=2),
+            talking_points=json.dumps(role_summary.get("mandatory_talking_points", []), indent=2),
+            selected_cv=json.dumps(selected_cv, indent=2),
+            feedback=json.dumps(feedback or {}, indent=2),
+            role_summary=json.dumps(role_summary, indent=2),
+            profile_text=profile_text,
         ).strip()
 
-        letter = self.generator_client.generate_text(
-            prompt,
-            metadata={
-                "role": role_summary.get("title"),
-                "company": role_summary.get("company"),
-                "iteration": iteration,
-            },
-        )
+        meta = self._base_meta.copy()
+        meta["role"] = role_summary.get("title")
+        meta["company"] = role_summary.get("company")
+        meta["iteration"] = iteration
+        letter = self.generator_client.generate_text(prompt, metadata=meta)
         self._write_iteration(letter, iteration)
         return letter
 
@@ -167,6 +261,7 @@ class CoverLetterGeneratorAgent:
         feedback: str,
         iteration: int,
         style_notes: Optional[str] = None,
+        job_id: Optional[str] = None,
     ) -> str:
         """Revise a cover letter based on feedback.
         
@@ -175,27 +270,14 @@ class CoverLetterGeneratorAgent:
             feedback: Feedback to incorporate
             iteration: Revision iteration number
             style_notes: Style guidance (optional)
+            job_id: Key used to keep drafts of concurrent jobs apart (optional)
         """
         style_section = f"Style guidance:\n{style_notes}" if style_notes else ""
         
-        prompt = dedent(
-            f"""
-            You are editing an existing cover letter. Apply the feedback while keeping the writer's voice intact.
-            Provide only the revised letter text.
-            
-            **CRITICAL: NEVER fabricate, invent, or embellish experiences, projects, skills, or achievements.**
-            You may only reference experiences and skills that are already in the letter or are genuine.
-            If addressing feedback requires skills or projects the candidate doesn't have, focus on
-            transferable skills and genuine strengths instead. Do NOT make up projects or technologies.
-
-            {style_section}
-
-            Feedback to address:
-            {feedback}
-
-            Current letter:
-            {current_letter}
-            """
+        prompt = _REVISE_TEMPLATE.format(
+            style_section=style_section,
+            feedback=feedback,
+            current_letter=current_letter,
         ).strip()
 
         revised = self.revision_client.generate_text(
@@ -205,24 +287,110 @@ class CoverLetterGeneratorAgent:
                 "bucket_key": "revision",
             },
         )
-        self._write_iteration(revised, iteration)
+        self._write_iteration(revised, iteration, job_id)
         return revised
 
+    @staticmethod
+    def should_revise(feedback: Dict[str, object], threshold: int = DEFAULT_ACCEPT_SCORE) -> bool:
+        """Return True when HR feedback still warrants another revision round.
+
+        A letter scoring at or above ``threshold`` with no fix suggestions is
+        final; revising it would only spend another Gemini round-trip.
+        """
+        return int(feedback.get("score", 0)) < threshold or bool(feedback.get("fix_suggestions"))
+
     # -------------------- helpers --------------------
+    def _context_cache(self, profile_section: str, samples_section: str) -> Optional[str]:
+        """Upload profile + samples once so later drafts only send the job delta.
+
+        Re-uploads when the TTL is about to lapse or either section changed.
+        """
+        sections = (profile_section, samples_section)
+        with self._cache_lock:
+            now = time.monotonic()
+            if now >= self._cache_expires_at or sections != self._cache_sections:
+                # Refresh shortly before the server-side TTL lapses; a failed upload is not retried until then.
+                self._cache_expires_at = now + CONTEXT_CACHE_TTL_SECONDS - 60
+                self._cache_sections = sections
+                self._cache_name = self.generator_client.create_cache(
+                    [profile_section, samples_section],
+                    ttl_seconds=CONTEXT_CACHE_TTL_SECONDS,
+                )
+            return self._cache_name
+
     def _load_profile(self) -> str:
-        if not self.profile_file.exists():
+        profile = self.get_profile(self.profile_file)
+        if profile is None:
             raise FileNotFoundError(f"Profile file not found: {self.profile_file}")
-        return self.profile_file.read_text()
+        return profile
     
     def _load_writing_samples(self) -> list[str]:
-        samples_dir = self.base_path / "data" / "writing_samples"
-        if not samples_dir.exists():
+        if not self.samples_dir.exists():
             return []
-        return [f.read_text() for f in sorted(samples_dir.glob("*.md"))]
+        return [f.read_text() for f in sorted(self.samples_dir.glob("*.md"))]
+
+    def _samples_key(self) -> str | None:
+        if not self.samples_dir.exists():
+            return None
+        digest = hashlib.sha1()
+        paths = sorted(self.samples_dir.glob("*.md"))[:FINGERPRINT_MAX_SAMPLES]
+        for path in paths:
+            stat = path.stat()
+            digest.update(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+        return digest.hexdigest() if paths else None
+
+    def _style_fingerprint(self) -> Optional[str]:
+        """Return a compact style summary of the writing samples.
+
+        The summary is produced once by the flash model and stored in
+        ``data/cache/style_fingerprint.json`` keyed by the samples' mtimes and
+        sizes, so prompts carry a few hundred tokens instead of the raw samples.
+        Returns ``None`` when there are no samples or the summary call fails.
+        In mock mode only the canned reply is used and the disk cache is left
+        alone; without one the raw samples are used rather than calling Gemini.
+        """
+        key = self._samples_key()
+        if key is None:
+            return None
+        with self._fingerprint_lock:
+            if self._fingerprint and self._fingerprint[0] == key:
+                return self._fingerprint[1]
+            if mock_enabled():
+                # Canned mock replies must never land in the persistent cache.
+                mocked = get_mock_response(FINGERPRINT_MOCK_BUCKET, metadata={"bucket_key": "fingerprint"})
+                fingerprint = None if mocked is None else str(mocked)
+                self._fingerprint = (key, fingerprint)
+                return fingerprint
+            fingerprint: Optional[str] = None
+            if self.fingerprint_file.exists():
+                try:
+                    cached = json.loads(self.fingerprint_file.read_text())
+                    if cached.get("key") == key:
+                        fingerprint = cached.get("fingerprint")
+                except (OSError, json.JSONDecodeError):
+                    fingerprint = None
+            if not fingerprint:
+                samples = self._load_writing_samples()[:FINGERPRINT_MAX_SAMPLES]
+                try:
+                    fingerprint = self.fingerprint_client.generate_text(
+                        _FINGERPRINT_TEMPLATE.format(samples="\n\n---\n\n".join(samples)),
+                        metadata={"bucket_key": "fingerprint"},
+                    )
+                except Exception:  # fall back to raw samples if the summary call fails
+                    fingerprint = None
+                if fingerprint:
+                    self.fingerprint_file.parent.mkdir(parents=True, exist_ok=True)
+                    self.fingerprint_file.write_text(
+                        json.dumps({"key": key, "fingerprint": fingerprint}, indent=2)
+                    )
+            self._fingerprint = (key, fingerprint)
+            return fingerprint
 
-    def _write_iteration(self, letter: str, iteration: int) -> None:
-        filename = self.output_dir / f"draft_cover_letter_iter_{iteration}.md"
-        filename.write_text(letter)
+    def _write_iteration(self, letter: str, iteration: int, job_id: Optional[str] = None) -> None:
+        prefix = f"draft_cover_letter_{job_id}" if job_id else "draft_cover_letter"
+        filename = self.output_dir / f"{prefix}_iter_{iteration}.md"
+        # Encode explicitly: letters routinely contain £/€ and must not depend on the locale codec.
+        filename.write_bytes(letter.encode("utf-8"))
 
 
 if __name__ == "__main__":
@@ -7,19 +7,95 @@ from textwrap import dedent
 from typing import Dict, Optional
 
 try:
+    from agents.common.agent_base import AgentBase
     from agents.common.gemini_client import GeminiClient, GeminiConfig
 except ImportError:  # pragma: no cover - script execution fallback
+    from ..common.agent_base import AgentBase
     from ..common.gemini_client import GeminiClient, GeminiConfig
 
 
-class HRSimulationAgent:
+FEEDBACK_LIST_FIELDS = ("positives", "negatives", "fix_suggestions", "missing_qualifications")
+
+_EVAL_TEMPLATE = dedent(
+    """
+    Evaluate this cover letter as an HR reviewer. Respond ONLY with JSON containing:
+    {{
+      "iteration": integer,
+      "score": integer (0-100),
+      "positives": [string],
+      "negatives": [string],
+      "fix_suggestions": [string],
+      "missing_qualifications": [string],
+      "tone_issues": boolean,
+      "culture_alignment": boolean
+    }}
+
+    Evaluation criteria:
+    - Does the letter address key requirements from the job posting?
+    - Does it highlight relevant experience from the candidate?
+    - Is the tone professional and appropriate?
+    - Is it concise and well-structured?
+    - Are there specific examples and achievements?
+    - Penalize vagueness, generic statements, or mismatches
+    - Provide actionable fix suggestions
+
+    === JOB POSTING ===
+    Company: {company}
+    Title: {job_title}
+
+    {job_description}
+    === END JOB POSTING ===
+
+    === CANDIDATE PROFILE ===
+    {profile}
+    === END PROFILE ===
+
+    === COVER LETTER TO EVALUATE ===
+    {cover_letter}
+    === END COVER LETTER ===
+
+    Iteration: {iteration}
+    """
+).strip()
+
+_EVAL_LEGACY_TEMPLATE = dedent(
+    """
+    Evaluate the candidate's submission. Respond ONLY with JSON containing:
+    {{
+      "iteration": integer,
+      "score": integer (0-100),
+      "positives": [string],
+      "negatives": [string],
+      "fix_suggestions": [string],
+      "missing_qualifications": [string],
+      "tone_issues": boolean,
+      "culture_alignment": {{ value: boolean }}
+    }}
+
+    Requirements:
+    - Weight must-have skills from the role summary heavily.
+    - Penalize vagueness, missing gratitude, or tone mismatches.
+    - Provide actionable fix suggestions (paragraph-level guidance).
+
+    Role summary:
+    {role_summary}
+
+    Selected CV variant:
+    {selected_cv}
+
+    Cover letter:
+    {cover_letter}
+
+    Iteration: {iteration}
+    """
+).strip()
+
+
+class HRSimulationAgent(AgentBase):
     MODEL_NAME = "gemini-2.5-pro"
 
     def __init__(self, base_path: Path | None = None) -> None:
-        self.base_path = base_path or Path(__file__).resolve().parents[2]
-        self.output_dir = self.base_path / "data" / "output"
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.profile_file = self.base_path / "data" / "profile.md"
+        super().__init__(base_path)
         self.client = GeminiClient(
             GeminiConfig(
                 model=self.MODEL_NAME,
@@ -37,6 +113,7 @@ class HRSimulationAgent:
         job_description: str,
         company: str,
         iteration: int = 1,
+        job_id: Optional[str] = None,
     ) -> Dict[str, object]:
         """Evaluate a cover letter against the job description.
         
@@ -46,57 +123,26 @@ class HRSimulationAgent:
             job_description: Raw job description
             company: Company name
             iteration: Evaluation iteration number
+            job_id: Key used to keep reports of concurrent jobs apart (optional)
         """
         profile = self._load_profile()
         
-        prompt = dedent(
-            f"""
-            Evaluate this cover letter as an HR reviewer. Respond ONLY with JSON containing:
-            {{
-              "iteration": integer,
-              "score": integer (0-100),
-              "positives": [string],
-              "negatives": [string],
-              "fix_suggestions": [string],
-              "missing_qualifications": [string],
-              "tone_issues": boolean,
-              "culture_alignment": boolean
-            }}
-
-            Evaluation criteria:
-            - Does the letter address key requirements from the job posting?
-            - Does it highlight relevant experience from the candidate?
-            - Is the tone professional and appropriate?
-            - Is it concise and well-structured?
-            - Are there specific examples and achievements?
-            - Penalize vagueness, generic statements, or mismatches
-            - Provide actionable fix suggestions
-
-            === JOB POSTING ===
-            Company: {company}
-            Title: {job_title}
-            
-            {job_description}
-            === END JOB POSTING ===
-
-            === CANDIDATE PROFILE ===
-            {profile}
-            === END PROFILE ===
-
-            === COVER LETTER TO EVALUATE ===
-            {cover_letter}
-            === END COVER LETTER ===
-
-            Iteration: {iteration}
-            """
-        ).strip()
+        prompt = _EVAL_TEMPLATE.format(
+            company=company,
+            job_title=job_title,
+            job_description=job_description,
+            profile=profile,
+            cover_letter=cover_letter,
+            iteration=iteration,
+        )
 
         feedback = self.client.generate_json(
             prompt,
             metadata={"iteration": iteration, "role": job_title, "company": company},
         )
+        feedback = self._validate_feedback(feedback)
         feedback.setdefault("iteration", iteration)
-        self._persist_report(feedback)
+        self._persist_report(feedback, job_id)
         return feedback
 
     def evaluate_legacy(
@@ -109,53 +155,44 @@ class HRSimulationAgent:
         role_summary_path = self.output_dir / "role_summary.json"
         role_summary = json.loads(role_summary_path.read_text()) if role_summary_path.exists() else {}
         
-        prompt = dedent(
-            f"""
-            Evaluate the candidate's submission. Respond ONLY with JSON containing:
-            {{
-              "iteration": integer,
-              "score": integer (0-100),
-              "positives": [string],
-              "negatives": [string],
-              "fix_suggestions": [string],
-              "missing_qualifications": [string],
-              "tone_issues": boolean,
-              "culture_alignment": {{ value: boolean }}
-            }}
-
-            Requirements:
-            - Weight must-have skills from the role summary heavily.
-            - Penalize vagueness, missing gratitude, or tone mismatches.
-            - Provide actionable fix suggestions (paragraph-level guidance).
-
-            Role summary:
-            {json.dumps(role_summary, indent=2)}
-
-            Selected CV variant:
-            {json.dumps(selected_cv, indent=2)}
-
-            Cover letter:
-            {cover_letter}
-
-            Iteration: {iteration}
-            """
-        ).strip()
+        prompt = _EVAL_LEGACY_TEMPLATE.format(
+            role_summary=json.dumps(role_summary, indent=2),
+            selected_cv=json.dumps(selected_cv, indent=2),
+            cover_letter=cover_letter,
+            iteration=iteration,
+        )
 
         feedback = self.client.generate_json(
             prompt,
             metadata={"iteration": iteration, "role": role_summary.get("title")},
         )
+        feedback = self._validate_feedback(feedback)
         feedback.setdefault("iteration", iteration)
         self._persist_report(feedback)
         return feedback
 
+    @staticmethod
+    def _validate_feedback(feedback: object) -> Dict[str, object]:
+        """Reject malformed HR reports before callers key into them."""
+        if not isinstance(feedback, dict):
+            raise ValueError(f"HR feedback must be a JSON object, got {type(feedback).__name__}")
+        try:
+            feedback["score"] = int(feedback["score"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"HR feedback has no numeric score: {feedback.get('score')!r}") from exc
+        for key in FEEDBACK_LIST_FIELDS:
+            value = feedback.get(key)
+            if value is None:
+                feedback[key] = []
+            elif not isinstance(value, list):
+                raise ValueError(f"HR feedback field '{key}' must be a list")
+        return feedback
+
     def _load_profile(self) -> str:
-        if not self.profile_file.exists():
-            return ""
-        return self.profile_file.read_text()
+        return self.get_profile(self.profile_file) or ""
 
-    def _persist_report(self, feedback: Dict[str, object]) -> None:
-        report_path = self.output_dir / "hr_report.json"
+    def _persist_report(self, feedback: Dict[str, object], job_id: Optional[str] = None) -> None:
+        report_path = self.output_dir / (f"hr_report_{job_id}.json" if job_id else "hr_report.json")
         report_path.write_text(json.dumps(feedback, indent=2))
 
 
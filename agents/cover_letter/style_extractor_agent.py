@@ -12,6 +12,28 @@ except ImportError:  # pragma: no cover - script execution fallback
     from ..common.gemini_client import GeminiClient, GeminiConfig
 
 
+_STYLE_TEMPLATE = dedent(
+    """
+    You are a writing-style analyst. Summarize the stylistic fingerprint of the author.
+    Return JSON exactly with these keys:
+    {{
+      "model": "gemini-2.5-flash",
+      "average_sentence_length": number,
+      "tone": string,
+      "technical_density": number,
+      "transition_frequency": {{ "connector": integer }},
+      "vocabulary_density": number,
+      "connectors": [string]
+    }}
+
+    Base the metrics on the provided samples (treat newline separators as paragraph breaks):
+    ---
+    {samples}
+    ---
+    """
+).strip()
+
+
 class StyleExtractorAgent:
     MODEL_NAME = "gemini-2.5-flash"
 
@@ -38,26 +60,7 @@ class StyleExtractorAgent:
         return metrics
 
     def _query_model(self, samples: List[str]) -> Dict[str, object]:
-        prompt = dedent(
-            f"""
-            You are a writing-style analyst. Summarize the stylistic fingerprint of the author.
-            Return JSON exactly with these keys:
-            {{
-              "model": "gemini-2.5-flash",
-              "average_sentence_length": number,
-              "tone": string,
-              "technical_density": number,
-              "transition_frequency": {{ "connector": integer }},
-              "vocabulary_density": number,
-              "connectors": [string]
-            }}
-
-            Base the metrics on the provided samples (treat newline separators as paragraph breaks):
-            ---
-            {"\n\n".join(samples)}
-            ---
-            """
-        ).strip()
+        prompt = _STYLE_TEMPLATE.format(samples="\n\n".join(samples))
         return self.client.generate_json(prompt, metadata={"bucket_key": "style"})
 
 
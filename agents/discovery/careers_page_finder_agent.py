@@ -6,18 +6,27 @@ Also provides GeminiClient used by other agents.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import os
 import sys
+import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, Protocol
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Protocol
 
 import google.generativeai as genai
+from google.api_core.exceptions import DeadlineExceeded, ResourceExhausted, ServiceUnavailable
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
 	sys.path.insert(0, str(PROJECT_ROOT))
 
+from agents.common.rate_limiter import gemini_throttle, retry_delay
+from agents.common.text_utils import strip_code_fence
+
+
+RETRYABLE_ERRORS = (ResourceExhausted, DeadlineExceeded, ServiceUnavailable)
+
 
 class LLMClient(Protocol):
 	"""Simple interface describing the one method we need from any LLM client."""
@@ -45,31 +54,34 @@ Here are the search results as JSON:
 Respond with only the JSON object specified above."""
 
 
-def _strip_code_fence(text: str) -> str:
-	stripped = text.strip()
-	if stripped.startswith("```"):
-		lines = stripped.splitlines()
-		if lines and lines[0].startswith("```"):
-			lines = lines[1:]
-		if lines and lines[-1].startswith("```"):
-			lines = lines[:-1]
-		stripped = "\n".join(lines).strip()
-	return stripped
-
-
 def format_prompt(results: Iterable[Dict[str, Any]]) -> str:
 	pretty_json = json.dumps(list(results), indent=2, ensure_ascii=False)
 	return PROMPT_TEMPLATE.format(search_results=pretty_json)
 
 
+SELECTION_FIELDS = ("chosen_url", "confidence", "evidence")
+
+
+def _validate_selection(payload: Any, raw: str) -> Dict[str, Any]:
+	"""Check the LLM selection matches the schema requested in PROMPT_TEMPLATE."""
+	if not isinstance(payload, dict):
+		raise ValueError(f"LLM selection must be a JSON object: {raw}")
+	for field in SELECTION_FIELDS:
+		value = payload.get(field)
+		if value is not None and not isinstance(value, str):
+			raise ValueError(f"LLM selection field '{field}' must be a string: {raw}")
+	return payload
+
+
 def choose_careers_page(results: Iterable[Dict[str, Any]], llm: LLMClient) -> Dict[str, Any]:
 	prompt = format_prompt(results)
 	raw_response = llm.complete(prompt, temperature=0.0)
-	cleaned = _strip_code_fence(raw_response)
+	cleaned = strip_code_fence(raw_response)
 	try:
-		return json.loads(cleaned)
+		payload = json.loads(cleaned)
 	except json.JSONDecodeError as exc:  # pragma: no cover - LLM failures
 		raise ValueError(f"LLM returned invalid JSON: {cleaned}") from exc
+	return _validate_selection(payload, cleaned)
 
 
 def choose_from_file(results_path: Path, llm: LLMClient) -> Dict[str, Any]:
@@ -80,22 +92,129 @@ def choose_from_file(results_path: Path, llm: LLMClient) -> Dict[str, Any]:
 
 
 class GeminiClient:
-	"""Minimal wrapper around google.generativeai for this use case."""
-
-	def __init__(self, model: str = "gemini-2.5-flash", api_key: str | None = None) -> None:
+	"""Minimal wrapper around google.generativeai for this use case.
+
+	Every call is bounded by ``timeout`` and ``max_output_tokens`` and retried up
+	to ``max_retries`` times with jittered exponential backoff on rate limits,
+	timeouts and 503s.
+	"""
+
+	def __init__(
+		self,
+		model: str = "gemini-2.5-flash",
+		api_key: str | None = None,
+		*,
+		timeout: float = 60.0,
+		max_retries: int = 3,
+		max_output_tokens: int | None = None,
+	) -> None:
 		self.model_name = model
 		self.api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
 		if not self.api_key:
 			raise RuntimeError("GEMINI_API_KEY or GOOGLE_API_KEY environment variable is not set.")
 		genai.configure(api_key=self.api_key)
 		self.model = genai.GenerativeModel(model)
+		self.timeout = timeout
+		self.max_retries = max_retries
+		self.max_output_tokens = max_output_tokens
+
+	def _request_kwargs(self, temperature: float) -> Dict[str, Any]:
+		generation_config: Dict[str, Any] = {"temperature": temperature}
+		if self.max_output_tokens:
+			generation_config["max_output_tokens"] = self.max_output_tokens
+		return {"generation_config": generation_config, "request_options": {"timeout": self.timeout}}
+
+	def _retry_wait(self, exc: Exception, attempt: int) -> float:
+		"""Return how long to sleep before retrying, or re-raise once retries run out."""
+		if attempt >= self.max_retries:
+			raise exc
+		delay = retry_delay(attempt)
+		if isinstance(exc, ResourceExhausted):
+			# Pause the shared bucket so concurrent callers back off too.
+			gemini_throttle.backoff(delay)
+			return 0.0
+		return delay
 
 	def complete(self, prompt: str, *, temperature: float = 0.0) -> str:
-		response = self.model.generate_content(
-			prompt,
-			generation_config={"temperature": temperature},
-		)
-		return (response.text or "").strip()
+		attempt = 0
+		while True:
+			gemini_throttle.wait_sync(prompt)
+			try:
+				response = self.model.generate_content(prompt, **self._request_kwargs(temperature))
+			except RETRYABLE_ERRORS as exc:
+				time.sleep(self._retry_wait(exc, attempt))
+				attempt += 1
+				continue
+			gemini_throttle.record_success()
+			return (response.text or "").strip()
+
+	async def acomplete(self, prompt: str, *, temperature: float = 0.0) -> str:
+		attempt = 0
+		while True:
+			await gemini_throttle.wait(prompt)
+			try:
+				response = await self.model.generate_content_async(prompt, **self._request_kwargs(temperature))
+			except RETRYABLE_ERRORS as exc:
+				await asyncio.sleep(self._retry_wait(exc, attempt))
+				attempt += 1
+				continue
+			gemini_throttle.record_success()
+			return (response.text or "").strip()
+
+	def stream_complete(self, prompt: str, *, temperature: float = 0.0) -> Iterator[str]:
+		"""Yield response text as it is generated.
+
+		Retries only happen until the first chunk arrives; a stream that fails
+		part-way raises, since the caller has already seen some of the text.
+		"""
+		attempt = 0
+		while True:
+			gemini_throttle.wait_sync(prompt)
+			try:
+				chunks = iter(self.model.generate_content(prompt, stream=True, **self._request_kwargs(temperature)))
+				first = next(chunks, None)
+			except RETRYABLE_ERRORS as exc:
+				time.sleep(self._retry_wait(exc, attempt))
+				attempt += 1
+				continue
+			break
+		gemini_throttle.record_success()
+		if first is None:
+			return
+		yield _chunk_text(first)
+		for chunk in chunks:
+			yield _chunk_text(chunk)
+
+	async def astream_complete(self, prompt: str, *, temperature: float = 0.0) -> AsyncIterator[str]:
+		"""Async counterpart of :meth:`stream_complete`."""
+		attempt = 0
+		while True:
+			await gemini_throttle.wait(prompt)
+			try:
+				response = await self.model.generate_content_async(
+					prompt, stream=True, **self._request_kwargs(temperature)
+				)
+				chunks = response.__aiter__()
+				first = await anext(chunks, None)
+			except RETRYABLE_ERRORS as exc:
+				await asyncio.sleep(self._retry_wait(exc, attempt))
+				attempt += 1
+				continue
+			break
+		gemini_throttle.record_success()
+		if first is None:
+			return
+		yield _chunk_text(first)
+		async for chunk in chunks:
+			yield _chunk_text(chunk)
+
+
+def _chunk_text(chunk: Any) -> str:
+	# .text raises when a chunk carries no text parts (e.g. a bare finish reason).
+	try:
+		return chunk.text or ""
+	except ValueError:
+		return ""
 
 
 def choose_with_gemini(results_path: Path, model: str = "gemini-2.5-flash") -> Dict[str, Any]:
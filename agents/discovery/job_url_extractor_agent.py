@@ -13,17 +13,29 @@ from __future__ import annotations
 import argparse
 import asyncio
 import csv
+import hashlib
+import io
+import itertools
 import json
 import os
+import re
+import sqlite3
 import sys
+import tempfile
+import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set
+from typing import AsyncIterator, Dict, Iterator, List, Tuple
+from urllib.parse import urljoin, urlsplit
 
 import google.generativeai as genai
+import httpx
 import requests
+from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import Browser, BrowserContext, Route, async_playwright, TimeoutError as PlaywrightTimeoutError
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
@@ -35,17 +47,60 @@ load_dotenv(PROJECT_ROOT / ".env")
 from utils.logging import configure_logging, get_logger
 from tools.duckduckgo_search import duckduckgo_search
 from tools.google_search import google_search
+from agents.common.rate_limiter import gemini_throttle
 from agents.discovery.careers_page_finder_agent import choose_careers_page
 
 try:  # pragma: no cover - optional helper
-    from utils.mock_llm import get_mock_response
+    from utils.mock_llm import get_mock_response, mock_enabled
 except Exception:  # pragma: no cover - fallback when module missing
     def get_mock_response(*_, **__):  # type: ignore
         return None
 
+    def mock_enabled() -> bool:  # type: ignore
+        return False
+
 configure_logging()
 logger = get_logger(__name__)
 
+# Companies processed concurrently; each one is dominated by page loads and LLM latency.
+N_PARALLEL = int(os.getenv("JOB_URL_MAX_PARALLEL", "5"))
+# Companies whose links are filtered together in one Gemini call.
+FILTER_BATCH_SIZE = int(os.getenv("JOB_URL_FILTER_BATCH_SIZE", "8"))
+
+# Above this many companies to filter, URL filtering goes through the Gemini
+# Batch API: discounted and outside the per-minute limits, but asynchronous.
+BATCH_API_MIN_COMPANIES = int(os.getenv("GEMINI_BATCH_API_MIN_COMPANIES", "50"))
+BATCH_API_TIMEOUT_SECONDS = float(os.getenv("GEMINI_BATCH_API_TIMEOUT_SECONDS", str(6 * 3600)))
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+# Requests that never affect which links a page renders.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "segment.com",
+    "segment.io",
+    "clarity.ms",
+)
+
+# Scraping google.com in a browser is slow and routinely hits a CAPTCHA, so it
+# only runs as a last resort when explicitly enabled.
+PLAYWRIGHT_GOOGLE_FALLBACK = os.getenv("PLAYWRIGHT_GOOGLE_FALLBACK", "0") == "1"
+
+DISCOVERY_CACHE_PATH = Path(__file__).resolve().parents[2] / "data" / "cache" / "job_url_discovery.sqlite3"
+DISCOVERY_CACHE_TTL_SECONDS = float(os.getenv("JOB_URL_CACHE_TTL_DAYS", "14")) * 86400
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
 
 @dataclass(slots=True)
 class CompanyInfo:
@@ -64,15 +119,15 @@ class ExtractionResult:
     error: str | None = None
 
 
-FILTER_PROMPT = """You are helping me identify actual job posting URLs from a list of links extracted from a company's careers page.
-
-Company: {company_name}
-Careers page: {careers_url}
+@dataclass(slots=True)
+class PageLinks:
+    """Links scraped from a company's careers page, awaiting LLM filtering."""
+    company: str
+    careers_url: str
+    links: List[str]
 
-Here are all the links found on the page:
-{all_links}
 
-Instructions:
+FILTER_INSTRUCTIONS = """Instructions:
 1. Examine each URL carefully
 2. Identify URLs that lead to INDIVIDUAL job postings (not job listing pages, search pages, or filters)
 3. Common patterns for job posting URLs:
@@ -86,7 +141,17 @@ Instructions:
    - Navigation links (about, contact, apply tips, etc.)
    - External job boards (LinkedIn, Indeed, etc.) unless no direct links exist
    - Social media, blog posts, news articles
-   - Duplicate URLs (keep only unique ones)
+   - Duplicate URLs (keep only unique ones)"""
+
+FILTER_PROMPT = """You are helping me identify actual job posting URLs from a list of links extracted from a company's careers page.
+
+Company: {company_name}
+Careers page: {careers_url}
+
+Here are all the links found on the page:
+{all_links}
+
+""" + FILTER_INSTRUCTIONS + """
 
 Return ONLY a JSON array of the job posting URLs, nothing else. Example:
 ["https://company.com/jobs/123", "https://company.com/jobs/456"]
@@ -94,6 +159,31 @@ Return ONLY a JSON array of the job posting URLs, nothing else. Example:
 If no job posting URLs are found, return an empty array: []
 """
 
+FILTER_BATCH_PROMPT = """You are helping me identify actual job posting URLs from lists of links extracted from several companies' careers pages.
+
+""" + FILTER_INSTRUCTIONS + """
+
+Apply the instructions to each company below independently.
+
+{company_blocks}
+
+Return ONLY a JSON object mapping each company number to an array of its job posting URLs, nothing else. Example:
+{{"1": ["https://company.com/jobs/123"], "2": []}}
+
+Use an empty array for a company with no job posting URLs.
+"""
+
+FILTER_BATCH_BLOCK = """### Company {index}: {company_name} (careers: {careers_url})
+Links:
+{all_links}"""
+
+
+@lru_cache(maxsize=4)
+def _get_model(api_key: str, model_name: str) -> genai.GenerativeModel:
+    """Configure genai once and share one GenerativeModel per (key, model) process-wide."""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
 
 class GeminiClient:
     """Gemini LLM client for filtering job URLs."""
@@ -103,34 +193,363 @@ class GeminiClient:
         self.api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
             raise RuntimeError("GEMINI_API_KEY or GOOGLE_API_KEY environment variable is not set.")
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(model)
+        self.model = _get_model(self.api_key, model)
 
-    def complete(self, prompt: str, *, temperature: float = 0.0) -> str:
+    def complete(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.0,
+        response_schema: dict | None = None,
+        max_output_tokens: int | None = None
+    ) -> str:
+        """Return the model's reply; with ``response_schema`` it is guaranteed JSON matching the schema.
+        
+        Waits on the process-wide Gemini throttle first, so concurrent
+        companies share one requests-per-minute budget with every other agent.
+        """
+        generation_config: dict = {"temperature": temperature}
+        if max_output_tokens is not None:
+            generation_config["max_output_tokens"] = max_output_tokens
+        if response_schema is not None:
+            generation_config["response_mime_type"] = "application/json"
+            generation_config["response_schema"] = response_schema
+        gemini_throttle.wait_sync(prompt)
         response = self.model.generate_content(
             prompt,
-            generation_config={"temperature": temperature},
+            generation_config=generation_config,
         )
+        gemini_throttle.record_success()
         return (response.text or "").strip()
 
+    def complete_batch(
+        self,
+        prompts: List[str],
+        *,
+        temperature: float = 0.0,
+        response_schemas: List[dict | None] | None = None,
+        max_output_tokens: List[int | None] | None = None,
+        poll_seconds: float = 30,
+        timeout_seconds: float = BATCH_API_TIMEOUT_SECONDS
+    ) -> List[str]:
+        """Run ``prompts`` as one Gemini Batch API job and return the replies in order.
+        
+        Blocks while polling. A prompt whose request failed gets an empty
+        reply. Raises RuntimeError if the job fails and TimeoutError (after
+        cancelling it) if it has not finished within ``timeout_seconds``.
+        """
+        from google import genai as genai_sdk  # local import: only batch runs need the newer SDK
+        
+        client = genai_sdk.Client(api_key=self.api_key)
+        inlined_requests = []
+        for index, prompt in enumerate(prompts):
+            config: dict = {"temperature": temperature}
+            if response_schemas and response_schemas[index] is not None:
+                config["response_mime_type"] = "application/json"
+                config["response_schema"] = response_schemas[index]
+            if max_output_tokens and max_output_tokens[index] is not None:
+                config["max_output_tokens"] = max_output_tokens[index]
+            inlined_requests.append({
+                "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                "config": config,
+                "metadata": {"key": str(index)},
+            })
+        
+        job = client.batches.create(model=self.model_name, src=inlined_requests, config={"display_name": "job-url-filter"})
+        logger.info(f"Submitted Gemini batch job {job.name} with {len(prompts)} requests")
+        deadline = time.monotonic() + timeout_seconds
+        while job.state.name not in _BATCH_DONE_STATES:
+            if time.monotonic() > deadline:
+                client.batches.cancel(name=job.name)
+                raise TimeoutError(f"Gemini batch job {job.name} did not finish within {timeout_seconds}s")
+            time.sleep(poll_seconds)
+            job = client.batches.get(name=job.name)
+        
+        if job.state.name not in ("JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"):
+            raise RuntimeError(f"Gemini batch job {job.name} ended in {job.state.name}: {job.error}")
+        
+        replies = [""] * len(prompts)
+        for position, item in enumerate(job.dest.inlined_responses or []):
+            key = int((item.metadata or {}).get("key", position))
+            if item.response is not None:
+                replies[key] = (item.response.text or "").strip()
+        return replies
+
+
+class DiscoveryCache:
+    """SQLite cache of careers-page lookups and LLM-filtered job URLs.
+
+    Careers pages are keyed by the normalised company name; filtered URLs by
+    the careers URL plus the exact set of scraped links, so a changed page is
+    always re-filtered. Entries older than ``ttl_seconds`` are ignored.
+    """
+
+    def __init__(self, path: Path = DISCOVERY_CACHE_PATH, ttl_seconds: float = DISCOVERY_CACHE_TTL_SECONDS) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS careers (key TEXT PRIMARY KEY, url TEXT NOT NULL, ts REAL NOT NULL);
+            CREATE TABLE IF NOT EXISTS job_urls (key TEXT PRIMARY KEY, urls TEXT NOT NULL, ts REAL NOT NULL);
+            """
+        )
+
+    @staticmethod
+    def _company_key(company_name: str) -> str:
+        return hashlib.sha1(company_name.strip().lower().encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _links_key(careers_url: str, links: List[str]) -> str:
+        return hashlib.sha1("\n".join([careers_url, *sorted(links)]).encode("utf-8")).hexdigest()
+
+    def _get(self, table: str, column: str, key: str) -> str | None:
+        row = self._db.execute(
+            f"SELECT {column} FROM {table} WHERE key = ? AND ts >= ?",
+            (key, time.time() - self.ttl_seconds),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _put(self, table: str, column: str, key: str, value: str) -> None:
+        with self._db:
+            self._db.execute(
+                f"INSERT OR REPLACE INTO {table} (key, {column}, ts) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+
+    def get_careers_url(self, company_name: str) -> str | None:
+        return self._get("careers", "url", self._company_key(company_name))
+
+    def put_careers_url(self, company_name: str, url: str) -> None:
+        self._put("careers", "url", self._company_key(company_name), url)
+
+    def get_job_urls(self, careers_url: str, links: List[str]) -> List[str] | None:
+        cached = self._get("job_urls", "urls", self._links_key(careers_url, links))
+        return json.loads(cached) if cached is not None else None
+
+    def put_job_urls(self, careers_url: str, links: List[str], job_urls: List[str]) -> None:
+        self._put("job_urls", "urls", self._links_key(careers_url, links), json.dumps(job_urls))
+
+    def close(self) -> None:
+        self._db.close()
+
+
+# Paths that look like an individual posting: a jobs/positions/... segment,
+# a careers/<team>/<slug> path, or a long numeric id.
+_JOB_PATH_RE = re.compile(
+    r"/(?:jobs?|positions?|openings?|roles?|vacanc\w+)/[^/?#]+|/careers?/[^/?#]+/[^/?#]+|/\d{4,}(?:[/?#]|$)",
+    re.IGNORECASE,
+)
+# Applicant tracking systems that host postings off the company's own domain.
+ATS_DOMAINS = (
+    "greenhouse.io",
+    "lever.co",
+    "myworkdayjobs.com",
+    "workday.com",
+    "ashbyhq.com",
+    "smartrecruiters.com",
+)
+# Below this many rule-based candidates the rules are probably too strict for
+# the site, so the LLM sees every link instead.
+MIN_PREFILTER_CANDIDATES = 3
+# Coarse job hint applied while scraping; mirrored in extract_links_from_page's JS.
+_JOB_HINT_RE = re.compile(r"(job|position|career|vacanc|opening|role)", re.IGNORECASE)
+# A static page with fewer anchors than this is probably rendered client-side.
+MIN_STATIC_ANCHORS = 5
+# Markers of single-page apps whose links only exist after JavaScript runs.
+_JS_APP_MARKERS = ("__NEXT_DATA__", '<script src="/_next/', "window.__NUXT__", '<div id="root"></div>', '<div id="app"></div>')
+
+
+def _registered_domain(host: str) -> str:
+    """Approximate eTLD+1, e.g. ``jobs.example.co.uk`` -> ``example.co.uk``."""
+    labels = host.lower().split(".")
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in {"co", "com", "org", "net", "ac", "gov"}:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def prefilter_links(careers_url: str, links: List[str]) -> List[str]:
+    """Drop links that cannot be job postings before they reach the LLM.
+    
+    Keeps links on the careers page's own site or a known ATS whose path looks
+    like a posting, deduplicated ignoring fragments and trailing slashes. Falls
+    back to all (deduplicated) links when fewer than
+    ``MIN_PREFILTER_CANDIDATES`` survive.
+    """
+    site = _registered_domain(urlsplit(careers_url).hostname or "")
+    unique: Dict[str, str] = {}
+    for link in links:
+        parts = urlsplit(link)
+        key = f"{(parts.hostname or '').lower()}{parts.path.rstrip('/')}?{parts.query}"
+        unique.setdefault(key, link)
+    
+    candidates = []
+    for link in unique.values():
+        parts = urlsplit(link)
+        host = (parts.hostname or "").lower()
+        if _registered_domain(host) != site and not host.endswith(ATS_DOMAINS):
+            continue
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        if _JOB_PATH_RE.search(target):
+            candidates.append(link)
+    
+    if len(candidates) < MIN_PREFILTER_CANDIDATES:
+        return list(unique.values())
+    return candidates
+
+
+URL_LIST_SCHEMA = {"type": "ARRAY", "items": {"type": "STRING"}}
+
+
+def _max_output_tokens(link_count: int) -> int:
+    """Output budget for echoing back at most ``link_count`` URLs as JSON."""
+    return min(8192, 64 + 40 * link_count)
+
+
+def _batch_schema(count: int) -> dict:
+    """Response schema for a batch: one URL array per company number."""
+    keys = [str(index) for index in range(1, count + 1)]
+    return {
+        "type": "OBJECT",
+        "properties": {key: URL_LIST_SCHEMA for key in keys},
+        "required": keys,
+    }
+
+
+class BrowserPool:
+    """Fixed set of pre-launched headless Chromium browsers.
+
+    Browsers are launched once up front and handed out through a queue, so
+    tasks never pay the launch latency and the number of Chromium processes
+    stays capped at ``size`` however many companies are in flight. Callers
+    open a fresh ``BrowserContext`` per task on the browser they acquire.
+    """
+
+    def __init__(self, size: int = N_PARALLEL) -> None:
+        self.size = max(size, 1)
+        self._browsers: List[Browser] = []
+        self._queue: asyncio.Queue[Browser] = asyncio.Queue()
+
+    async def start(self, playwright) -> None:
+        self._browsers = list(await asyncio.gather(
+            *(playwright.chromium.launch(headless=True) for _ in range(self.size))
+        ))
+        for browser in self._browsers:
+            self._queue.put_nowait(browser)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Browser]:
+        browser = await self._queue.get()
+        try:
+            yield browser
+        finally:
+            self._queue.put_nowait(browser)
+
+    async def close(self) -> None:
+        await asyncio.gather(*(browser.close() for browser in self._browsers), return_exceptions=True)
+        self._browsers = []
+
+
+@asynccontextmanager
+async def browser_pool(size: int = N_PARALLEL) -> AsyncIterator[BrowserPool]:
+    """Start a :class:`BrowserPool` for one extraction run and close it afterwards."""
+    async with async_playwright() as p:
+        pool = BrowserPool(size)
+        try:
+            await pool.start(p)
+            yield pool
+        finally:
+            await pool.close()
+
+
+def _select_job_links(links: List[str]) -> List[str]:
+    """Dedupe links and keep job-looking ones, or all of them if too few match."""
+    unique = list(dict.fromkeys(link for link in links if link.startswith("http")))
+    jobs = [link for link in unique if _JOB_HINT_RE.search(link)]
+    return jobs if len(jobs) >= MIN_PREFILTER_CANDIDATES else unique
+
+
+def _anchor_hrefs(html: str, base_url: str) -> List[str]:
+    """Absolute hrefs of every anchor in ``html``, resolved like ``a.href`` in a browser."""
+    soup = BeautifulSoup(html, "html.parser")
+    return [urljoin(base_url, anchor["href"].strip()) for anchor in soup.find_all("a", href=True)]
+
+
+async def extract_links_fast(url: str, timeout: int = 60000) -> List[str] | None:
+    """Extract links from a careers page's static HTML without a browser.
+    
+    Returns None when the page needs JavaScript to render its links (few
+    anchors, or single-page-app markers) or cannot be fetched statically, so
+    the caller can fall back to Playwright.
+    """
+    try:
+        async with httpx.AsyncClient(
+            timeout=timeout / 1000,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT}
+        ) as client:
+            response = await client.get(url)
+    except httpx.HTTPError as exc:
+        logger.debug(f"Static fetch failed for {url}: {exc}")
+        return None
+    
+    if response.status_code >= 400 or "html" not in response.headers.get("content-type", ""):
+        return None
+    html = response.text
+    if any(marker in html for marker in _JS_APP_MARKERS):
+        logger.debug(f"{url} looks client-rendered, using Playwright")
+        return None
+    
+    hrefs = _anchor_hrefs(html, str(response.url))
+    if len(set(hrefs)) < MIN_STATIC_ANCHORS:
+        return None
+    return _select_job_links(hrefs)
+
+
+async def _abort_heavy_requests(route: Route) -> None:
+    request = route.request
+    host = (urlsplit(request.url).hostname or "").lower()
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or host.endswith(TRACKER_DOMAINS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _new_scraping_context(browser: Browser, **options) -> BrowserContext:
+    """Open a context that skips images, fonts, media, stylesheets and trackers.
+    
+    Only for link extraction; the Google results scrape needs CSS for its
+    selectors and uses a plain context.
+    """
+    context = await browser.new_context(**options)
+    await context.route("**/*", _abort_heavy_requests)
+    return context
+
 
-def _strip_code_fence(text: str) -> str:
-    """Remove markdown code fences from LLM response."""
-    stripped = text.strip()
-    if stripped.startswith("```"):
-        lines = stripped.splitlines()
-        if lines and lines[0].startswith("```"):
-            lines = lines[1:]
-        if lines and lines[-1].startswith("```"):
-            lines = lines[:-1]
-        stripped = "\n".join(lines).strip()
-    return stripped
+async def _wait_for_links(page, min_anchors: int, timeout: int = 10000) -> None:
+    """Wait until the document has loaded and rendered at least ``min_anchors`` links.
+    
+    Returns quietly on timeout: sparse pages simply get scraped as they are.
+    """
+    try:
+        await page.wait_for_function(
+            "(minAnchors) => document.readyState === 'complete'"
+            " && document.querySelectorAll('a[href]').length >= minAnchors",
+            arg=min_anchors,
+            timeout=timeout,
+        )
+    except PlaywrightTimeoutError:
+        logger.debug(f"Only partial links rendered on {page.url} after {timeout}ms")
 
 
-async def extract_links_from_page(url: str, timeout: int = 60000) -> List[str]:
-    """Extract all links from a page using Playwright.
+async def extract_links_from_page(browser: Browser, url: str, timeout: int = 60000) -> List[str]:
+    """Extract all links from a page, using Playwright only when needed.
+    
+    Static pages are fetched with httpx and parsed directly; pages that render
+    their links client-side are loaded in Playwright.
     
     Args:
+        browser: Browser acquired from the run's :class:`BrowserPool`
         url: The careers page URL to scrape
         timeout: Timeout in milliseconds
         
@@ -139,50 +558,54 @@ async def extract_links_from_page(url: str, timeout: int = 60000) -> List[str]:
     """
     logger.info(f"Extracting links from {url}")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        try:
-            page = await browser.new_page()
-            await page.goto(url, timeout=timeout, wait_until="networkidle")
-            
-            # Wait a bit for any dynamic content to load
-            await page.wait_for_timeout(3000)
-            
-            # Extract all links
-            links = await page.evaluate("""
-                () => {
-                    const anchors = Array.from(document.querySelectorAll('a[href]'));
-                    return anchors
-                        .map(a => a.href)
-                        .filter(href => href && href.startsWith('http'));
+    links = await extract_links_fast(url, timeout=timeout)
+    if links is not None:
+        logger.info(f"Extracted {len(links)} unique links from static HTML of {url}")
+        return links
+    
+    context = await _new_scraping_context(browser)
+    try:
+        page = await context.new_page()
+        await page.goto(url, timeout=timeout, wait_until="domcontentloaded")
+        
+        # Wait for client-rendered listings rather than for the network to go idle
+        await _wait_for_links(page, min_anchors=10)
+        
+        # Dedupe and keep job-looking links inside the page so only the
+        # candidates cross the CDP connection; fall back to every link when
+        # the heuristic finds too few.
+        links = await page.evaluate("""
+            (minCandidates) => {
+                const all = new Set();
+                const jobs = new Set();
+                for (const a of document.querySelectorAll('a[href]')) {
+                    const href = a.href;
+                    if (!href || !href.startsWith('http') || all.has(href)) continue;
+                    all.add(href);
+                    if (/(job|position|career|vacanc|opening|role)/i.test(href)) jobs.add(href);
                 }
-            """)
-            
-            # Remove duplicates while preserving order
-            unique_links = []
-            seen = set()
-            for link in links:
-                if link not in seen:
-                    seen.add(link)
-                    unique_links.append(link)
-            
-            logger.info(f"Extracted {len(unique_links)} unique links from {url}")
-            return unique_links
-            
-        except PlaywrightTimeoutError:
-            logger.error(f"Timeout while loading {url}")
-            raise
-        except Exception as exc:
-            logger.error(f"Error extracting links from {url}: {exc}")
-            raise
-        finally:
-            await browser.close()
+                return [...(jobs.size >= minCandidates ? jobs : all)];
+            }
+        """, MIN_PREFILTER_CANDIDATES)
+        
+        logger.info(f"Extracted {len(links)} unique links from {url}")
+        return links
+        
+    except PlaywrightTimeoutError:
+        logger.error(f"Timeout while loading {url}")
+        raise
+    except Exception as exc:
+        logger.error(f"Error extracting links from {url}: {exc}")
+        raise
+    finally:
+        await context.close()
 
 
-async def search_google_with_playwright(query: str, max_results: int = 10) -> List[dict]:
+async def search_google_with_playwright(browser: Browser, query: str, max_results: int = 10) -> List[dict]:
     """Search Google using Playwright to scrape search results.
     
     Args:
+        browser: Browser acquired from the run's :class:`BrowserPool`
         query: Search query
         max_results: Maximum number of results to return
         
@@ -191,84 +614,174 @@ async def search_google_with_playwright(query: str, max_results: int = 10) -> Li
     """
     logger.info(f"Searching Google with Playwright for: {query}")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
+    # Create context with realistic user agent
+    context = await browser.new_context(
+        user_agent=USER_AGENT,
+        viewport={"width": 1920, "height": 1080},
+        locale="en-US"
+    )
+    try:
+        page = await context.new_page()
+        
+        # Go to Google
+        search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
+        await page.goto(search_url, timeout=30000, wait_until="domcontentloaded")
+        
+        # Wait for search results to load
         try:
-            # Create context with realistic user agent
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                viewport={"width": 1920, "height": 1080},
-                locale="en-US"
-            )
-            page = await context.new_page()
-            
-            # Go to Google
-            search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
-            await page.goto(search_url, timeout=30000, wait_until="domcontentloaded")
-            
-            # Wait for search results to load
-            await page.wait_for_timeout(2000)
-            
-            # Take a screenshot for debugging (optional)
-            # await page.screenshot(path=f"/tmp/google_search_{query[:20]}.png")
-            
-            # Get page HTML for debugging
-            html = await page.content()
-            if "detected unusual traffic" in html.lower() or "captcha" in html.lower():
-                logger.warning("Google detected bot traffic or showing CAPTCHA")
-            
-            # Extract search results
-            results = await page.evaluate("""
-                () => {
-                    const items = [];
-                    // Try multiple selectors for different Google layouts
-                    const searchResults = document.querySelectorAll('div.g, div[data-sokoban-container], div.Gx5Zad');
+            await page.wait_for_selector("div.g, h3", timeout=5000)
+        except PlaywrightTimeoutError:
+            logger.debug("No Google result blocks appeared within 5s")
+        
+        # Take a screenshot for debugging (optional)
+        # await page.screenshot(path=f"/tmp/google_search_{query[:20]}.png")
+        
+        # Check for a CAPTCHA in the page rather than copying the whole DOM out
+        is_captcha = await page.evaluate("""
+            () => !!document.querySelector('form#captcha-form, #recaptcha, iframe[src*="recaptcha"]')
+                || /unusual traffic|captcha/i.test((document.body?.innerText || '').slice(0, 4000))
+        """)
+        if is_captcha:
+            logger.warning("Google detected bot traffic or showing CAPTCHA")
+        
+        # Extract search results
+        results = await page.evaluate("""
+            () => {
+                const items = [];
+                // Try multiple selectors for different Google layouts
+                const searchResults = document.querySelectorAll('div.g, div[data-sokoban-container], div.Gx5Zad');
+                
+                for (const result of searchResults) {
+                    // Find the link
+                    const link = result.querySelector('a[href^="http"]');
+                    if (!link) continue;
                     
-                    for (const result of searchResults) {
-                        // Find the link
-                        const link = result.querySelector('a[href^="http"]');
-                        if (!link) continue;
-                        
-                        const url = link.href;
-                        if (!url || url.includes('google.com')) continue;
-                        
-                        // Find title (h3)
-                        const titleElem = result.querySelector('h3');
-                        const title = titleElem ? titleElem.textContent : '';
-                        
-                        // Find snippet/description
-                        const snippetElem = result.querySelector('div[data-snf], div[style*="line-clamp"], .VwiC3b, .lyLwlc');
-                        const snippet = snippetElem ? snippetElem.textContent : '';
-                        
-                        if (url && title) {
-                            items.push({
-                                url: url,
-                                title: title,
-                                snippet: snippet || '',
-                                source: 'google_playwright'
-                            });
-                        }
-                    }
+                    const url = link.href;
+                    if (!url || url.includes('google.com')) continue;
+                    
+                    // Find title (h3)
+                    const titleElem = result.querySelector('h3');
+                    const title = titleElem ? titleElem.textContent : '';
+                    
+                    // Find snippet/description
+                    const snippetElem = result.querySelector('div[data-snf], div[style*="line-clamp"], .VwiC3b, .lyLwlc');
+                    const snippet = snippetElem ? snippetElem.textContent : '';
                     
-                    return items;
+                    if (url && title) {
+                        items.push({
+                            url: url,
+                            title: title,
+                            snippet: snippet || '',
+                            source: 'google_playwright'
+                        });
+                    }
                 }
-            """)
-            
-            logger.info(f"Scraped {len(results)} results from Google")
-            return results[:max_results]
-            
-        except Exception as exc:
-            logger.error(f"Error searching Google with Playwright: {exc}")
+                
+                return items;
+            }
+        """)
+        
+        logger.info(f"Scraped {len(results)} results from Google")
+        return results[:max_results]
+        
+    except Exception as exc:
+        logger.error(f"Error searching Google with Playwright: {exc}")
+        return []
+    finally:
+        await context.close()
+
+
+async def _probe_page(context: BrowserContext, site_url: str) -> List[str]:
+    """Load a company homepage and return the links that mention careers or jobs."""
+    page = await context.new_page()
+    try:
+        response = await page.goto(site_url, timeout=15000, wait_until="domcontentloaded")
+        
+        if not response or response.status >= 400:
+            logger.debug(f"Site {site_url} returned error status: {response.status if response else 'no response'}")
             return []
-        finally:
-            await context.close()
-            await browser.close()
+        
+        # Wait for JavaScript-rendered navigation links
+        await _wait_for_links(page, min_anchors=1, timeout=5000)
+        
+        # Extract all links from the page (including text content)
+        links = await page.evaluate("""
+            () => {
+                const anchors = Array.from(document.querySelectorAll('a[href]'));
+                const results = [];
+                
+                for (const anchor of anchors) {
+                    const href = anchor.href;
+                    const text = (anchor.textContent || '').toLowerCase();
+                    
+                    // Check if the link or its text mentions careers/jobs
+                    if (href && (
+                        href.toLowerCase().includes('career') || 
+                        href.toLowerCase().includes('job') || 
+                        href.toLowerCase().includes('work-with-us') ||
+                        href.toLowerCase().includes('opportunities') ||
+                        text.includes('career') || 
+                        text.includes('job') ||
+                        text.includes('work with us') ||
+                        text.includes('join')
+                    )) {
+                        results.push(href);
+                    }
+                }
+                
+                return results;
+            }
+        """)
+        
+        if links:
+            logger.info(f"Found {len(links)} potential careers links on {site_url}")
+        else:
+            logger.debug(f"No careers links found on {site_url}")
+        return links
+    except Exception as exc:
+        logger.debug(f"Could not access {site_url}: {exc}")
+        return []
+    finally:
+        await page.close()
+
+
+# Statuses that say "not for this client" rather than "no such page": HEAD refused,
+# or a bot wall (Cloudflare, Akamai) that lets a real browser through.
+_BROWSER_MAY_LOAD_STATUSES = frozenset({401, 403, 405, 429})
 
 
-async def scrape_company_website_for_careers(company_name: str) -> List[str]:
+async def _reachable_sites(urls: List[str]) -> List[str]:
+    """HEAD every candidate URL in parallel and keep those that respond, in input order.
+    
+    Sites answering with a bot-wall status are kept so the browser gets to try them.
+    """
+    async with httpx.AsyncClient(
+        timeout=5,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT}
+    ) as client:
+        responses = await asyncio.gather(*(client.head(url) for url in urls), return_exceptions=True)
+    reachable = []
+    for url, response in zip(urls, responses):
+        if isinstance(response, Exception):
+            logger.debug(f"Could not access {url}: {response}")
+        elif response.status_code < 400 or response.status_code in _BROWSER_MAY_LOAD_STATUSES:
+            reachable.append(url)
+        else:
+            logger.debug(f"Site {url} returned error status: {response.status_code}")
+    return reachable
+
+
+async def scrape_company_website_for_careers(browser: Browser, company_name: str) -> List[str]:
     """Scrape the company's main website to find careers page links.
     
+    All candidate URLs are checked with a parallel HEAD sweep first. The
+    highest-priority direct careers URL that responds is returned without
+    opening a page; otherwise the reachable homepages are loaded in parallel
+    and the first one to yield careers links wins.
+    
     Args:
+        browser: Browser acquired from the run's :class:`BrowserPool`
         company_name: Name of the company
         
     Returns:
@@ -301,115 +814,76 @@ async def scrape_company_website_for_careers(company_name: str) -> List[str]:
         f"https://{company_slug}.net",
     ]
     
-    potential_sites = direct_careers_urls + main_websites
+    reachable = await _reachable_sites(direct_careers_urls + main_websites)
     
-    careers_links = []
+    # A direct careers URL that responds is the answer on its own
+    for site_url in reachable:
+        if site_url in direct_careers_urls:
+            logger.info(f"Found direct careers page: {site_url}")
+            return [site_url]
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-        
-        try:
-            for site_url in potential_sites:
-                try:
-                    page = await context.new_page()
-                    response = await page.goto(site_url, timeout=15000, wait_until="domcontentloaded")
-                    
-                    if not response or response.status >= 400:
-                        logger.debug(f"Site {site_url} returned error status: {response.status if response else 'no response'}")
-                        await page.close()
-                        continue
-                    
-                    # Wait a bit more for JavaScript to load
-                    await page.wait_for_timeout(2000)
-                    
-                    # Check if this URL itself is a careers page (direct hit)
-                    is_careers_page = any(pattern in site_url.lower() for pattern in ['/careers', '/jobs', 'careers.', 'jobs.'])
-                    
-                    if is_careers_page:
-                        # This is likely a direct careers page - return it immediately
-                        logger.info(f"Found direct careers page: {site_url}")
-                        careers_links.append(site_url)
-                        await page.close()
-                        break
-                    
-                    # Otherwise, extract all links from the page (including text content)
-                    links = await page.evaluate("""
-                        () => {
-                            const anchors = Array.from(document.querySelectorAll('a[href]'));
-                            const results = [];
-                            
-                            for (const anchor of anchors) {
-                                const href = anchor.href;
-                                const text = (anchor.textContent || '').toLowerCase();
-                                
-                                // Check if the link or its text mentions careers/jobs
-                                if (href && (
-                                    href.toLowerCase().includes('career') || 
-                                    href.toLowerCase().includes('job') || 
-                                    href.toLowerCase().includes('work-with-us') ||
-                                    href.toLowerCase().includes('opportunities') ||
-                                    text.includes('career') || 
-                                    text.includes('job') ||
-                                    text.includes('work with us') ||
-                                    text.includes('join')
-                                )) {
-                                    results.push(href);
-                                }
-                            }
-                            
-                            return results;
-                        }
-                    """)
-                    
-                    if links:
-                        logger.info(f"Found {len(links)} potential careers links on {site_url}")
-                        careers_links.extend(links)
-                        await page.close()
-                        break  # Found the website, stop trying other URLs
-                    else:
-                        logger.debug(f"No careers links found on {site_url}, trying next...")
-                    
-                    await page.close()
-                    
-                except Exception as exc:
-                    logger.debug(f"Could not access {site_url}: {exc}")
-                    continue
-                    
-        finally:
-            await context.close()
-            await browser.close()
+    homepages = [site_url for site_url in reachable if site_url in main_websites]
+    if not homepages:
+        logger.info(f"Found 0 unique careers links for {company_name}")
+        return []
+    
+    careers_links: List[str] = []
+    context = await _new_scraping_context(browser, user_agent=USER_AGENT)
+    pending = {asyncio.create_task(_probe_page(context, site_url)) for site_url in homepages}
+    try:
+        while pending and not careers_links:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.result():
+                    careers_links = task.result()
+                    break
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await context.close()
     
-    # Deduplicate and return
-    unique_links = list(set(careers_links))
+    # Deduplicate, keeping page order, and return
+    unique_links = list(dict.fromkeys(careers_links))
     logger.info(f"Found {len(unique_links)} unique careers links for {company_name}")
     return unique_links
 
 
-async def search_for_careers_page(company_name: str, llm: GeminiClient) -> str | None:
+async def search_for_careers_page(
+    company_name: str,
+    llm: GeminiClient,
+    browser: Browser,
+    cache: DiscoveryCache | None = None
+) -> str | None:
     """Search for a company's careers page using multiple strategies.
     
     Strategy order:
     1. Scrape company website directly for careers links
-    2. Try Playwright-based Google search
-    3. Fallback to API-based searches (Google, DuckDuckGo)
+    2. HTTP searches (Google, then DuckDuckGo)
+    3. Playwright-based Google search, only with PLAYWRIGHT_GOOGLE_FALLBACK=1
     
     Args:
         company_name: Name of the company
         llm: LLM client for selecting best URL
+        browser: Browser acquired from the run's :class:`BrowserPool`
+        cache: Optional discovery cache checked before any search runs
         
     Returns:
         Careers page URL or None if not found
     """
+    if cache is not None:
+        cached_url = cache.get_careers_url(company_name)
+        if cached_url:
+            logger.info(f"Using cached careers page for {company_name}: {cached_url}")
+            return cached_url
+    
     logger.info(f"Searching for careers page for {company_name}")
     
     search_results = []
     
     # Strategy 1: Scrape company website directly for careers links
     try:
-        careers_links = await scrape_company_website_for_careers(company_name)
+        careers_links = await scrape_company_website_for_careers(browser, company_name)
         if careers_links:
             # Convert to search result format
             search_results = [
@@ -425,22 +899,14 @@ async def search_for_careers_page(company_name: str, llm: GeminiClient) -> str |
     except Exception as exc:
         logger.warning(f"Could not scrape company website for {company_name}: {exc}")
     
-    # Strategy 2: Try Playwright-based Google search (if website scraping found nothing)
-    if not search_results:
-        search_query = f"{company_name} careers jobs"
-        try:
-            search_results = await search_google_with_playwright(search_query, max_results=10)
-            if search_results:
-                logger.info(f"Found {len(search_results)} results from Google (Playwright) for {company_name}")
-        except Exception as exc:
-            logger.warning(f"Playwright Google search failed for {company_name}: {exc}")
+    search_query = f"{company_name} careers jobs"
     
-    # Strategy 3: Fallback to API-based searches
+    # Strategy 2: HTTP searches (if website scraping found nothing). The
+    # helpers are blocking, so they run off the event loop.
     if not search_results:
-        search_query = f"{company_name} careers jobs"
         try:
             logger.info(f"Trying API-based Google search for {company_name}")
-            search_results = google_search(search_query, max_results=10, debug=False)
+            search_results = await asyncio.to_thread(google_search, search_query, max_results=10, debug=False)
             if search_results:
                 logger.info(f"Found {len(search_results)} results from Google API for {company_name}")
         except Exception as exc:
@@ -449,24 +915,35 @@ async def search_for_careers_page(company_name: str, llm: GeminiClient) -> str |
     if not search_results:
         try:
             logger.info(f"Trying DuckDuckGo search for {company_name}")
-            search_results = duckduckgo_search(search_query, max_results=10, debug=False)
+            search_results = await asyncio.to_thread(duckduckgo_search, search_query, max_results=10, debug=False)
             if search_results:
                 logger.info(f"Found {len(search_results)} results from DuckDuckGo for {company_name}")
         except Exception as exc:
             logger.warning(f"DuckDuckGo search failed for {company_name}: {exc}")
     
+    # Strategy 3: Last-resort Playwright-based Google search
+    if not search_results and PLAYWRIGHT_GOOGLE_FALLBACK:
+        try:
+            search_results = await search_google_with_playwright(browser, search_query, max_results=10)
+            if search_results:
+                logger.info(f"Found {len(search_results)} results from Google (Playwright) for {company_name}")
+        except Exception as exc:
+            logger.warning(f"Playwright Google search failed for {company_name}: {exc}")
+    
     if not search_results:
         logger.error(f"All search strategies failed for {company_name}")
         return None
     
     # Use LLM to select the best careers page
     try:
-        selection = choose_careers_page(search_results, llm)
+        selection = await asyncio.to_thread(choose_careers_page, search_results, llm)
         chosen_url = selection.get("chosen_url")
         confidence = selection.get("confidence", "unknown")
         
         if chosen_url:
             logger.info(f"Selected careers page for {company_name}: {chosen_url} (confidence: {confidence})")
+            if cache is not None:
+                cache.put_careers_url(company_name, chosen_url)
             return chosen_url
         else:
             logger.error(f"LLM did not return a careers URL for {company_name}")
@@ -477,6 +954,23 @@ async def search_for_careers_page(company_name: str, llm: GeminiClient) -> str |
         return None
 
 
+def _mock_job_urls(company_name: str) -> List[str] | None:
+    mock_urls = get_mock_response("job_url_extractor", metadata={"company": company_name})
+    if not mock_urls:
+        return None
+    logger.info("Using mock job URLs for %s", company_name)
+    if isinstance(mock_urls, str):
+        return [mock_urls]
+    if isinstance(mock_urls, list):
+        return [str(url) for url in mock_urls]
+    logger.warning(
+        "Unexpected mock job URL payload for %s (type=%s)",
+        company_name,
+        type(mock_urls).__name__,
+    )
+    return []
+
+
 def filter_job_urls_with_llm(
     company_name: str,
     careers_url: str,
@@ -497,24 +991,15 @@ def filter_job_urls_with_llm(
     if not all_links:
         return []
     
-    mock_urls = get_mock_response("job_url_extractor", metadata={"company": company_name})
-    if mock_urls:
-        logger.info("Using mock job URLs for %s", company_name)
-        if isinstance(mock_urls, str):
-            return [mock_urls]
-        if isinstance(mock_urls, list):
-            return [str(url) for url in mock_urls]
-        logger.warning(
-            "Unexpected mock job URL payload for %s (type=%s)",
-            company_name,
-            type(mock_urls).__name__,
-        )
-        return []
+    mock_urls = _mock_job_urls(company_name)
+    if mock_urls is not None:
+        return mock_urls
 
-    logger.info(f"Filtering {len(all_links)} links for {company_name} using LLM")
+    candidates = prefilter_links(careers_url, all_links)
+    logger.info(f"Filtering {len(candidates)}/{len(all_links)} links for {company_name} using LLM")
     
     # Format links as JSON for the prompt
-    links_json = json.dumps(all_links, indent=2)
+    links_json = json.dumps(candidates, indent=2)
     
     prompt = FILTER_PROMPT.format(
         company_name=company_name,
@@ -523,12 +1008,16 @@ def filter_job_urls_with_llm(
     )
     
     try:
-        response = llm.complete(prompt, temperature=0.0)
-        cleaned = _strip_code_fence(response)
-        job_urls = json.loads(cleaned)
+        response = llm.complete(
+            prompt,
+            temperature=0.0,
+            response_schema=URL_LIST_SCHEMA,
+            max_output_tokens=_max_output_tokens(len(candidates))
+        )
+        job_urls = json.loads(response)
         
         if not isinstance(job_urls, list):
-            logger.error(f"LLM returned non-list response: {cleaned}")
+            logger.error(f"LLM returned non-list response: {response}")
             return []
         
         logger.info(f"LLM identified {len(job_urls)} job posting URLs for {company_name}")
@@ -542,20 +1031,123 @@ def filter_job_urls_with_llm(
         return []
 
 
-async def extract_job_urls_for_company(
+def filter_job_urls_batch(
+    llm: GeminiClient,
+    items: List[Tuple[str, str, List[str]]]
+) -> List[List[str]]:
+    """Filter job posting URLs for several companies with a single LLM call.
+    
+    The shared filtering instructions are sent once per batch instead of once
+    per company. If the batched response cannot be parsed, each company is
+    retried individually with :func:`filter_job_urls_with_llm`.
+    
+    Args:
+        llm: LLM client for filtering
+        items: ``(company_name, careers_url, all_links)`` tuples
+        
+    Returns:
+        One list of job posting URLs per item, in input order
+    """
+    if len(items) <= 1:
+        return [filter_job_urls_with_llm(name, url, links, llm) for name, url, links in items]
+    
+    mocked = [_mock_job_urls(name) for name, _, _ in items]
+    if all(urls is not None for urls in mocked):
+        return mocked
+    
+    logger.info(f"Filtering links for {len(items)} companies in one LLM call")
+    prompt, schema, max_tokens = _batch_filter_request(items)
+    try:
+        response = llm.complete(prompt, temperature=0.0, response_schema=schema, max_output_tokens=max_tokens)
+        return _parse_batch_filter_reply(items, response)
+    except Exception as exc:
+        logger.error(f"Batched URL filtering failed, falling back to per-company calls: {exc}")
+        return [filter_job_urls_with_llm(name, url, links, llm) for name, url, links in items]
+
+
+def _batch_filter_request(items: List[Tuple[str, str, List[str]]]) -> Tuple[str, dict, int]:
+    """Build the prompt, response schema and output budget for one filter batch."""
+    candidates = [prefilter_links(url, links) for _, url, links in items]
+    blocks = "\n\n".join(
+        FILTER_BATCH_BLOCK.format(
+            index=index,
+            company_name=name,
+            careers_url=url,
+            all_links=json.dumps(links, indent=2)
+        )
+        for index, ((name, url, _), links) in enumerate(zip(items, candidates), start=1)
+    )
+    max_tokens = _max_output_tokens(sum(len(links) for links in candidates) + 2 * len(items))
+    return FILTER_BATCH_PROMPT.format(company_blocks=blocks), _batch_schema(len(items)), max_tokens
+
+
+def _parse_batch_filter_reply(items: List[Tuple[str, str, List[str]]], response: str) -> List[List[str]]:
+    payload = json.loads(response)
+    if not isinstance(payload, dict):
+        raise ValueError(f"expected a JSON object, got {type(payload).__name__}")
+    
+    results: List[List[str]] = []
+    for index, (name, _, _) in enumerate(items, start=1):
+        urls = payload.get(str(index))
+        job_urls = [url for url in urls if isinstance(url, str)] if isinstance(urls, list) else []
+        logger.info(f"LLM identified {len(job_urls)} job posting URLs for {name}")
+        results.append(job_urls)
+    return results
+
+
+def filter_job_urls_with_batch_api(
+    llm: GeminiClient,
+    batches: List[List[Tuple[str, str, List[str]]]]
+) -> List[List[List[str]]]:
+    """Filter many company batches through a single Gemini Batch API job.
+    
+    Each batch becomes one request built exactly like
+    :func:`filter_job_urls_batch`. Batches whose reply is missing or invalid
+    are re-run live with :func:`filter_job_urls_batch`.
+    
+    Args:
+        llm: LLM client for filtering
+        batches: Groups of ``(company_name, careers_url, all_links)`` tuples
+        
+    Returns:
+        For each batch, one list of job posting URLs per item, in input order
+    """
+    requests_ = [_batch_filter_request(items) for items in batches]
+    replies = llm.complete_batch(
+        [prompt for prompt, _, _ in requests_],
+        temperature=0.0,
+        response_schemas=[schema for _, schema, _ in requests_],
+        max_output_tokens=[max_tokens for _, _, max_tokens in requests_]
+    )
+    
+    results: List[List[List[str]]] = []
+    for items, reply in zip(batches, replies):
+        try:
+            results.append(_parse_batch_filter_reply(items, reply))
+        except ValueError as exc:
+            logger.warning(f"Batch API reply unusable for {len(items)} companies, filtering live: {exc}")
+            results.append(filter_job_urls_batch(llm, items))
+    return results
+
+
+async def collect_company_links(
     company: CompanyInfo,
     llm: GeminiClient,
-    timeout: int = 60000
-) -> ExtractionResult:
-    """Extract job posting URLs for a single company.
+    browser: Browser,
+    timeout: int = 60000,
+    cache: DiscoveryCache | None = None
+) -> ExtractionResult | PageLinks:
+    """Find a company's careers page and scrape its links.
     
     Args:
         company: Company information
-        llm: LLM client for filtering
+        llm: LLM client for picking a careers page when none is given
+        browser: Browser acquired from the run's :class:`BrowserPool`
         timeout: Timeout in milliseconds
+        cache: Optional discovery cache for the careers page lookup
         
     Returns:
-        Extraction result with job URLs or error
+        The scraped links, or a final extraction result when scraping failed
     """
     logger.info(f"Processing {company.name}")
     
@@ -563,7 +1155,7 @@ async def extract_job_urls_for_company(
     careers_url = company.careers_url
     if not careers_url:
         logger.info(f"No careers URL provided for {company.name}, searching...")
-        careers_url = await search_for_careers_page(company.name, llm)
+        careers_url = await search_for_careers_page(company.name, llm, browser, cache)
         
         if not careers_url:
             error_msg = f"Could not find careers page for {company.name}"
@@ -578,7 +1170,7 @@ async def extract_job_urls_for_company(
     
     try:
         # Extract all links from the careers page
-        all_links = await extract_links_from_page(careers_url, timeout=timeout)
+        all_links = await extract_links_from_page(browser, careers_url, timeout=timeout)
         
         if not all_links:
             logger.warning(f"No links found on {careers_url}")
@@ -590,31 +1182,7 @@ async def extract_job_urls_for_company(
                 error="No links found on the page"
             )
         
-        # Filter for job posting URLs using LLM
-        job_urls = filter_job_urls_with_llm(
-            company.name,
-            careers_url,
-            all_links,
-            llm
-        )
-        
-        if not job_urls:
-            logger.warning(f"No job URLs identified for {company.name}")
-            return ExtractionResult(
-                company=company.name,
-                careers_url=careers_url,
-                job_urls=[],
-                status="no_jobs",
-                error="No job posting URLs identified"
-            )
-        
-        logger.info(f"Successfully extracted {len(job_urls)} job URLs for {company.name}")
-        return ExtractionResult(
-            company=company.name,
-            careers_url=careers_url,
-            job_urls=job_urls,
-            status="success"
-        )
+        return PageLinks(company=company.name, careers_url=careers_url, links=all_links)
         
     except PlaywrightTimeoutError:
         error_msg = f"Timeout loading page: {careers_url}"
@@ -638,44 +1206,236 @@ async def extract_job_urls_for_company(
         )
 
 
-def read_companies_csv(csv_path: Path) -> List[CompanyInfo]:
-    """Read companies and their careers URLs from CSV.
+def _filtered_result(page: PageLinks, job_urls: List[str]) -> ExtractionResult:
+    if not job_urls:
+        logger.warning(f"No job URLs identified for {page.company}")
+        return ExtractionResult(
+            company=page.company,
+            careers_url=page.careers_url,
+            job_urls=[],
+            status="no_jobs",
+            error="No job posting URLs identified"
+        )
+    
+    logger.info(f"Successfully extracted {len(job_urls)} job URLs for {page.company}")
+    return ExtractionResult(
+        company=page.company,
+        careers_url=page.careers_url,
+        job_urls=job_urls,
+        status="success"
+    )
+
+
+async def extract_job_urls_for_company(
+    company: CompanyInfo,
+    llm: GeminiClient,
+    browser: Browser,
+    timeout: int = 60000,
+    cache: DiscoveryCache | None = None
+) -> ExtractionResult:
+    """Extract job posting URLs for a single company.
     
     Args:
-        csv_path: Path to CSV file with Name,url format (with or without headers)
+        company: Company information
+        llm: LLM client for filtering
+        browser: Browser acquired from the run's :class:`BrowserPool`
+        timeout: Timeout in milliseconds
+        cache: Optional discovery cache for careers pages and filtered URLs
         
     Returns:
-        List of CompanyInfo objects
+        Extraction result with job URLs or error
     """
-    companies = []
+    collected = await collect_company_links(company, llm, browser, timeout=timeout, cache=cache)
+    if isinstance(collected, ExtractionResult):
+        return collected
     
+    job_urls = cache.get_job_urls(collected.careers_url, collected.links) if cache is not None else None
+    if job_urls is None:
+        # Filter for job posting URLs using LLM
+        job_urls = await asyncio.to_thread(
+            filter_job_urls_with_llm, collected.company, collected.careers_url, collected.links, llm
+        )
+        if cache is not None and job_urls:
+            cache.put_job_urls(collected.careers_url, collected.links, job_urls)
+    return _filtered_result(collected, job_urls)
+
+
+def _company_columns(first_row: List[str]) -> Tuple[int, int | None] | None:
+    """Return ``(name_col, url_col)`` if ``first_row`` is a header row, else None."""
+    lowered = [cell.strip().lower() for cell in first_row]
+    if len(lowered) < 2 or lowered[0] not in ("name", "company"):
+        return None
+    name_col = lowered.index("name") if "name" in lowered else lowered.index("company")
+    url_col = lowered.index("url") if "url" in lowered else None
+    return name_col, url_col
+
+
+def read_companies_csv(csv_path: Path) -> Iterator[CompanyInfo]:
+    """Read companies and their careers URLs from CSV.
+    
+    The file is parsed in a single pass and companies are yielded as they are
+    read.
+    
+    Args:
+        csv_path: Path to CSV file with Name,url format (with or without headers)
+        
+    Yields:
+        CompanyInfo objects
+    """
     with csv_path.open(newline="", encoding="utf-8") as handle:
-        # Try to detect if file has headers
-        first_line = handle.readline().strip()
-        handle.seek(0)
-        
-        # If first line looks like headers (contains 'name' or 'url' case-insensitive), use DictReader
-        if first_line.lower().startswith(('name,', 'company,')):
-            reader = csv.DictReader(handle)
-            for row in reader:
-                name = row.get("Name") or row.get("name") or row.get("Company") or row.get("company")
-                url = row.get("url") or row.get("URL") or row.get("Url")
-                
-                if name:
-                    name = name.strip()
-                    url = url.strip() if url else None
-                    companies.append(CompanyInfo(name=name, careers_url=url))
-        else:
+        reader = csv.reader(handle)
+        first_row = next(reader, None)
+        if first_row is None:
+            return
+        
+        columns = _company_columns(first_row)
+        if columns is None:
             # No headers, assume first column is name, second is URL
-            reader = csv.reader(handle)
-            for row in reader:
-                if len(row) >= 2:
-                    name = row[0].strip()
-                    url = row[1].strip() if row[1].strip() else None
-                    if name:
-                        companies.append(CompanyInfo(name=name, careers_url=url))
+            name_col, url_col = 0, 1
+            rows = itertools.chain([first_row], reader)
+        else:
+            name_col, url_col = columns
+            rows = reader
+        
+        for row in rows:
+            if columns is None and len(row) < 2:
+                continue
+            name = row[name_col].strip() if len(row) > name_col else ""
+            url = row[url_col].strip() if url_col is not None and len(row) > url_col else ""
+            if name:
+                yield CompanyInfo(name=name, careers_url=url or None)
+
+
+def write_back_careers_urls(
+    companies_csv: Path,
+    companies: List[CompanyInfo],
+    results: List[ExtractionResult]
+) -> int:
+    """Fill blank careers URLs in the companies CSV with ones discovered this run.
+    
+    Only companies whose extraction succeeded are written, so a wrong page
+    found on a failed or empty run is never made permanent. Later runs then
+    skip the search for those companies. Every other cell,
+    column and row is preserved; the file is replaced atomically.
+    
+    Args:
+        companies_csv: The CSV the companies were read from
+        companies: Companies as read from the CSV
+        results: Extraction results for those companies
+        
+    Returns:
+        Number of companies whose careers URL was filled in
+    """
+    discovered = {
+        company.name: result.careers_url
+        for company, result in zip(companies, results)
+        if not company.careers_url and result.careers_url and result.status == "success"
+    }
+    if not discovered:
+        return 0
+    
+    with companies_csv.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    if not rows:
+        return 0
     
-    return companies
+    name_col, url_col, start = 0, 1, 0
+    columns = _company_columns(rows[0])
+    if columns is not None:
+        start = 1
+        name_col, url_col = columns
+        if url_col is None:
+            url_col = len(rows[0])
+            rows[0].append("url")
+    
+    updated = 0
+    for row in rows[start:]:
+        if len(row) <= name_col:
+            continue
+        url = discovered.get(row[name_col].strip())
+        if not url:
+            continue
+        row.extend([""] * (url_col + 1 - len(row)))
+        if not row[url_col].strip():
+            row[url_col] = url
+            updated += 1
+    
+    if updated:
+        fd, tmp_name = tempfile.mkstemp(dir=companies_csv.parent, prefix=f".{companies_csv.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as handle:
+                csv.writer(handle).writerows(rows)
+            os.replace(tmp_name, companies_csv)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        logger.info(f"Saved {updated} discovered careers URLs to {companies_csv}")
+    return updated
+
+
+class UrlIndex:
+    """Persistent index of the URLs already written to an output CSV.
+
+    Lives next to the CSV as ``<name>.index.sqlite3`` so appends check
+    membership without re-reading the whole CSV. The CSV's size is recorded
+    after every append; if it no longer matches (the CSV was edited, replaced
+    or deleted elsewhere) the index is rebuilt from the CSV.
+    """
+
+    def __init__(self, output_csv: Path) -> None:
+        self.output_csv = output_csv
+        self.path = output_csv.with_name(f"{output_csv.name}.index.sqlite3")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            """
+        )
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'csv_size'").fetchone()
+        if row is None or row[0] != self._csv_size():
+            self._rebuild()
+
+    def _csv_size(self) -> int:
+        return self.output_csv.stat().st_size if self.output_csv.exists() else 0
+
+    def _rebuild(self) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM urls")
+            if self.output_csv.exists():
+                with self.output_csv.open(newline="", encoding="utf-8") as handle:
+                    reader = csv.DictReader(handle)
+                    if "url" in (reader.fieldnames or []):
+                        self._db.executemany(
+                            "INSERT OR IGNORE INTO urls (url) VALUES (?)",
+                            ((url,) for row in reader if (url := (row.get("url") or "").strip())),
+                        )
+            self._record_size()
+        logger.info(f"Indexed {len(self)} existing URLs in {self.output_csv}")
+
+    def _record_size(self) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('csv_size', ?)",
+            (self._csv_size(),),
+        )
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def add(self, url: str) -> bool:
+        """Stage ``url``; True if it was not seen before. Call :meth:`commit` or :meth:`rollback`."""
+        return self._db.execute("INSERT OR IGNORE INTO urls (url) VALUES (?)", (url,)).rowcount == 1
+
+    def commit(self) -> None:
+        self._record_size()
+        self._db.commit()
+
+    def rollback(self) -> None:
+        self._db.rollback()
+
+    def close(self) -> None:
+        self._db.close()
 
 
 def append_to_urls_csv(output_csv: Path, results: List[ExtractionResult]) -> int:
@@ -688,44 +1448,43 @@ def append_to_urls_csv(output_csv: Path, results: List[ExtractionResult]) -> int
     Returns:
         Number of URLs written
     """
-    # Collect existing URLs to avoid duplicates
-    existing_urls: Set[str] = set()
-    if output_csv.exists():
-        with output_csv.open(newline="", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            if "url" in (reader.fieldnames or []):
-                for row in reader:
-                    url = row.get("url", "").strip()
-                    if url:
-                        existing_urls.add(url)
-        logger.info(f"Found {len(existing_urls)} existing URLs in {output_csv}")
-    
-    # Collect new URLs
-    new_urls = []
-    for result in results:
-        if result.status == "success":
-            for url in result.job_urls:
-                if url not in existing_urls:
-                    new_urls.append(url)
-                    existing_urls.add(url)
-    
-    if not new_urls:
-        logger.warning("No new URLs to append")
-        return 0
-    
-    # Append new URLs
-    output_csv.parent.mkdir(parents=True, exist_ok=True)
-    file_exists = output_csv.exists()
-    
-    with output_csv.open("a", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=["url"])
+    index = UrlIndex(output_csv)
+    try:
+        # Collect new URLs
+        new_urls = [
+            url
+            for result in results
+            if result.status == "success"
+            for url in result.job_urls
+            if index.add(url)
+        ]
         
+        if not new_urls:
+            logger.warning("No new URLs to append")
+            index.rollback()
+            return 0
+        
+        # Append new URLs
+        output_csv.parent.mkdir(parents=True, exist_ok=True)
+        file_exists = output_csv.exists()
+        
+        # Serialise every row up front and append them with a single write
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
         # Write header if file is new or empty
         if not file_exists or output_csv.stat().st_size == 0:
-            writer.writeheader()
+            writer.writerow(["url"])
+        writer.writerows((url,) for url in new_urls)
+        
+        with output_csv.open("a", newline="", encoding="utf-8") as handle:
+            handle.write(buffer.getvalue())
         
-        for url in new_urls:
-            writer.writerow({"url": url})
+        index.commit()
+    except BaseException:
+        index.rollback()
+        raise
+    finally:
+        index.close()
     
     logger.info(f"Appended {len(new_urls)} new URLs to {output_csv}")
     return len(new_urls)
@@ -737,7 +1496,11 @@ async def extract_all_job_urls(
     *,
     model: str = "gemini-2.0-flash-exp",
     timeout: int = 60000,
-    max_companies: int | None = None
+    max_companies: int | None = None,
+    max_parallel: int = N_PARALLEL,
+    filter_batch_size: int = FILTER_BATCH_SIZE,
+    cache_path: Path | None = DISCOVERY_CACHE_PATH,
+    update_companies_csv: bool = False
 ) -> List[ExtractionResult]:
     """Extract job URLs from all companies and save to CSV.
     
@@ -747,33 +1510,86 @@ async def extract_all_job_urls(
         model: Gemini model to use for filtering
         timeout: Timeout in milliseconds for page loading
         max_companies: Maximum number of companies to process (for testing)
+        max_parallel: Maximum number of companies processed concurrently
+        filter_batch_size: Number of companies filtered per Gemini call
+        cache_path: SQLite discovery cache, or None to always search and filter
+        update_companies_csv: Write careers URLs of successful companies back into companies_csv
         
     Returns:
         List of extraction results
     """
-    # Read companies
-    companies = read_companies_csv(companies_csv)
-    if max_companies is not None:
-        companies = companies[:max_companies]
+    # Read companies. File I/O and the blocking Gemini SDK calls run in worker
+    # threads so they never stall the concurrent page loads on the event loop.
+    companies = await asyncio.to_thread(
+        lambda: list(itertools.islice(read_companies_csv(companies_csv), max_companies))
+    )
     
     logger.info(f"Processing {len(companies)} companies")
     
     # Initialize LLM client
     llm = GeminiClient(model=model)
+    # Canned mock responses must never land in the persistent cache.
+    cache = DiscoveryCache(cache_path) if cache_path is not None and not mock_enabled() else None
     
-    # Process each company
-    results = []
-    for idx, company in enumerate(companies, start=1):
-        logger.info(f"[{idx}/{len(companies)}] Processing {company.name}")
-        result = await extract_job_urls_for_company(company, llm, timeout=timeout)
-        results.append(result)
-        
-        # Small delay between companies to avoid rate limiting
-        if idx < len(companies):
-            await asyncio.sleep(2)
+    # Phase 1: scrape companies concurrently; each one holds a pooled browser
+    # while it scrapes, so the pool size bounds concurrency. Gemini calls wait
+    # on the shared gemini_throttle instead of a fixed per-company sleep.
+
+    async with browser_pool(max_parallel) as pool:
+        async def _collect(idx: int, company: CompanyInfo) -> ExtractionResult | PageLinks:
+            async with pool.acquire() as browser:
+                logger.info(f"[{idx}/{len(companies)}] Processing {company.name}")
+                return await collect_company_links(
+                    company, llm, browser=browser, timeout=timeout, cache=cache
+                )
+
+        collected = list(await asyncio.gather(
+            *(_collect(idx, company) for idx, company in enumerate(companies, start=1))
+        ))
+    
+    # Phase 2: filter the scraped links in batches so the filter instructions
+    # are sent once per batch rather than once per company.
+    pages = [item for item in collected if isinstance(item, PageLinks)]
+    filtered: Dict[int, List[str]] = {}
+    if cache is not None:
+        for page in pages:
+            cached_urls = cache.get_job_urls(page.careers_url, page.links)
+            if cached_urls is not None:
+                logger.info(f"Using cached job URLs for {page.company}")
+                filtered[id(page)] = cached_urls
+        pages = [page for page in pages if id(page) not in filtered]
+    batch_size = max(filter_batch_size, 1)
+    groups = [pages[start:start + batch_size] for start in range(0, len(pages), batch_size)]
+    group_items = [[(page.company, page.careers_url, page.links) for page in group] for group in groups]
+    group_urls: List[List[List[str]]] | None = None
+    if len(pages) > BATCH_API_MIN_COMPANIES and not mock_enabled():
+        # Large runs go through the Batch API instead of competing for the per-minute quota
+        try:
+            group_urls = await asyncio.to_thread(filter_job_urls_with_batch_api, llm, group_items)
+        except Exception as exc:
+            logger.warning(f"Gemini Batch API run failed, filtering live instead: {exc}")
+    if group_urls is None:
+        group_urls = []
+        for items in group_items:
+            group_urls.append(await asyncio.to_thread(filter_job_urls_batch, llm, items))
+    for group, batch_urls in zip(groups, group_urls):
+        for page, job_urls in zip(group, batch_urls):
+            filtered[id(page)] = job_urls
+            if cache is not None and job_urls:
+                cache.put_job_urls(page.careers_url, page.links, job_urls)
+    if cache is not None:
+        cache.close()
+    
+    results = [
+        _filtered_result(item, filtered[id(item)]) if isinstance(item, PageLinks) else item
+        for item in collected
+    ]
+    
+    if update_companies_csv and not mock_enabled():
+        await asyncio.to_thread(write_back_careers_urls, companies_csv, companies, results)
     
     # Append URLs to output CSV
-    total_urls = append_to_urls_csv(output_csv, results)
+    total_urls = await asyncio.to_thread(append_to_urls_csv, output_csv, results)
     
     # Print summary
     logger.info("=" * 80)
@@ -834,6 +1650,22 @@ def main() -> int:
         type=int,
         help="Maximum number of companies to process (for testing)"
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=N_PARALLEL,
+        help=f"Number of companies processed concurrently (default: {N_PARALLEL})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the careers-page discovery cache and search every company again"
+    )
+    parser.add_argument(
+        "--update-companies-csv",
+        action="store_true",
+        help="Write careers URLs found for successful companies back into the input CSV"
+    )
     
     args = parser.parse_args()
     
@@ -844,7 +1676,10 @@ def main() -> int:
                 args.output,
                 model=args.model,
                 timeout=args.timeout,
-                max_companies=args.max_companies
+                max_companies=args.max_companies,
+                max_parallel=args.parallel,
+                cache_path=None if args.no_cache else DISCOVERY_CACHE_PATH,
+                update_companies_csv=args.update_companies_csv
             )
         )
         
@@ -8,30 +8,58 @@ schema consumed by downstream pipelines.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import json
 import os
 import re
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Protocol
 
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 load_dotenv(PROJECT_ROOT / ".env")
 
+from agents.common import llm_cache
+from agents.common.semantic_cache import SemanticCache, semantic_cache_available
+from agents.common.text_utils import strip_code_fence
 from agents.discovery.careers_page_finder_agent import GeminiClient
 
+CACHE_BUCKET = "role_normaliser"
+# Rows are independent and the LLM call is pure network wait, so keep this many in flight.
+MAX_CONCURRENT = int(os.getenv("ROLE_NORMALISER_MAX_CONCURRENT", "16"))
+
+WRITE_WORKERS = 4
+# A structured role embeds the full raw_text, and 2.5 models spend thinking tokens
+# from the same budget, so leave generous headroom.
+MAX_OUTPUT_TOKENS = 8192
+
+# '-' is itself non-alphanumeric, so one pass already collapses dash runs.
+_SLUG_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_ID_WORD = re.compile(r"[a-z0-9]+")
+
 
 class LLMClient(Protocol):
-    """Minimal interface describing the completion capability we need."""
+    """Minimal interface describing the completion capability we need.
+
+    ``acomplete`` is optional; clients without it are run on a worker thread.
+    Clients that also offer ``stream_complete``/``astream_complete`` are read
+    incrementally instead.
+    """
 
     def complete(self, prompt: str, *, temperature: float = 0.0) -> str:  # pragma: no cover - protocol
         ...
 
+    async def acomplete(self, prompt: str, *, temperature: float = 0.0) -> str:  # pragma: no cover - protocol
+        ...
+
 
 @dataclass(slots=True)
 class ConversionResult:
@@ -97,26 +125,13 @@ Job posting:
 """
 
 
-def _strip_code_fence(text: str) -> str:
-    stripped = text.strip()
-    if stripped.startswith("```"):
-        lines = stripped.splitlines()
-        if lines and lines[0].startswith("```"):
-            lines = lines[1:]
-        if lines and lines[-1].startswith("```"):
-            lines = lines[:-1]
-        stripped = "\n".join(lines).strip()
-    return stripped
-
-
 def _slugify(value: str, *, fallback: str) -> str:
     """Generate a filesystem-friendly slug."""
 
     value = value.strip().lower()
     if not value:
         return fallback
-    slug = re.sub(r"[^a-z0-9]+", "-", value)
-    slug = re.sub(r"-+", "-", slug).strip("-")
+    slug = _SLUG_NON_ALNUM.sub("-", value).strip("-")
     return slug or fallback
 
 
@@ -142,61 +157,286 @@ def convert_raw_text(
     prompt_template: str,
     example_json: str | None = None,
     temperature: float = 0.0,
+    semantic_cache: SemanticCache | None = None,
 ) -> tuple[Dict[str, Any], str]:
     """Convert a single raw job description into structured JSON."""
 
     prompt = _format_prompt(prompt_template, raw_text, example_json)
-    raw_response = llm.complete(prompt, temperature=temperature)
-    cleaned = _strip_code_fence(raw_response)
+    key = _cache_key(llm, prompt, temperature)
+    raw_response = llm_cache.lookup(key, bucket=CACHE_BUCKET) if key else None
+    if raw_response is not None:
+        return _parse_payload(raw_response), prompt
+    if semantic_cache is not None:
+        reused = _reuse_near_duplicate(semantic_cache.get(raw_text), raw_text)
+        if reused is not None:
+            return reused, prompt
+
+    stream = getattr(llm, "stream_complete", None)
+    if stream is None:
+        raw_response = llm.complete(prompt, temperature=temperature)
+    else:
+        raw_response = "".join(stream(prompt, temperature=temperature))
+    if key:
+        llm_cache.store(key, raw_response, bucket=CACHE_BUCKET)
+    payload = _parse_payload(raw_response)
+    if semantic_cache is not None:
+        semantic_cache.put(raw_text, payload)
+    return payload, prompt
+
+
+def _reuse_near_duplicate(cached: Dict[str, Any] | None, raw_text: str) -> Dict[str, Any] | None:
+    # Embeddings barely separate copies of a templated advert, whether from two
+    # companies or for two cities, so only reuse a payload whose company, location
+    # and every word of its id are actually named in the new posting; otherwise the
+    # reused id would resolve to the earlier posting's file.
+    if cached is None:
+        return None
+    text = raw_text.lower()
+    for field in ("company_name", "location"):
+        value = cached.get(field)
+        if isinstance(value, str) and value.strip() and value.strip().lower() not in text:
+            return None
+    role_id = cached.get("id")
+    if isinstance(role_id, str) and any(word not in text for word in _ID_WORD.findall(role_id.lower())):
+        return None
+    cached["raw_text"] = raw_text.strip()
+    return cached
+
+
+def _cache_key(llm: LLMClient, prompt: str, temperature: float) -> str | None:
+    # Only deterministic calls to a known model are reproducible enough to cache.
+    model = getattr(llm, "model_name", None)
+    if model is None or temperature != 0.0:
+        return None
+    return llm_cache.cache_key(prompt, model=model, temperature=temperature)
+
+
+def _parse_payload(raw_response: str) -> Dict[str, Any]:
+    cleaned = strip_code_fence(raw_response)
     try:
         payload = json.loads(cleaned)
     except json.JSONDecodeError as exc:  # pragma: no cover - LLM failure
         raise ValueError(f"LLM returned invalid JSON: {cleaned}") from exc
     if not isinstance(payload, dict):
         raise ValueError("LLM response must be a JSON object")
+    return payload
+
+
+async def _acomplete(llm: LLMClient, prompt: str, *, temperature: float) -> str:
+    astream = getattr(llm, "astream_complete", None)
+    if astream is not None:
+        return "".join([chunk async for chunk in astream(prompt, temperature=temperature)])
+    acomplete = getattr(llm, "acomplete", None)
+    if acomplete is None:
+        return await asyncio.to_thread(llm.complete, prompt, temperature=temperature)
+    return await acomplete(prompt, temperature=temperature)
+
+
+async def _aconvert_row(
+    sem: asyncio.Semaphore,
+    raw_text: str,
+    *,
+    llm: LLMClient,
+    prompt_template: str,
+    example_json: str | None,
+    temperature: float,
+    semantic_cache: SemanticCache | None = None,
+) -> tuple[Dict[str, Any], str]:
+    prompt = _format_prompt(prompt_template, raw_text, example_json)
+    key = _cache_key(llm, prompt, temperature)
+    raw_response = llm_cache.lookup(key, bucket=CACHE_BUCKET) if key else None
+    if raw_response is not None:
+        return _parse_payload(raw_response), prompt
+    if semantic_cache is not None:
+        # Embedding is CPU-bound; keep it off the event loop.
+        cached = await asyncio.to_thread(semantic_cache.get, raw_text)
+        reused = _reuse_near_duplicate(cached, raw_text)
+        if reused is not None:
+            return reused, prompt
+
+    async with sem:
+        raw_response = await _acomplete(llm, prompt, temperature=temperature)
+    if key:
+        llm_cache.store(key, raw_response, bucket=CACHE_BUCKET)
+    payload = _parse_payload(raw_response)
+    if semantic_cache is not None:
+        await asyncio.to_thread(semantic_cache.put, raw_text, payload)
     return payload, prompt
 
 
 def _build_filename(payload: Dict[str, Any], *, index: int) -> str:
     # Prefer explicit identifiers, otherwise fall back to a slug derived from company/title.
-    if isinstance(payload.get("id"), str) and payload["id"].strip():
-        return f"{_slugify(payload['id'], fallback=f'role-{index:02d}')}.json"
-
-    company = payload.get("company_name") if isinstance(payload.get("company_name"), str) else ""
-    title = payload.get("role_title") if isinstance(payload.get("role_title"), str) else ""
-    composite = " ".join(part for part in (company, title) if part)
+    fallback = f"role-{index:02d}"
+    role_id = payload.get("id")
+    if isinstance(role_id, str) and role_id.strip():
+        return f"{_slugify(role_id, fallback=fallback)}.json"
+
+    company = payload.get("company_name")
+    title = payload.get("role_title")
+    composite = " ".join(part for part in (company, title) if isinstance(part, str) and part)
     if composite:
-        return f"{_slugify(composite, fallback=f'role-{index:02d}')}.json"
-    return f"role-{index:02d}.json"
+        return f"{_slugify(composite, fallback=fallback)}.json"
+    return f"{fallback}.json"
 
 
 def _iter_csv_rows(csv_path: Path) -> Iterable[str]:
     with csv_path.open(newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        if "raw_text" not in (reader.fieldnames or []):
-            raise ValueError("CSV file must contain a 'raw_text' column")
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        try:
+            column = header.index("raw_text")
+        except ValueError:
+            raise ValueError("CSV file must contain a 'raw_text' column") from None
         for row in reader:
-            yield row.get("raw_text", "")
+            # DictReader skipped blank lines too; keep row indices identical.
+            if not row:
+                continue
+            yield row[column] if column < len(row) else ""
+
+
+def _safe_load_json(path: Path) -> Dict[str, Any] | None:
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class RoleIndex:
+    """Lazy lookup of role files already present in ``output_dir``.
+
+    Filenames are listed up front, but a file is only parsed when an ``id``
+    lookup cannot be answered from the files read so far. Unread files are
+    then loaded ``READ_WORKERS`` at a time on a thread pool, stopping after
+    the batch that contains the id.
+    """
+
+    READ_WORKERS = 32
+
+    def __init__(self, output_dir: Path) -> None:
+        self._name_map: dict[str, Path] = {path.name: path for path in output_dir.glob("*.json")}
+        self._id_map: dict[str, Path] = {}
+        self._unread: List[Path] = list(self._name_map.values())
+
+    def find_by_name(self, filename: str) -> Path | None:
+        return self._name_map.get(filename)
+
+    def find_by_id(self, role_id: str) -> Path | None:
+        if role_id in self._id_map or not self._unread:
+            return self._id_map.get(role_id)
+        with ThreadPoolExecutor(max_workers=min(self.READ_WORKERS, len(self._unread))) as pool:
+            while self._unread:
+                batch = self._unread[: self.READ_WORKERS]
+                del self._unread[: self.READ_WORKERS]
+                for path, data in zip(batch, pool.map(_safe_load_json, batch)):
+                    file_id = data.get("id") if data else None
+                    if isinstance(file_id, str) and file_id.strip():
+                        self._id_map.setdefault(file_id.strip(), path)
+                if role_id in self._id_map:
+                    return self._id_map[role_id]
+        return None
+
+    def add(self, path: Path, role_id: str | None = None) -> None:
+        self._name_map[path.name] = path
+        if role_id:
+            self._id_map[role_id] = path
+
+
+def _atomic_write(destination: Path, data: bytes) -> None:
+    tmp_path = destination.with_suffix(destination.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, destination)
+
+
+class _RoleWriter:
+    """Writes role files atomically on a background pool.
 
+    Bytes handed to :meth:`write` are served by :meth:`read` until the run
+    ends, so a later row targeting the same file sees it even if the write
+    has not landed yet.
+    """
 
-def _index_existing_roles(output_dir: Path) -> tuple[dict[str, Path], dict[str, Path]]:
-    by_id: dict[str, Path] = {}
-    by_name: dict[str, Path] = {}
-    if not output_dir.exists():
-        return by_id, by_name
-    for path in output_dir.glob("*.json"):
-        by_name[path.name] = path
+    def __init__(self, max_workers: int = WRITE_WORKERS) -> None:
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending: dict[Path, bytes] = {}
+        self._futures: List[Future[None]] = []
+
+    def read(self, path: Path) -> bytes | None:
+        if path in self._pending:
+            return self._pending[path]
+        return path.read_bytes() if path.exists() else None
+
+    def write(self, path: Path, data: bytes) -> None:
+        self._pending[path] = data
+        self._futures.append(self._pool.submit(_atomic_write, path, data))
+
+    async def aclose(self) -> None:
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
-            continue
-        role_id = data.get("id")
-        if isinstance(role_id, str) and role_id.strip():
-            by_id[role_id.strip()] = path
-    return by_id, by_name
+            await asyncio.gather(*(asyncio.wrap_future(future) for future in self._futures))
+        finally:
+            self._pool.shutdown(wait=True)
 
 
-def convert_roles_csv(
+def _store_payload(
+    payload: Dict[str, Any],
+    *,
+    index: int,
+    prompt: str,
+    output_dir: Path,
+    existing: RoleIndex,
+    writer: _RoleWriter,
+    overwrite: bool,
+) -> ConversionResult:
+    role_id = payload.get("id") if isinstance(payload.get("id"), str) else ""
+    destination = None
+
+    if role_id:
+        destination = existing.find_by_id(role_id.strip())
+
+    filename = _build_filename(payload, index=index)
+    destination = destination or existing.find_by_name(filename) or (output_dir / filename)
+
+    new_bytes = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    existing_bytes = writer.read(destination)
+    existing_payload: Dict[str, Any] | None = None
+    # Files we wrote ourselves match byte for byte, so the common re-run case never parses.
+    if existing_bytes is not None and existing_bytes != new_bytes:
+        try:
+            existing_payload = orjson.loads(existing_bytes)
+        except orjson.JSONDecodeError:
+            existing_payload = None
+
+    status = "created"
+    should_write = True
+
+    if existing_bytes == new_bytes:
+        status = "unchanged"
+        should_write = False
+    elif existing_payload is not None:
+        if existing_payload == payload:
+            status = "unchanged"
+            should_write = False
+        elif overwrite:
+            status = "updated"
+            should_write = True
+        else:
+            status = "skipped"
+            should_write = False
+
+    if should_write:
+        writer.write(destination, new_bytes)
+        existing.add(destination, role_id.strip())
+
+    return ConversionResult(
+        index=index,
+        prompt=prompt,
+        output_path=destination,
+        payload=payload,
+        status=status,
+    )
+
+
+async def aconvert_roles_csv(
     csv_path: Path,
     *,
     llm: LLMClient,
@@ -206,72 +446,92 @@ def convert_roles_csv(
     temperature: float = 0.0,
     max_rows: int | None = None,
     overwrite: bool = False,
+    max_concurrent: int = MAX_CONCURRENT,
+    semantic_cache: SemanticCache | None = None,
 ) -> List[ConversionResult]:
-    """Process all rows in the CSV and write structured role JSON files."""
+    """Async variant of :func:`convert_roles_csv` for callers already inside an event loop.
+
+    Up to ``max_concurrent`` LLM calls run at once. Rows are stored in CSV
+    order as soon as each is ready, so duplicate detection behaves as in a
+    sequential run while file writes overlap with the calls still in flight.
+    """
 
     _ensure_prompt_placeholders(prompt_template)
     output_dir.mkdir(parents=True, exist_ok=True)
-    existing_by_id, existing_by_name = _index_existing_roles(output_dir)
+    existing = RoleIndex(output_dir)
+
+    rows = ((index, raw_text) for index, raw_text in enumerate(_iter_csv_rows(csv_path), start=1) if raw_text.strip())
+    rows = list(islice(rows, max_rows))
+    sem = asyncio.Semaphore(max_concurrent)
+    # Cross-listed postings repeat verbatim; convert each distinct text once.
+    tasks: dict[str, asyncio.Future[tuple[Dict[str, Any], str]]] = {}
+    for _, raw_text in rows:
+        key = raw_text.strip()
+        if key not in tasks:
+            tasks[key] = asyncio.ensure_future(
+                _aconvert_row(
+                    sem,
+                    raw_text,
+                    llm=llm,
+                    prompt_template=prompt_template,
+                    example_json=example_json,
+                    temperature=temperature,
+                    semantic_cache=semantic_cache,
+                )
+            )
 
     results: List[ConversionResult] = []
-    for index, raw_text in enumerate(_iter_csv_rows(csv_path), start=1):
-        if max_rows is not None and len(results) >= max_rows:
-            break
-        if not raw_text.strip():
-            continue
-        payload, prompt = convert_raw_text(
-            raw_text,
+    writer = _RoleWriter()
+    try:
+        for index, raw_text in rows:
+            payload, prompt = await tasks[raw_text.strip()]
+            results.append(
+                _store_payload(
+                    payload,
+                    index=index,
+                    prompt=prompt,
+                    output_dir=output_dir,
+                    existing=existing,
+                    writer=writer,
+                    overwrite=overwrite,
+                )
+            )
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        await writer.aclose()
+    return results
+
+
+def convert_roles_csv(
+    csv_path: Path,
+    *,
+    llm: LLMClient,
+    prompt_template: str = DEFAULT_PROMPT,
+    example_json: str | None = None,
+    output_dir: Path,
+    temperature: float = 0.0,
+    max_rows: int | None = None,
+    overwrite: bool = False,
+    max_concurrent: int = MAX_CONCURRENT,
+    semantic_cache: SemanticCache | None = None,
+) -> List[ConversionResult]:
+    """Process all rows in the CSV and write structured role JSON files."""
+
+    return asyncio.run(
+        aconvert_roles_csv(
+            csv_path,
             llm=llm,
             prompt_template=prompt_template,
             example_json=example_json,
+            output_dir=output_dir,
             temperature=temperature,
+            max_rows=max_rows,
+            overwrite=overwrite,
+            max_concurrent=max_concurrent,
+            semantic_cache=semantic_cache,
         )
-        role_id = payload.get("id") if isinstance(payload.get("id"), str) else ""
-        destination = None
-
-        if role_id:
-            destination = existing_by_id.get(role_id.strip())
-
-        filename = _build_filename(payload, index=index)
-        destination = destination or existing_by_name.get(filename) or (output_dir / filename)
-
-        existing_payload: Dict[str, Any] | None = None
-        if destination.exists():
-            try:
-                existing_payload = json.loads(destination.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                existing_payload = None
-
-        status = "created"
-        should_write = True
-
-        if existing_payload is not None:
-            if existing_payload == payload:
-                status = "unchanged"
-                should_write = False
-            elif overwrite:
-                status = "updated"
-                should_write = True
-            else:
-                status = "skipped"
-                should_write = False
-
-        if should_write:
-            destination.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-            existing_by_name[destination.name] = destination
-            if role_id:
-                existing_by_id[role_id.strip()] = destination
-
-        results.append(
-            ConversionResult(
-                index=index,
-                prompt=prompt,
-                output_path=destination,
-                payload=payload,
-                status=status,
-            )
-        )
-    return results
+    )
 
 
 def _load_text(path: Path | None) -> str | None:
@@ -283,7 +543,7 @@ def _load_text(path: Path | None) -> str | None:
     return path.read_text(encoding="utf-8").strip() or None
 
 
-def run_agent(
+async def arun_agent(
     csv_path: Path,
     *,
     prompt_path: Path | None,
@@ -293,19 +553,61 @@ def run_agent(
     temperature: float,
     max_rows: int | None,
     overwrite: bool,
+    semantic_cache: bool = False,
 ) -> List[ConversionResult]:
     prompt_template = _load_text(prompt_path) or DEFAULT_PROMPT
     example_json = _load_text(example_path)
-    llm = GeminiClient(model=model)
-    return convert_roles_csv(
-        csv_path,
-        llm=llm,
-        prompt_template=prompt_template,
-        example_json=example_json,
-        output_dir=output_dir,
-        temperature=temperature,
-        max_rows=max_rows,
-        overwrite=overwrite,
+    llm = GeminiClient(model=model, max_output_tokens=MAX_OUTPUT_TOKENS)
+    near_duplicates = None
+    if semantic_cache:
+        if semantic_cache_available():
+            near_duplicates = SemanticCache(CACHE_BUCKET)
+        else:
+            print(
+                "[role-normaliser] semantic cache needs sentence-transformers and faiss-cpu. Continuing without it.",
+                file=sys.stderr,
+            )
+    try:
+        return await aconvert_roles_csv(
+            csv_path,
+            llm=llm,
+            prompt_template=prompt_template,
+            example_json=example_json,
+            output_dir=output_dir,
+            temperature=temperature,
+            max_rows=max_rows,
+            overwrite=overwrite,
+            semantic_cache=near_duplicates,
+        )
+    finally:
+        if near_duplicates is not None:
+            near_duplicates.save()
+
+
+def run_agent(
+    csv_path: Path,
+    *,
+    prompt_path: Path | None,
+    example_path: Path | None,
+    output_dir: Path,
+    model: str,
+    temperature: float,
+    max_rows: int | None,
+    overwrite: bool,
+    semantic_cache: bool = False,
+) -> List[ConversionResult]:
+    return asyncio.run(
+        arun_agent(
+            csv_path,
+            prompt_path=prompt_path,
+            example_path=example_path,
+            output_dir=output_dir,
+            model=model,
+            temperature=temperature,
+            max_rows=max_rows,
+            overwrite=overwrite,
+            semantic_cache=semantic_cache,
+        )
     )
 
 
@@ -334,6 +636,11 @@ def main() -> int:
         action="store_true",
         help="Overwrite existing JSON files if they already exist",
     )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Reuse results for near-duplicate postings (needs sentence-transformers and faiss-cpu)",
+    )
     args = parser.parse_args()
 
     results = run_agent(
@@ -345,6 +652,7 @@ def main() -> int:
         temperature=args.temperature,
         max_rows=args.max_rows,
         overwrite=args.overwrite,
+        semantic_cache=args.semantic_cache,
     )
 
     for result in results:
@@ -359,6 +667,8 @@ if __name__ == "__main__":
 __all__ = [
     "ConversionResult",
     "DEFAULT_PROMPT",
+    "aconvert_roles_csv",
+    "arun_agent",
     "convert_raw_text",
     "convert_roles_csv",
     "run_agent",
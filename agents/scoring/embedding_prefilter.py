@@ -0,0 +1,87 @@
+"""Cheap embedding pre-filter in front of the Gemini For-Them scorer.
+
+Roles whose text is semantically far from the candidate profile score
+near zero on For-Them anyway, so the engine can skip the Gemini Pro call
+for them. The profile and every role are embedded with a small
+sentence-transformers model; with unit-normalised vectors the cosine
+similarity of a whole batch is a single matrix-vector product.
+
+``sentence-transformers`` is an optional dependency; check
+:func:`prefilter_available` before constructing a :class:`PrefilterAgent`.
+"""
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import orjson
+
+try:  # pragma: no cover - optional dependency
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # pragma: no cover - optional dependency
+    SentenceTransformer = None
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_THRESHOLD = float(os.getenv("ROLE_PREFILTER_THRESHOLD", "0.25"))
+PREFILTER_REASONING = "Prefiltered by low semantic similarity"
+# MiniLM truncates at 256 tokens; there is no point tokenising more than the head.
+EMBED_CHARS = 2000
+BATCH_SIZE = 64
+
+
+def prefilter_available() -> bool:
+    return SentenceTransformer is not None
+
+
+@lru_cache(maxsize=1)
+def _model() -> "SentenceTransformer":
+    return SentenceTransformer(MODEL_NAME)
+
+
+def _role_text(role: Dict[str, object]) -> str:
+    description = role.get("job_description")
+    if isinstance(description, str) and description.strip():
+        return f"{role.get('role') or role.get('job_title') or ''}\n{description}"[:EMBED_CHARS]
+    return orjson.dumps(role, default=str).decode()[:EMBED_CHARS]
+
+
+class PrefilterAgent:
+    """Scores roles by cosine similarity to ``data/profile.md``."""
+
+    def __init__(self, base_path: Path | None = None, *, threshold: float = DEFAULT_THRESHOLD) -> None:
+        if not prefilter_available():
+            raise RuntimeError("Embedding pre-filter needs the optional 'sentence-transformers' package.")
+        self.base_path = base_path or Path(__file__).resolve().parents[2]
+        self.profile_file = self.base_path / "data" / "profile.md"
+        self.threshold = threshold
+        self._profile_cache: Optional[Tuple[int, object]] = None
+
+    def _profile_vector(self):
+        """Embedding of the profile, recomputed only when the file changes."""
+        stamp = self.profile_file.stat().st_mtime_ns
+        if self._profile_cache is None or self._profile_cache[0] != stamp:
+            profile = self.profile_file.read_text(encoding="utf-8")
+            vector = _model().encode([profile[:EMBED_CHARS]], normalize_embeddings=True)[0]
+            self._profile_cache = (stamp, vector)
+        return self._profile_cache[1]
+
+    def similarities(self, roles: Sequence[Dict[str, object]]) -> List[float]:
+        """Cosine similarity of each role to the profile, in input order."""
+        if not roles:
+            return []
+        profile = self._profile_vector()
+        embeddings = _model().encode(
+            [_role_text(role) for role in roles],
+            batch_size=BATCH_SIZE,
+            normalize_embeddings=True,
+        )
+        return (embeddings @ profile).tolist()
+
+    def below_threshold(self, roles: Sequence[Dict[str, object]]) -> List[bool]:
+        """Flag the roles too dissimilar to the profile to be worth a For-Them call."""
+        return [score < self.threshold for score in self.similarities(roles)]
+
+
+__all__ = ["DEFAULT_THRESHOLD", "PREFILTER_REASONING", "PrefilterAgent", "prefilter_available"]
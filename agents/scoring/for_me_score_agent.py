@@ -1,18 +1,59 @@
 """For-Me Score Agent: delegates preference scoring to Gemini 2.5."""
 from __future__ import annotations
 
-import json
+import asyncio
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 
 try:
+    from agents.common.agent_base import read_cached_text
     from agents.common.gemini_client import GeminiClient, GeminiConfig
 except ImportError:  # pragma: no cover - script execution fallback
+    from ..common.agent_base import read_cached_text
     from ..common.gemini_client import GeminiClient, GeminiConfig
 
 
+# Everything up to the job postings is identical across calls, so Gemini can
+# reuse it as an implicitly cached prefix.
+INSTRUCTIONS = dedent(
+    """
+    Score how appealing each role below is *for the candidate* using the supplied profile + preferences.
+    
+    For every job, analyze the posting and extract relevant information about:
+    - Location and remote/hybrid/onsite work model
+    - Salary/compensation (if mentioned, otherwise mark as unknown)
+    - Job type (full-time, contract, etc.)
+    - Technical stack and responsibilities
+    - Interest alignment with candidate's goals
+    
+    If compensation is not mentioned, DO NOT cap the For-Me score—treat it as "unknown" and reason from preferences tolerance.
+    Always justify trade-offs using concrete quotes (max 2 sentences).
+    Score each job independently of the others.
+
+    Return ONLY JSON with one entry in "results" per job, in job order:
+    {
+        "results": [
+            {
+                "job": job number,
+                "for_me_score": number 0-100,
+                "dimension_scores": {
+                    "location": number,
+                    "salary": number,
+                    "job_type": number,
+                    "interest_alignment": number
+                },
+                "reasoning": "short paragraph"
+            }
+        ]
+    }
+    """
+).strip()
+
+
 @dataclass
 class ForMeScoreResult:
     for_me_score: float
@@ -27,8 +68,15 @@ class ForMeScoreResult:
         }
 
 
+# Gemini calls aevaluate_many keeps in flight when the caller passes no semaphore.
+MAX_CONCURRENT_CALLS = 8
+
+
 class ForMeScoreAgent:
     MODEL_NAME = "gemini-2.5-pro"
+    # Score objects are small, but 2.5 Pro always thinks and those tokens count too.
+    THINKING_TOKENS = 2048
+    OUTPUT_TOKENS_PER_JOB = 512
 
     def __init__(self, base_path: Path | None = None) -> None:
         self.base_path = base_path or Path(__file__).resolve().parents[2]
@@ -42,8 +90,11 @@ class ForMeScoreAgent:
                 temperature=0.2,
                 json_mode=True,
                 mock_bucket="for_me_score",
+                cache_responses=True,
+                timeout=90.0,
             )
         )
+        self._prefix_cache: Optional[Tuple[Tuple[str, str], str]] = None
 
     def evaluate(
         self,
@@ -67,143 +118,198 @@ class ForMeScoreAgent:
             company: Company name (optional)
             location: Job location (optional)
         """
-        profile = self._load_text(self.profile_file)
-        preferences = self._load_text(self.preferences_file)
+        job = self._job(role_payload, job_title, job_description, company, location)
+        return self.evaluate_many([job], batch_size=1)[0]
+
+    def evaluate_many(self, jobs: List[Dict[str, object]], batch_size: int = 8) -> List[ForMeScoreResult]:
+        """Score several roles, packing up to ``batch_size`` of them into each Gemini call.
+        
+        Args:
+            jobs: Raw postings (dicts with ``job_title`` + ``job_description`` and
+                optional ``company``/``location``) or structured role payloads
+            batch_size: Maximum number of roles sent in one prompt
         
+        Returns:
+            One result per job, in input order
+        """
+        results: List[ForMeScoreResult] = []
+        for start in range(0, len(jobs), batch_size):
+            results.extend(self._score_chunk(jobs[start:start + batch_size]))
+        return results
+
+    async def aevaluate(
+        self,
+        role_payload: Optional[Dict[str, object]] = None,
+        *,
+        job_title: Optional[str] = None,
+        job_description: Optional[str] = None,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> ForMeScoreResult:
+        """Async variant of :meth:`evaluate`."""
+        job = self._job(role_payload, job_title, job_description, company, location)
+        return (await self.aevaluate_many([job], batch_size=1))[0]
+
+    async def aevaluate_many(
+        self,
+        jobs: List[Dict[str, object]],
+        batch_size: int = 8,
+        *,
+        sem: Optional[asyncio.Semaphore] = None,
+    ) -> List[ForMeScoreResult]:
+        """Async variant of :meth:`evaluate_many` that sends batches concurrently.
+
+        Every Gemini call holds ``sem`` while in flight, so a caller can share
+        its own concurrency budget; by default at most ``MAX_CONCURRENT_CALLS``
+        calls run at once.
+        """
+        sem = sem or asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+        chunks = await asyncio.gather(
+            *(self._ascore_chunk(jobs[start:start + batch_size], sem) for start in range(0, len(jobs), batch_size))
+        )
+        return [result for chunk in chunks for result in chunk]
+
+    @staticmethod
+    def _job(
+        role_payload: Optional[Dict[str, object]],
+        job_title: Optional[str],
+        job_description: Optional[str],
+        company: Optional[str],
+        location: Optional[str],
+    ) -> Dict[str, object]:
         # Support both structured and raw input
         if job_title and job_description:
-            response = self._call_gemini_raw(
-                job_title=job_title,
-                job_description=job_description,
-                company=company or "Unknown",
-                location=location,
-                profile=profile,
-                preferences=preferences,
+            return {
+                "job_title": job_title,
+                "job_description": job_description,
+                "company": company or "Unknown",
+                "location": location,
+            }
+        if role_payload:
+            return role_payload
+        raise ValueError("Must provide either role_payload or job_title + job_description")
+
+    def _score_chunk(self, chunk: List[Dict[str, object]]) -> List[ForMeScoreResult]:
+        responses = self._call_gemini_batch(chunk)
+        if responses is None:
+            # The model did not return one object per job; score them individually.
+            responses = []
+            for job in chunk:
+                single = self._call_gemini_batch([job])
+                if single is None:
+                    raise ValueError("Gemini returned no For-Me score for the role")
+                responses.extend(single)
+        return [self._to_result(response) for response in responses]
+
+    async def _ascore_chunk(self, chunk: List[Dict[str, object]], sem: asyncio.Semaphore) -> List[ForMeScoreResult]:
+        async def call(jobs: List[Dict[str, object]]) -> Optional[List[Dict[str, object]]]:
+            async with sem:
+                return await self._acall_gemini_batch(jobs)
+
+        responses = await call(chunk)
+        if responses is None:
+            # The model did not return one object per job; score them individually.
+            singles = await asyncio.gather(*(call([job]) for job in chunk))
+            if any(single is None for single in singles):
+                raise ValueError("Gemini returned no For-Me score for the role")
+            responses = [single[0] for single in singles]
+        return [self._to_result(response) for response in responses]
+
+    @property
+    def _prompt_prefix(self) -> str:
+        # Profile and preferences are only re-read after they change on disk, and the
+        # prefix is rebuilt only then; a missing file still surfaces from evaluate().
+        texts = (self._load_text(self.profile_file), self._load_text(self.preferences_file))
+        if self._prefix_cache is None or self._prefix_cache[0] != texts:
+            profile, preferences = texts
+            prefix = (
+                f"{INSTRUCTIONS}"
+                f"\n\n=== CANDIDATE PROFILE ===\n{profile}\n=== END PROFILE ==="
+                f"\n\n=== CANDIDATE PREFERENCES ===\n{preferences}\n=== END PREFERENCES ==="
             )
-        elif role_payload:
-            response = self._call_gemini(role_payload, profile, preferences)
+            self._prefix_cache = (texts, prefix)
+        return self._prefix_cache[1]
+
+    def _call_gemini_batch(self, jobs: List[Dict[str, object]]) -> Optional[List[Dict[str, object]]]:
+        """Score ``jobs`` in one call; ``None`` when the reply cannot be matched to them."""
+        prompt, metadata, max_output_tokens = self._batch_request(jobs)
+        response = self.client.generate_json(prompt, metadata=metadata, max_output_tokens=max_output_tokens)
+        return self._batch_entries(jobs, response)
+
+    async def _acall_gemini_batch(self, jobs: List[Dict[str, object]]) -> Optional[List[Dict[str, object]]]:
+        prompt, metadata, max_output_tokens = self._batch_request(jobs)
+        response = await self.client.agenerate_json(prompt, metadata=metadata, max_output_tokens=max_output_tokens)
+        return self._batch_entries(jobs, response)
+
+    def _batch_request(self, jobs: List[Dict[str, object]]) -> Tuple[str, Dict[str, object], int]:
+        postings = "\n\n".join(
+            f"=== JOB {number} ===\n{self._render_job(job)}\n=== END JOB {number} ==="
+            for number, job in enumerate(jobs, start=1)
+        )
+        prompt = (
+            f"{self._prompt_prefix}\n\n{postings}"
+            f"\n\nReturn exactly {len(jobs)} entries in \"results\", one per job above, in job order."
+        )
+
+        metadata: Dict[str, object] = {}
+        if len(jobs) == 1:
+            job = jobs[0]
+            metadata = {
+                "role": job.get("job_title") or job.get("role"),
+                "company": job.get("company"),
+            }
+        return prompt, metadata, self.THINKING_TOKENS + self.OUTPUT_TOKENS_PER_JOB * len(jobs)
+
+    @staticmethod
+    def _batch_entries(jobs: List[Dict[str, object]], response: object) -> Optional[List[Dict[str, object]]]:
+        if isinstance(response, dict) and isinstance(response.get("results"), list):
+            entries = [entry for entry in response["results"] if isinstance(entry, dict)]
+        elif isinstance(response, dict) and len(jobs) == 1:
+            # Single-job replies (and mock fixtures) may skip the wrapper.
+            entries = [response]
         else:
-            raise ValueError("Must provide either role_payload or job_title + job_description")
-        
-        dimension_scores = response.get("dimension_scores", {})
+            return None
+        if len(entries) != len(jobs):
+            return None
+        numbers = [entry.get("job") for entry in entries]
+        if all(isinstance(number, int) for number in numbers):
+            # A repeated or missing number would hand one job another job's score.
+            if sorted(numbers) != list(range(1, len(jobs) + 1)):
+                return None
+            entries.sort(key=lambda entry: entry["job"])
+        elif len(jobs) > 1:
+            return None
+        return entries
+
+    @staticmethod
+    def _render_job(job: Dict[str, object]) -> str:
+        if job.get("job_title") and job.get("job_description"):
+            location = job.get("location")
+            location_str = f"Location: {location}" if location else "Location: Not specified"
+            return (
+                f"Company: {job.get('company') or 'Unknown'}\n"
+                f"Title: {job['job_title']}\n"
+                f"{location_str}\n\n"
+                f"Description:\n{job['job_description']}"
+            )
+        # default=str covers dates/paths from DB-backed payloads; orjson emits raw UTF-8,
+        # so non-English postings don't inflate into \u escapes.
+        return f"Role JSON:\n{orjson.dumps(job, default=str).decode()}"
+
+    @staticmethod
+    def _to_result(response: Dict[str, object]) -> ForMeScoreResult:
+        dimension_scores = response.get("dimension_scores") or {}
         return ForMeScoreResult(
             for_me_score=float(response.get("for_me_score", 0)),
             reasoning=response.get("reasoning", "No reasoning returned"),
             dimension_scores={k: float(v) for k, v in dimension_scores.items()},
         )
 
-    def _call_gemini_raw(
-        self,
-        job_title: str,
-        job_description: str,
-        company: str,
-        location: Optional[str],
-        profile: str,
-        preferences: str,
-    ) -> Dict[str, object]:
-        """Call Gemini with raw job title and description."""
-        location_str = f"Location: {location}" if location else "Location: Not specified"
-        
-        prompt = dedent(
-            f"""
-            Score how appealing this role is *for the candidate* using the supplied profile + preferences.
-            
-            Analyze the raw job posting below and extract relevant information about:
-            - Location and remote/hybrid/onsite work model
-            - Salary/compensation (if mentioned, otherwise mark as unknown)
-            - Job type (full-time, contract, etc.)
-            - Technical stack and responsibilities
-            - Interest alignment with candidate's goals
-            
-            If compensation is not mentioned, DO NOT cap the For-Me score—treat it as "unknown" and reason from preferences tolerance.
-            Always justify trade-offs using concrete quotes (max 2 sentences).
-
-            Return ONLY JSON with the shape:
-            {{
-                "for_me_score": number 0-100,
-                "dimension_scores": {{
-                    "location": number,
-                    "salary": number,
-                    "job_type": number,
-                    "interest_alignment": number
-                }},
-                "reasoning": "short paragraph"
-            }}
-
-            === JOB POSTING ===
-            Company: {company}
-            Title: {job_title}
-            {location_str}
-            
-            Description:
-            {job_description}
-            === END JOB POSTING ===
-
-            === CANDIDATE PROFILE ===
-            {profile}
-            === END PROFILE ===
-
-            === CANDIDATE PREFERENCES ===
-            {preferences}
-            === END PREFERENCES ===
-            """
-        ).strip()
-
-        return self.client.generate_json(
-            prompt,
-            metadata={"role": job_title, "company": company},
-        )
-
-    def _call_gemini(
-        self,
-        role_payload: Dict[str, object],
-        profile: str,
-        preferences: str,
-    ) -> Dict[str, object]:
-        prompt = dedent(
-            f"""
-            Score how appealing this role is *for the candidate* using the supplied profile + preferences.
-            Consider location, salary/compensation (or explain assumptions if missing), working model (remote/on-site, job_type), and interest alignment.
-            If compensation is null or omitted, DO NOT cap the For-Me score—treat the salary dimension as "unknown" and reason from preferences tolerance.
-            Always justify trade-offs using concrete quotes (max 2 sentences).
-
-            Return ONLY JSON with the shape:
-                        {{
-                            "for_me_score": number 0-100,
-                            "dimension_scores": {{
-                                    "location": number,
-                                    "salary": number,
-                                    "job_type": number,
-                                    "interest_alignment": number
-                            }},
-              "reasoning": "short paragraph"
-            }}
-
-            Role JSON:
-            {json.dumps(role_payload, indent=2)}
-
-            === CANDIDATE PROFILE ===
-            {profile}
-            === END PROFILE ===
-
-            === CANDIDATE PREFERENCES ===
-            {preferences}
-            === END PREFERENCES ===
-            """
-        ).strip()
-
-        return self.client.generate_json(
-            prompt,
-            metadata={
-                "role": role_payload.get("role"),
-                "company": role_payload.get("company"),
-            },
-        )
-
     def _load_text(self, path: Path) -> str:
-        if not path.exists():
+        text = read_cached_text(path)
+        if text is None:
             raise FileNotFoundError(f"Expected file missing: {path}")
-        return path.read_text()
+        return text
 
 
 if __name__ == "__main__":  # pragma: no cover - manual test requires API key
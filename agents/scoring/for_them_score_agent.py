@@ -1,17 +1,125 @@
 """For-Them Score Agent: estimates employer fit via Gemini 2.5."""
 from __future__ import annotations
 
-import json
+import asyncio
+import html
+import os
+import re
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+import orjson
 
 try:
+    from agents.common.agent_base import read_cached_text
     from agents.common.gemini_client import GeminiClient, GeminiConfig
 except ImportError:  # pragma: no cover - script execution fallback
+    from ..common.agent_base import read_cached_text
     from ..common.gemini_client import GeminiClient, GeminiConfig
 
+CONTEXT_CACHE_ENABLED = os.getenv("GEMINI_CONTEXT_CACHE", "").lower() in {"1", "true", "yes"}
+CONTEXT_CACHE_TTL_SECONDS = 3600
+CACHED_CONTEXT_NOTE = "The scoring rubric and candidate profile are provided in the cached context."
+
+# Job descriptions are condensed to this many characters before scoring.
+MAX_JD_CHARS = 6000
+_HTML_TAG = re.compile(r"<[^>]+>")
+_INLINE_SPACE = re.compile(r"[ \t\u00a0]+")
+# Section headers whose content says nothing about employer fit.
+_BOILERPLATE_HEADER = re.compile(
+    r"^\W*(about us|about the company|who we are|our values|benefits|perks|what we offer"
+    r"|equal (employment )?opportunit|eeo\b|diversity)",
+    re.IGNORECASE,
+)
+_KEY_SECTION = re.compile(r"requirement|responsibilit|qualif", re.IGNORECASE)
+# Other headers that open a section worth keeping and so end a boilerplate one.
+_SECTION_HEADER = re.compile(
+    r"^\W*(about (the|this) (role|job|position|team)|the role|role overview|job description|overview"
+    r"|what you('ll| will) (do|bring|need)|what we('re| are) looking for|who you are|your role|the team"
+    r"|skills|experience|nice to have|bonus points|preferred|desired|must have|how to apply|the opportunity)",
+    re.IGNORECASE,
+)
+
+
+def _is_header(line: str) -> bool:
+    """Whether ``line`` names a known section, so it starts or ends a skipped block.
+
+    Scraped text carries no bullet characters, so a short line alone is not
+    enough: benefit items like "25 days holiday" would look like headers too.
+    """
+    if len(line) > 60 or line.startswith(("-", "*", "\u2022", "\u00b7")) or line.endswith((".", ",", ";")):
+        return False
+    return bool(_BOILERPLATE_HEADER.match(line) or _KEY_SECTION.search(line) or _SECTION_HEADER.match(line))
+
+
+def _condense_jd(raw: str) -> str:
+    """Trim a job description to what matters for scoring.
+
+    Strips HTML leftovers and repeated whitespace, drops boilerplate sections
+    (about us, benefits, EEO statements) up to the next header, and if the
+    text is still longer than ``MAX_JD_CHARS`` keeps requirement,
+    responsibility and qualification paragraphs first, in original order.
+    """
+    text = html.unescape(_HTML_TAG.sub(" ", raw))
+    kept = []
+    skipping = False
+    for line in (_INLINE_SPACE.sub(" ", line).strip() for line in text.splitlines()):
+        if line and _is_header(line):
+            skipping = bool(_BOILERPLATE_HEADER.match(line))
+        if skipping:
+            continue
+        if line or (kept and kept[-1]):
+            kept.append(line)
+    paragraphs = [paragraph for paragraph in "\n".join(kept).split("\n\n") if paragraph.strip()]
+
+    condensed = "\n\n".join(paragraphs)
+    if len(condensed) <= MAX_JD_CHARS:
+        return condensed
+    chosen = set()
+    budget = MAX_JD_CHARS
+    ranked = sorted(range(len(paragraphs)), key=lambda index: not _KEY_SECTION.search(paragraphs[index]))
+    for index in ranked:
+        if len(paragraphs[index]) + 2 <= budget:
+            chosen.add(index)
+            budget -= len(paragraphs[index]) + 2
+    return "\n\n".join(paragraphs[index] for index in sorted(chosen))[:MAX_JD_CHARS]
+
+
+# Identical for every role, so it leads the prompt (or lives in the context cache).
+RUBRIC = dedent(
+    """
+    Evaluate how convincing this candidate would look to the employer for the role below.
+
+    Analyze the job posting and extract the requirements, then compare against the candidate profile.
+    Consider five dimensions:
+    - skill_match: How well do the candidate's technical skills match the requirements?
+    - experience_relevance: Is the candidate's experience relevant to this role?
+    - domain_fit: Does the candidate have experience in this industry/domain?
+    - location_convenience: Can the candidate work from the required location?
+    - interest_alignment: Does this role align with the candidate's stated interests?
+
+    Each dimension must be a score between 0 and 100.
+    Also produce an overall for_them_score plus one short paragraph of reasoning quoting specifics from both the job posting and the candidate's profile.
+
+    Return ONLY JSON:
+    {
+        "for_them_score": number,
+        "dimension_scores": {
+            "skill_match": number,
+            "experience_relevance": number,
+            "domain_fit": number,
+            "location_convenience": number,
+            "interest_alignment": number
+        },
+        "reasoning": "..."
+    }
+    """
+).strip()
+
 
 @dataclass
 class ForThemScoreResult:
@@ -30,9 +138,14 @@ class ForThemScoreResult:
 class ForThemScoreAgent:
     MODEL_NAME = "gemini-2.5-pro"
 
-    def __init__(self, base_path: Path | None = None) -> None:
+    def __init__(self, base_path: Path | None = None, use_context_cache: Optional[bool] = None) -> None:
         self.base_path = base_path or Path(__file__).resolve().parents[2]
         self.profile_file = self.base_path / "data" / "profile.md"
+        self.use_context_cache = CONTEXT_CACHE_ENABLED if use_context_cache is None else use_context_cache
+        self._cache_name: Optional[str] = None
+        self._cache_profile: Optional[str] = None
+        self._cache_expires_at = 0.0
+        self._cache_lock = threading.Lock()
         self.client = GeminiClient(
             GeminiConfig(
                 model=self.MODEL_NAME,
@@ -66,129 +179,120 @@ class ForThemScoreAgent:
             company: Company name (optional)
             location: Job location (optional)
         """
-        profile = self._load_text(self.profile_file)
-        
-        # Support both structured and raw input
-        if job_title and job_description:
-            response = self._call_gemini_raw(
-                job_title=job_title,
-                job_description=job_description,
-                company=company or "Unknown",
-                location=location,
-                profile=profile,
-            )
-        elif role_payload:
-            response = self._call_gemini(role_payload, profile)
-        else:
-            raise ValueError("Must provide either role_payload or job_title + job_description")
-        
-        dimension_scores = response.get("dimension_scores", {})
-        return ForThemScoreResult(
-            for_them_score=float(response.get("for_them_score", 0)),
-            reasoning=response.get("reasoning", "No reasoning returned"),
-            dimension_scores={k: float(v) for k, v in dimension_scores.items()},
+        posting, metadata = self._posting(role_payload, job_title, job_description, company, location)
+        profile_section = self._profile_section()
+        cache_name = self._context_cache(profile_section) if self.use_context_cache else None
+        # Streamed so the long 2.5 Pro reasoning is not cut off by the read timeout.
+        response = self.client.generate_json(
+            self._prompt(posting, profile_section, cache_name),
+            metadata=metadata,
+            cached_content=cache_name,
+            stream=True,
         )
+        return self._to_result(response)
 
-    def _call_gemini_raw(
+    async def aevaluate(
         self,
-        job_title: str,
-        job_description: str,
-        company: str,
-        location: Optional[str],
-        profile: str,
-    ) -> Dict[str, object]:
-        """Call Gemini with raw job title and description."""
-        location_str = f"Location: {location}" if location else "Location: Not specified"
-        
-        prompt = dedent(
-            f"""
-            Evaluate how convincing this candidate would look to the employer for the role below.
-            
-            Analyze the raw job posting and extract the requirements, then compare against the candidate profile.
-            Consider five dimensions:
-            - skill_match: How well do the candidate's technical skills match the requirements?
-            - experience_relevance: Is the candidate's experience relevant to this role?
-            - domain_fit: Does the candidate have experience in this industry/domain?
-            - location_convenience: Can the candidate work from the required location?
-            - interest_alignment: Does this role align with the candidate's stated interests?
-            
-            Each dimension must be a score between 0 and 100.
-            Also produce an overall for_them_score plus one short paragraph of reasoning quoting specifics from both the job posting and the candidate's profile.
-
-            Return ONLY JSON:
-            {{
-                "for_them_score": number,
-                "dimension_scores": {{
-                    "skill_match": number,
-                    "experience_relevance": number,
-                    "domain_fit": number,
-                    "location_convenience": number,
-                    "interest_alignment": number
-                }},
-                "reasoning": "..."
-            }}
-
-            === JOB POSTING ===
-            Company: {company}
-            Title: {job_title}
-            {location_str}
-            
-            Description:
-            {job_description}
-            === END JOB POSTING ===
-
-            === CANDIDATE PROFILE ===
-            {profile}
-            === END PROFILE ===
-            """
-        ).strip()
-
-        return self.client.generate_json(
-            prompt,
-            metadata={"role": job_title, "company": company},
+        role_payload: Optional[Dict[str, object]] = None,
+        *,
+        job_title: Optional[str] = None,
+        job_description: Optional[str] = None,
+        company: Optional[str] = None,
+        location: Optional[str] = None,
+    ) -> ForThemScoreResult:
+        """Async variant of :meth:`evaluate`."""
+        posting, metadata = self._posting(role_payload, job_title, job_description, company, location)
+        profile_section = self._profile_section()
+        cache_name = None
+        if self.use_context_cache:
+            # Usually an in-memory hit; the hourly upload must not block the event loop.
+            cache_name = await asyncio.to_thread(self._context_cache, profile_section)
+        response = await self.client.agenerate_json(
+            self._prompt(posting, profile_section, cache_name),
+            metadata=metadata,
+            cached_content=cache_name,
+            stream=True,
         )
+        return self._to_result(response)
 
-    def _call_gemini(self, role_payload: Dict[str, object], profile: str) -> Dict[str, object]:
-        prompt = dedent(
-            f"""
-            Evaluate how convincing this candidate would look to the employer.
-            Consider five dimensions: skill_match, experience_relevance, domain_fit, location_convenience, and interest_alignment.
-            Each dimension must be a score between 0 and 100. Also produce an overall for_them_score plus one short paragraph of reasoning quoting specifics.
-
-            Return ONLY JSON:
-            {{
-              "for_them_score": number,
-              "dimension_scores": {{
-                  "skill_match": number,
-                  "experience_relevance": number,
-                  "domain_fit": number,
-                  "location_convenience": number,
-                  "interest_alignment": number
-              }},
-              "reasoning": "..."
-            }}
-
-            Role JSON:
-            {json.dumps(role_payload, indent=2)}
-
-            === CANDIDATE PROFILE ===
-            {profile}
-            === END PROFILE ===
-            """
-        ).strip()
-
-        return self.client.generate_json(
-            prompt,
-            metadata={
+    @staticmethod
+    def _posting(
+        role_payload: Optional[Dict[str, object]],
+        job_title: Optional[str],
+        job_description: Optional[str],
+        company: Optional[str],
+        location: Optional[str],
+    ) -> Tuple[str, Dict[str, object]]:
+        """Render the per-role part of the prompt and its mock metadata."""
+        # Support both structured and raw input
+        if job_title and job_description:
+            company = company or "Unknown"
+            location_str = f"Location: {location}" if location else "Location: Not specified"
+            posting = (
+                "=== JOB POSTING ===\n"
+                f"Company: {company}\n"
+                f"Title: {job_title}\n"
+                f"{location_str}\n\n"
+                f"Description:\n{_condense_jd(job_description)}\n"
+                "=== END JOB POSTING ==="
+            )
+            return posting, {"role": job_title, "company": company}
+        if role_payload:
+            role_json = orjson.dumps(role_payload, default=str).decode()
+            return f"Role JSON:\n{role_json}", {
                 "role": role_payload.get("role"),
                 "company": role_payload.get("company"),
-            },
-        )
+            }
+        raise ValueError("Must provide either role_payload or job_title + job_description")
+
+    def _profile_section(self) -> str:
+        return f"=== CANDIDATE PROFILE ===\n{self._profile}\n=== END PROFILE ==="
+
+    @staticmethod
+    def _prompt(posting: str, profile_section: str, cache_name: Optional[str]) -> str:
+        if cache_name:
+            return f"{CACHED_CONTEXT_NOTE}\n\n{posting}"
+        return f"{RUBRIC}\n\n{profile_section}\n\n{posting}"
+
+    @staticmethod
+    def _to_result(response: Dict[str, object]) -> ForThemScoreResult:
+        """Check the response shape once here rather than deep in the engine."""
+        score = response.get("for_them_score", 0)
+        dimension_scores = response.get("dimension_scores") or {}
+        reasoning = response.get("reasoning") or "No reasoning returned"
+        if (
+            not isinstance(score, (int, float))
+            or not isinstance(dimension_scores, dict)
+            or not all(isinstance(value, (int, float)) for value in dimension_scores.values())
+            or not isinstance(reasoning, str)
+        ):
+            raise ValueError(f"Malformed For-Them response: {str(response)[:200]}")
+        return ForThemScoreResult(float(score), reasoning, dimension_scores)
+
+    def _context_cache(self, profile_section: str) -> Optional[str]:
+        """Upload rubric + profile once so each role only sends its posting."""
+        with self._cache_lock:
+            now = time.monotonic()
+            if now >= self._cache_expires_at or profile_section != self._cache_profile:
+                # Refresh shortly before the server-side TTL lapses; a failed upload is not retried until then.
+                self._cache_expires_at = now + CONTEXT_CACHE_TTL_SECONDS - 60
+                self._cache_profile = profile_section
+                self._cache_name = self.client.create_cache(
+                    [RUBRIC, profile_section],
+                    ttl_seconds=CONTEXT_CACHE_TTL_SECONDS,
+                )
+            return self._cache_name
+
+    @property
+    def _profile(self) -> str:
+        # Read once per run and again only after profile.md changes on disk.
+        return self._load_text(self.profile_file)
 
     def _load_text(self, path: Path) -> str:
-        if not path.exists():
+        text = read_cached_text(path)
+        if text is None:
             raise FileNotFoundError(f"Expected file missing: {path}")
-        return path.read_text()
+        return text
 
 
 if __name__ == "__main__":  # pragma: no cover - manual test requires API key
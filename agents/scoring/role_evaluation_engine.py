@@ -1,79 +1,220 @@
 """Role Evaluation Engine orchestrating the multi-agent scoring pipeline."""
 from __future__ import annotations
 
-import json
+import asyncio
+import os
+import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+import orjson
 
 try:  # pragma: no cover - import flexibility for script/module execution
     from agents.common.csv_writer_agent import CSVWriterAgent
+    from agents.common.gemini_client import GeminiClient
     from agents.scoring.for_me_score_agent import ForMeScoreAgent
-    from agents.scoring.for_them_score_agent import ForThemScoreAgent
+    from agents.scoring.for_them_score_agent import ForThemScoreAgent, ForThemScoreResult
     from agents.common.insight_generator_agent import InsightGeneratorAgent
     from agents.scoring.role_validation_agent import RoleValidationAgent
+    from agents.scoring.embedding_prefilter import PREFILTER_REASONING, PrefilterAgent, prefilter_available
 except ModuleNotFoundError:  # fallback when run from inside agents package
     from ..common.csv_writer_agent import CSVWriterAgent
+    from ..common.gemini_client import GeminiClient
     from .for_me_score_agent import ForMeScoreAgent
-    from .for_them_score_agent import ForThemScoreAgent
+    from .for_them_score_agent import ForThemScoreAgent, ForThemScoreResult
     from ..common.insight_generator_agent import InsightGeneratorAgent
     from .role_validation_agent import RoleValidationAgent
+    from .embedding_prefilter import PREFILTER_REASONING, PrefilterAgent, prefilter_available
+
+# Bounds how many Gemini calls the engine has in flight at once.
+MAX_CONCURRENT = int(os.getenv("ROLE_EVALUATION_MAX_CONCURRENT", "8"))
+# Opt-in: skip For-Them calls for roles far from the profile in embedding space.
+PREFILTER_ENABLED = os.getenv("ROLE_EVALUATION_PREFILTER", "0") == "1"
 
 
 class RoleEvaluationEngine:
-    def __init__(self, base_path: Path | None = None) -> None:
+    def __init__(self, base_path: Path | None = None, *, prefilter: bool | None = None) -> None:
         self.base_path = base_path or Path(__file__).resolve().parents[2]
         self.input_file = self.base_path / "data" / "output" / "all_jobs.json"
         self.output_file = self.base_path / "data" / "output" / "evaluation_results.json"
+        # One JSON line per finished role, so an interrupted run resumes where it stopped.
+        self.progress_file = self.output_file.with_suffix(".jsonl")
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
         self.validator = RoleValidationAgent(self.base_path)
         self.for_me_agent = ForMeScoreAgent(self.base_path)
         self.for_them_agent = ForThemScoreAgent(self.base_path)
         self.insight_agent = InsightGeneratorAgent(self.base_path)
         self.csv_agent = CSVWriterAgent(self.base_path)
+        self.prefilter = None
+        if PREFILTER_ENABLED if prefilter is None else prefilter:
+            if prefilter_available():
+                self.prefilter = PrefilterAgent(self.base_path)
+            else:
+                print(
+                    "[role-evaluation] embedding pre-filter needs sentence-transformers. Continuing without it.",
+                    file=sys.stderr,
+                )
+
+    def run(self, max_concurrent: int = MAX_CONCURRENT) -> List[Dict[str, object]]:
+        return asyncio.run(self._run_and_close(max_concurrent))
+
+    async def _run_and_close(self, max_concurrent: int) -> List[Dict[str, object]]:
+        # The agents' Gemini clients pool connections per event loop; close them with it.
+        try:
+            return await self.arun(max_concurrent)
+        finally:
+            agents = (self.validator, self.for_me_agent, self.for_them_agent, self.insight_agent)
+            clients = [agent.client for agent in agents if isinstance(getattr(agent, "client", None), GeminiClient)]
+            await asyncio.gather(*(client.aclose() for client in clients))
 
-    def run(self) -> List[Dict[str, object]]:
+    async def arun(self, max_concurrent: int = MAX_CONCURRENT) -> List[Dict[str, object]]:
+        """Validate, score and summarise every role with up to ``max_concurrent`` calls in flight.
+
+        Each finished role is appended to ``evaluation_results.jsonl`` straight
+        away; roles already recorded there by an interrupted run are not
+        evaluated again. Once every role is done the results are written to
+        ``evaluation_results.json`` in the order of ``all_jobs.json``, the
+        scored roles are appended to ``job_scores.csv`` in one go and the
+        progress log is removed.
+        """
         roles = self._load_roles()
-        results = []
-        for role in roles:
-            validation = self.validator.evaluate(role)
+        done = self._load_progress()
+        # Only resumed roles are looked up by key; every fresh role is evaluated,
+        # so duplicate postings still get one result each.
+        pending_indices = [index for index, role in enumerate(roles) if self._role_key(role) not in done]
+        pending = [roles[index] for index in pending_indices]
+        sem = asyncio.Semaphore(max_concurrent)
+        write_lock = asyncio.Lock()
+
+        async def validate(role: Dict[str, object]):
+            async with sem:
+                validation = await self.validator.aevaluate(role)
             if not validation.is_valid:
-                results.append(
-                    {
-                        "company": role.get("company"),
-                        "role": role.get("role"),
-                        "status": "skipped",
-                        "blocking_gaps": validation.blocking_gaps,
-                        "warnings": validation.warnings,
-                        "summary": validation.summary,
-                    }
-                )
-                continue
-            for_me = self.for_me_agent.evaluate(role).to_dict()
-            for_them = self.for_them_agent.evaluate(role).to_dict()
-            insight = self.insight_agent.synthesize(role, for_me, for_them).to_dict()
-            self.csv_agent.append_row(
-                role.get("company", "Unknown"),
-                role.get("role", "Unknown"),
-                for_me["for_me_score"],
-                for_them["for_them_score"],
-                insight["insight"],
-            )
-            results.append(
-                {
+                entry = {
                     "company": role.get("company"),
                     "role": role.get("role"),
-                    "for_me": for_me,
-                    "for_them": for_them,
-                    "insight": insight,
+                    "location": role.get("location"),
+                    "status": "skipped",
+                    "blocking_gaps": validation.blocking_gaps,
+                    "warnings": validation.warnings,
+                    "summary": validation.summary,
                 }
+                async with write_lock:
+                    self._record(role, entry, done)
+                return validation, entry
+            return validation, None
+
+        checked = await asyncio.gather(*(validate(role) for role in pending))
+        fresh: Dict[int, Dict[str, object]] = {}
+        valid_indices: List[int] = []
+        for index, (validation, entry) in zip(pending_indices, checked):
+            if validation.is_valid:
+                valid_indices.append(index)
+            else:
+                fresh[index] = entry
+        valid_roles = [roles[index] for index in valid_indices]
+        prefiltered = [False] * len(valid_roles)
+        if self.prefilter is not None:
+            prefiltered = await asyncio.to_thread(self.prefilter.below_threshold, valid_roles)
+
+        # For-Me scoring shares the profile/preferences prompt, so it stays batched
+        # across roles and runs alongside the per-role For-Them calls.
+        for_me_task = asyncio.ensure_future(self.for_me_agent.aevaluate_many(valid_roles, sem=sem))
+        try:
+            entries = await asyncio.gather(
+                *(
+                    self._process_role(role, index, for_me_task, sem, write_lock, done, skip_for_them=skip)
+                    for index, (role, skip) in enumerate(zip(valid_roles, prefiltered))
+                )
+            )
+        finally:
+            for_me_task.cancel()
+        fresh.update(zip(valid_indices, entries))
+
+        results = [fresh[index] if index in fresh else done[self._role_key(role)] for index, role in enumerate(roles)]
+        tmp_path = self.output_file.with_suffix(".json.tmp")
+        tmp_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, self.output_file)
+        # Rows are written once per run, in input order; a resumed run still owes
+        # the CSV the roles its interrupted predecessor finished.
+        self.csv_agent.append_rows(
+            (
+                result.get("company") or "Unknown",
+                result.get("role") or "Unknown",
+                result["for_me"]["for_me_score"],
+                result["for_them"]["for_them_score"],
+                result["insight"]["insight"],
             )
-        self.output_file.write_text(json.dumps(results, indent=2))
+            for result in results
+            if "for_me" in result
+        )
+        self.progress_file.unlink(missing_ok=True)
         return results
 
+    async def _process_role(
+        self,
+        role: Dict[str, object],
+        index: int,
+        for_me_task: asyncio.Future,
+        sem: asyncio.Semaphore,
+        write_lock: asyncio.Lock,
+        done: Dict[Tuple[str, str, str], Dict[str, object]],
+        *,
+        skip_for_them: bool = False,
+    ) -> Dict[str, object]:
+        if skip_for_them:
+            for_them = ForThemScoreResult(0.0, PREFILTER_REASONING, {}).to_dict()
+        else:
+            async with sem:
+                for_them = (await self.for_them_agent.aevaluate(role)).to_dict()
+        # Shielded so one failing role does not cancel the batch the others wait on.
+        for_me = (await asyncio.shield(for_me_task))[index].to_dict()
+        async with sem:
+            insight = (await self.insight_agent.asynthesize(role, for_me, for_them)).to_dict()
+        entry = {
+            "company": role.get("company"),
+            "role": role.get("role"),
+            "location": role.get("location"),
+            "for_me": for_me,
+            "for_them": for_them,
+            "insight": insight,
+        }
+        async with write_lock:
+            self._record(role, entry, done)
+        return entry
+
+    @staticmethod
+    def _role_key(role: Dict[str, object]) -> Tuple[str, str, str]:
+        # Same title at another location is a separate posting, as in tools/import_roles.py.
+        return str(role.get("company")), str(role.get("role")), str(role.get("location"))
+
+    def _record(
+        self,
+        role: Dict[str, object],
+        entry: Dict[str, object],
+        done: Dict[Tuple[str, str, str], Dict[str, object]],
+    ) -> None:
+        with self.progress_file.open("ab") as handle:
+            handle.write(orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE))
+        done[self._role_key(role)] = entry
+
+    def _load_progress(self) -> Dict[Tuple[str, str, str], Dict[str, object]]:
+        done: Dict[Tuple[str, str, str], Dict[str, object]] = {}
+        if not self.progress_file.exists():
+            return done
+        for line in self.progress_file.read_bytes().splitlines():
+            try:
+                entry = orjson.loads(line)
+            except ValueError:
+                # A crash can leave the last line half-written; that role is simply redone.
+                continue
+            done[self._role_key(entry)] = entry
+        return done
+
     def _load_roles(self) -> List[Dict[str, object]]:
         if not self.input_file.exists():
             raise FileNotFoundError(f"all_jobs.json not found at {self.input_file}")
-        data = json.loads(self.input_file.read_text())
+        data = orjson.loads(self.input_file.read_bytes())
         if not isinstance(data, list):
             raise ValueError("all_jobs.json must contain a JSON array of roles")
         return data
@@ -82,4 +223,4 @@ class RoleEvaluationEngine:
 if __name__ == "__main__":
     engine = RoleEvaluationEngine()
     payload = engine.run()
-    print(json.dumps(payload, indent=2))
+    print(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
@@ -1,18 +1,42 @@
 """LLM-backed role validation agent for the evaluation workflow."""
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from textwrap import dedent
 from typing import Dict, List
 
+import orjson
+
 try:
     from agents.common.gemini_client import GeminiClient, GeminiConfig
 except ImportError:  # pragma: no cover - script execution fallback
     from ..common.gemini_client import GeminiClient, GeminiConfig
 
 
+_PROMPT_TEMPLATE = dedent(
+    """
+    Review the following role description JSON and determine whether it is ready for scoring.
+    Flag *blocking_gaps* for any missing critical data (company, title, must-have qualifications, core responsibilities, etc.).
+    Missing compensation/salary data should be reported as a *warning* only—never make it blocking.
+    If qualifications are described elsewhere (e.g., responsibilities, skills, tech_stack), treat that as sufficient—do NOT require a separate "Qualifications" header.
+    Provide *warnings* for softer issues to fix later.
+
+    Return ONLY JSON shaped exactly like:
+    {{
+      "is_valid": boolean,
+      "blocking_gaps": ["..."],
+      "warnings": ["..."],
+      "confidence": number between 0 and 1,
+      "summary": "one sentence overview"
+    }}
+
+    Role JSON:
+    {role_json}
+    """
+).strip()
+
+
 @dataclass
 class RoleValidationResult:
     is_valid: bool
@@ -47,35 +71,33 @@ class RoleValidationAgent:
         )
 
     def evaluate(self, role_payload: Dict[str, object]) -> RoleValidationResult:
-        prompt = dedent(
-            f"""
-            Review the following role description JSON and determine whether it is ready for scoring.
-            Flag *blocking_gaps* for any missing critical data (company, title, must-have qualifications, core responsibilities, etc.).
-            Missing compensation/salary data should be reported as a *warning* only—never make it blocking.
-            If qualifications are described elsewhere (e.g., responsibilities, skills, tech_stack), treat that as sufficient—do NOT require a separate "Qualifications" header.
-            Provide *warnings* for softer issues to fix later.
-
-            Return ONLY JSON shaped exactly like:
-            {{
-              "is_valid": boolean,
-              "blocking_gaps": ["..."],
-              "warnings": ["..."],
-              "confidence": number between 0 and 1,
-              "summary": "one sentence overview"
-            }}
-
-            Role JSON:
-            {json.dumps(role_payload, indent=2)}
-            """
-        ).strip()
-
         response = self.client.generate_json(
-            prompt,
-            metadata={
-                "role": role_payload.get("role") or role_payload.get("title"),
-                "company": role_payload.get("company"),
-            },
+            self._prompt(role_payload),
+            metadata=self._metadata(role_payload),
+        )
+        return self._to_result(role_payload, response)
+
+    async def aevaluate(self, role_payload: Dict[str, object]) -> RoleValidationResult:
+        """Async variant of :meth:`evaluate`."""
+        response = await self.client.agenerate_json(
+            self._prompt(role_payload),
+            metadata=self._metadata(role_payload),
         )
+        return self._to_result(role_payload, response)
+
+    @staticmethod
+    def _prompt(role_payload: Dict[str, object]) -> str:
+        role_json = orjson.dumps(role_payload, default=str).decode()
+        return _PROMPT_TEMPLATE.format(role_json=role_json)
+
+    @staticmethod
+    def _metadata(role_payload: Dict[str, object]) -> Dict[str, object]:
+        return {
+            "role": role_payload.get("role") or role_payload.get("title"),
+            "company": role_payload.get("company"),
+        }
+
+    def _to_result(self, role_payload: Dict[str, object], response: Dict[str, object]) -> RoleValidationResult:
         blocking_gaps = response.get("blocking_gaps", [])
         warnings = response.get("warnings", [])
         blocking_gaps, warnings = self._downgrade_compensation_gaps(blocking_gaps, warnings)
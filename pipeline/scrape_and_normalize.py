@@ -2,7 +2,7 @@
 
 This script:
 1. Reads a CSV file containing job URLs (with a 'url' column)
-2. Scrapes each URL using Playwright to extract raw text
+2. Scrapes each URL (static HTML, or Playwright when needed) to extract raw text
 3. Creates an intermediate CSV with 'raw_text' column
 4. Passes that to the role_normaliser_agent to convert to structured JSON
 """
@@ -10,18 +10,25 @@ This script:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import json
+import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, AsyncIterator, Dict, List
+from urllib.parse import urlparse
+
+import httpx
+from bs4 import BeautifulSoup
 
 # Ensure project root is in path
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from agents.discovery.role_normaliser_agent import run_agent as run_normaliser, ConversionResult
+from agents.discovery.role_normaliser_agent import arun_agent as arun_normaliser, ConversionResult
 from utils.content_cleaner import clean_job_content
 from utils.logging import configure_logging, get_logger
 
@@ -37,48 +44,184 @@ class ScraperTimeoutError(ScraperError):
     """Raised when page load times out."""
 
 
-async def scrape_with_playwright(url: str, timeout: float = 30.0) -> str:
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+# Job-specific content sections, tried in order.
+JOB_SELECTORS = [
+    "main",
+    "article",
+    "[role='main']",
+    ".job-description",
+    ".job-details",
+    ".job-content",
+    "#job-description",
+    "#job-details",
+    ".posting-description",
+    ".job-posting",
+]
+# Anything shorter is treated as a shell that only fills in after JavaScript runs.
+MIN_CONTENT_CHARS = 100
+# Text extraction only needs the DOM; skip everything that just adds bytes.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+# How long a client-rendered page gets to show one of JOB_SELECTORS after DOM load.
+SELECTOR_WAIT_MS = 5000
+# Pages scraped (and cleaned) at once; each is dominated by network latency.
+SCRAPE_MAX_CONCURRENT = int(os.getenv("SCRAPE_MAX_CONCURRENT", "8"))
+# Per-host cap on top of that, so one careers board never sees a burst.
+SCRAPE_MAX_PER_HOST = int(os.getenv("SCRAPE_MAX_PER_HOST", "2"))
+# Cookies and localStorage kept between runs so cleared bot checks stay cleared.
+BROWSER_STATE_PATH = PROJECT_ROOT / "data" / "cache" / "playwright_state.json"
+
+
+def _job_text_from_html(html: str) -> str | None:
+    """Return the first job section in server-rendered ``html`` with real content."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript", "template"]):
+        tag.decompose()
+    for selector in JOB_SELECTORS:
+        element = soup.select_one(selector)
+        if element is None:
+            continue
+        text = element.get_text("\n", strip=True)
+        if len(text) > MIN_CONTENT_CHARS:
+            logger.debug("Found static job content using selector: %s", selector)
+            return text
+    return None
+
+
+async def scrape_static(url: str, timeout: float = 30.0) -> str | None:
+    """Fetch ``url`` without a browser and extract the job content from its HTML.
+    
+    Greenhouse, Lever, Ashby and most ATS pages render the description on the
+    server. Returns None when the page cannot be fetched statically or its
+    content only appears after JavaScript runs, so the caller can fall back
+    to Playwright.
+    """
+    try:
+        async with httpx.AsyncClient(
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+        ) as client:
+            response = await client.get(url)
+    except httpx.HTTPError as exc:
+        logger.debug("Static fetch failed for %s: %s", url, exc)
+        return None
+    if response.status_code >= 400 or "html" not in response.headers.get("content-type", ""):
+        return None
+    return _job_text_from_html(response.text)
+
+
+async def _abort_heavy_requests(route: Any) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserSession:
+    """One headless Chromium shared by every Playwright scrape of a run.
+    
+    The browser is launched on the first :meth:`page` call, so runs whose
+    pages all render statically never start one; each scrape gets a fresh
+    page in a shared context that skips images, fonts, media and
+    stylesheets. The context starts from the storage state saved by the
+    previous run and :meth:`close` saves it again, so anti-bot challenges
+    passed once are not re-done on every run. Call :meth:`close` when the
+    run is done.
+    """
+
+    def __init__(self, state_path: Path | None = BROWSER_STATE_PATH) -> None:
+        self.state_path = state_path
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Any]:
+        async with self._lock:
+            if self._context is None:
+                from playwright.async_api import async_playwright
+
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=["--disable-dev-shm-usage"],
+                )
+                storage_state = str(self.state_path) if self.state_path and self.state_path.exists() else None
+                self._context = await self._browser.new_context(user_agent=USER_AGENT, storage_state=storage_state)
+                await self._context.route("**/*", _abort_heavy_requests)
+        page = await self._context.new_page()
+        try:
+            yield page
+        finally:
+            await page.close()
+
+    async def close(self) -> None:
+        async with self._lock:
+            if self._context is not None and self.state_path is not None:
+                try:
+                    self.state_path.parent.mkdir(parents=True, exist_ok=True)
+                    await self._context.storage_state(path=str(self.state_path))
+                except Exception as exc:  # the next run just starts without cookies
+                    logger.warning("Could not save browser state to %s: %s", self.state_path, exc)
+            if self._browser is not None:
+                await self._browser.close()
+            if self._playwright is not None:
+                await self._playwright.stop()
+            self._playwright = self._browser = self._context = None
+
+
+async def scrape_job_page(url: str, timeout: float = 30.0, *, session: BrowserSession | None = None) -> str:
+    """Return the job content of ``url``, launching a browser only when needed."""
+    content = await scrape_static(url, timeout=timeout)
+    if content is not None:
+        logger.info("Retrieved %d characters from static HTML of %s", len(content), url)
+        return content
+    return await scrape_with_playwright(url, timeout=timeout, session=session)
+
+
+async def scrape_with_playwright(url: str, timeout: float = 30.0, *, session: BrowserSession | None = None) -> str:
     """Scrape a URL using Playwright and return the text content.
     
     Args:
         url: The URL to scrape
         timeout: Timeout in seconds for page load
+        session: Browser shared across a run; a one-off browser is launched
+            (and closed) when omitted
         
     Returns:
         The text content of the page
     """
-    from playwright.async_api import async_playwright
-    
+    if session is None:
+        session = BrowserSession()
+        try:
+            return await scrape_with_playwright(url, timeout=timeout, session=session)
+        finally:
+            await session.close()
+
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
     logger.info("Playwright navigate -> %s", url)
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        try:
-            page = await browser.new_page()
-            
-            await page.goto(url, wait_until="networkidle", timeout=int(timeout * 1000))
+    try:
+        async with session.page() as page:
+            # Analytics beacons can keep the network busy indefinitely, so wait for
+            # the DOM and then for a job section instead of for network idle.
+            await page.goto(url, wait_until="domcontentloaded", timeout=int(timeout * 1000))
+            try:
+                await page.wait_for_selector(", ".join(JOB_SELECTORS), timeout=SELECTOR_WAIT_MS)
+            except PlaywrightTimeoutError:
+                logger.debug("No job section rendered on %s after %dms", url, SELECTOR_WAIT_MS)
             
             # Try to find job-specific content sections first
             job_content = None
-            job_selectors = [
-                "main",
-                "article",
-                "[role='main']",
-                ".job-description",
-                ".job-details",
-                ".job-content",
-                "#job-description",
-                "#job-details",
-                ".posting-description",
-                ".job-posting",
-            ]
-            
-            for selector in job_selectors:
+            for selector in JOB_SELECTORS:
                 try:
                     element = await page.query_selector(selector)
                     if element:
                         job_content = await element.inner_text()
-                        if job_content and len(job_content.strip()) > 100:
+                        if job_content and len(job_content.strip()) > MIN_CONTENT_CHARS:
                             logger.debug("Found job content using selector: %s", selector)
                             break
                 except Exception:
@@ -92,11 +235,40 @@ async def scrape_with_playwright(url: str, timeout: float = 30.0) -> str:
             logger.info("Successfully retrieved %d characters", len(job_content))
             return job_content
             
-        except Exception as exc:
-            logger.error("Playwright navigation error: %s", exc)
-            raise ScraperTimeoutError(f"Failed to load {url}: {exc}") from exc
-        finally:
-            await browser.close()
+    except Exception as exc:
+        logger.error("Playwright navigation error: %s", exc)
+        raise ScraperTimeoutError(f"Failed to load {url}: {exc}") from exc
+
+
+async def scrape_pages(
+    urls: List[str],
+    *,
+    timeout: float = 30.0,
+    concurrency: int = SCRAPE_MAX_CONCURRENT,
+    session: BrowserSession | None = None,
+) -> List[str | BaseException]:
+    """Scrape ``urls`` concurrently, at most ``concurrency`` at a time.
+    
+    No more than ``SCRAPE_MAX_PER_HOST`` of those hit the same host at once.
+    Returns one entry per URL, in input order: the page content, or the
+    exception raised while scraping it.
+    """
+    sem = asyncio.Semaphore(max(concurrency, 1))
+    host_sems: Dict[str, asyncio.Semaphore] = {}
+    owns_session = session is None
+    session = session or BrowserSession()
+
+    async def one(url: str) -> str:
+        host_sem = host_sems.setdefault(urlparse(url).netloc, asyncio.Semaphore(max(SCRAPE_MAX_PER_HOST, 1)))
+        # Host first, so a URL waiting on a busy host does not hold a global slot.
+        async with host_sem, sem:
+            return await scrape_job_page(url, timeout=timeout, session=session)
+
+    try:
+        return await asyncio.gather(*(one(url) for url in urls), return_exceptions=True)
+    finally:
+        if owns_session:
+            await session.close()
 
 
 DEFAULT_INPUT_DIR = PROJECT_ROOT / "data" / "job_urls"
@@ -111,6 +283,7 @@ async def scrape_urls_to_csv(
     timeout: float | None = None,
     clean_with_llm: bool = True,
     max_urls: int | None = None,
+    concurrency: int = SCRAPE_MAX_CONCURRENT,
 ) -> tuple[int, int]:
     """Scrape job URLs and create a CSV with raw_text column.
     
@@ -120,6 +293,7 @@ async def scrape_urls_to_csv(
         timeout: Timeout for each scrape in seconds
         clean_with_llm: Whether to clean content with LLM
         max_urls: Maximum number of URLs to process
+        concurrency: Maximum number of URLs scraped and cleaned at once
     
     Returns:
         Tuple of (successful_count, failed_count)
@@ -161,49 +335,57 @@ async def scrape_urls_to_csv(
     # Use provided timeout or default
     scrape_timeout = timeout if timeout is not None else 30.0
     
+    # Static HTML first, one shared browser for the pages that need it
+    outcomes: List[str | BaseException] = await scrape_pages(urls, timeout=scrape_timeout, concurrency=concurrency)
+    
+    # Optionally clean with LLM, as many pages at once as were scraped
+    if clean_with_llm:
+        sem = asyncio.Semaphore(max(concurrency, 1))
+        
+        async def clean(idx: int, url: str, raw_content: str) -> str:
+            async with sem:
+                logger.info(f"[{idx}/{len(urls)}] Cleaning content with LLM...")
+                return await asyncio.to_thread(clean_job_content, raw_content, url)
+        
+        cleaned = await asyncio.gather(
+            *(
+                clean(idx, url, outcome)
+                for idx, (url, outcome) in enumerate(zip(urls, outcomes), start=1)
+                if not isinstance(outcome, BaseException)
+            ),
+            return_exceptions=True,
+        )
+        pending = iter(cleaned)
+        outcomes = [outcome if isinstance(outcome, BaseException) else next(pending) for outcome in outcomes]
+    
     with output_csv.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.DictWriter(handle, fieldnames=["url", "raw_text", "status"])
         writer.writeheader()
         
-        for idx, url in enumerate(urls, start=1):
-            logger.info(f"[{idx}/{len(urls)}] Scraping {url}")
-            
-            try:
-                # Scrape the URL using Playwright
-                raw_content = await scrape_with_playwright(url, timeout=scrape_timeout)
-                
-                # Optionally clean with LLM
-                if clean_with_llm:
-                    logger.info(f"[{idx}/{len(urls)}] Cleaning content with LLM...")
-                    raw_text = clean_job_content(raw_content, url)
+        for idx, (url, outcome) in enumerate(zip(urls, outcomes), start=1):
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, ScraperError):
+                    logger.error(f"[{idx}/{len(urls)}] Failed to scrape {url}: {outcome}")
                 else:
-                    raw_text = raw_content
-                
-                writer.writerow({
-                    "url": url,
-                    "raw_text": raw_text,
-                    "status": "success"
-                })
-                successful += 1
-                logger.info(f"[{idx}/{len(urls)}] Successfully scraped {len(raw_text)} characters")
-                
-            except ScraperError as exc:
-                logger.error(f"[{idx}/{len(urls)}] Failed to scrape {url}: {exc}")
-                writer.writerow({
-                    "url": url,
-                    "raw_text": "",
-                    "status": f"failed: {type(exc).__name__}"
-                })
-                failed += 1
-                
-            except Exception as exc:
-                logger.exception(f"[{idx}/{len(urls)}] Unexpected error scraping {url}")
+                    logger.error(
+                        f"[{idx}/{len(urls)}] Unexpected error scraping {url}",
+                        exc_info=(type(outcome), outcome, outcome.__traceback__),
+                    )
                 writer.writerow({
                     "url": url,
                     "raw_text": "",
-                    "status": f"failed: {type(exc).__name__}"
+                    "status": f"failed: {type(outcome).__name__}"
                 })
                 failed += 1
+                continue
+            
+            writer.writerow({
+                "url": url,
+                "raw_text": outcome,
+                "status": "success"
+            })
+            successful += 1
+            logger.info(f"[{idx}/{len(urls)}] Successfully scraped {len(outcome)} characters")
     
     logger.info(f"Scraping complete: {successful} successful, {failed} failed")
     logger.info(f"Intermediate CSV saved to {output_csv}")
@@ -311,7 +493,7 @@ async def run_full_pipeline(
     if mock_normalized_json:
         results = _apply_mock_normalization(intermediate_csv, output_dir, mock_json=mock_normalized_json)
     else:
-        results = run_normaliser(
+        results = await arun_normaliser(
             intermediate_csv,
             prompt_path=prompt_path,
             example_path=example_path,
@@ -1,11 +1,18 @@
-"""Run 8 iterations of cover letter optimization and select the best."""
+"""Run up to 8 iterations of cover letter optimization and select the best.
 
+Without arguments the built-in Meta job is optimised. ``--jobs jobs.json``
+takes a JSON list of jobs (``company``, ``job_title``, ``job_description`` and
+optional ``location``/``style_notes``) and optimises them concurrently.
+"""
+
+import argparse
+import json
 from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from agents.cover_letter.batch_runner import run_jobs
 from agents.cover_letter.cover_letter_generator_agent import CoverLetterGeneratorAgent
-from agents.cover_letter.hr_simulation_agent import HRSimulationAgent
 
 job_title = 'AI Software Engineer'
 company = 'Meta'
@@ -47,117 +54,89 @@ This Meta AI role was discovered, scraped, scored, and matched through this auto
 Make this cover letter compelling, confident, and technically impressive. Reference the multi-agent system subtly as proof of capability. This is meta - an AI system applying for an AI job!
 """
 
-def main():
-    generator = CoverLetterGeneratorAgent()
-    hr = HRSimulationAgent()
-    
-    MAX_ITERATIONS = 8
-    versions = []
-    
-    print('=' * 70)
-    print('8-ITERATION COVER LETTER OPTIMIZATION')
-    print('=' * 70)
-    
-    # Initial generation
-    print(f'\n[Iteration 1] Generating initial cover letter...')
-    letter = generator.generate(
-        job_title=job_title,
-        job_description=job_description,
-        company=company,
-        location=location,
-        style_notes=style_notes,
-        iteration=1,
-    )
-    
-    for iteration in range(1, MAX_ITERATIONS + 1):
-        print(f'\n[Iteration {iteration}] Evaluating...')
-        
-        feedback = hr.evaluate(
-            cover_letter=letter,
-            job_title=job_title,
-            job_description=job_description,
-            company=company,
-            iteration=iteration,
-        )
-        
-        score = feedback.get('score', 0)
-        print(f'  Score: {score}/100')
-        
-        # Store this version
-        versions.append({
-            'iteration': iteration,
-            'score': score,
-            'letter': letter,
-            'feedback': feedback,
-        })
-        
-        if iteration < MAX_ITERATIONS:
-            # Format feedback for revision
-            positives = '\n'.join('- ' + p for p in feedback.get('positives', []))
-            negatives = '\n'.join('- ' + n for n in feedback.get('negatives', []))
-            suggestions = '\n'.join('- ' + s for s in feedback.get('fix_suggestions', []))
-            
-            feedback_text = f"""
-HR FEEDBACK (Score: {score}/100):
-
-POSITIVES (keep these):
-{positives}
-
-NEGATIVES (must fix):
-{negatives}
-
-SPECIFIC SUGGESTIONS (implement all):
-{suggestions}
-
-IMPORTANT: Address ALL negatives and implement ALL suggestions while preserving the positives. Make it more compelling.
-"""
-            print(f'  Revising for iteration {iteration + 1}...')
-            letter = generator.revise(
-                current_letter=letter,
-                feedback=feedback_text,
-                iteration=iteration + 1,
-            )
-    
-    # Find best version
-    best = max(versions, key=lambda x: x['score'])
-    
+MAX_ITERATIONS = 8
+OUTPUT_DIR = Path(__file__).resolve().parents[1] / 'data' / 'output'
+
+
+def print_result(result):
+    if result['status'] != 'success':
+        print(f"\n✗ {result['job_id']} failed: {result['error']}")
+        return
+    history = result['history']
+    best_feedback = history[result['best_iteration'] - 1]
+
     print('\n' + '=' * 70)
-    print('SCORE PROGRESSION')
+    print(f"SCORE PROGRESSION - {result['company']} {result['job_title']}")
     print('=' * 70)
-    for v in versions:
-        marker = ' ★ BEST' if v['iteration'] == best['iteration'] else ''
-        print(f"  Iteration {v['iteration']}: {v['score']}/100{marker}")
-    
+    for iteration, feedback in enumerate(history, start=1):
+        marker = ' ★ BEST' if iteration == result['best_iteration'] else ''
+        print(f"  Iteration {iteration}: {feedback.get('score', 0)}/100{marker}")
+    if not CoverLetterGeneratorAgent.should_revise(history[-1]):
+        print('  Accepted by HR review, no further revision needed.')
+
     print('\n' + '=' * 70)
-    print(f"BEST COVER LETTER (Iteration {best['iteration']}, Score: {best['score']}/100)")
+    print(f"BEST COVER LETTER (Iteration {result['best_iteration']}, Score: {result['best_score']}/100)")
     print('=' * 70)
-    print(best['letter'])
+    print(result['best_letter'])
     print('=' * 70)
-    
+
     print('\n' + '=' * 70)
     print('BEST VERSION - HR EVALUATION')
     print('=' * 70)
-    print(f"Score: {best['score']}/100")
+    print(f"Score: {result['best_score']}/100")
     print('\nPositives:')
-    for p in best['feedback'].get('positives', []):
+    for p in best_feedback.get('positives', []):
         print(f'  ✓ {p}')
     print('\nNegatives:')
-    for n in best['feedback'].get('negatives', []):
+    for n in best_feedback.get('negatives', []):
         print(f'  ✗ {n}')
     print('=' * 70)
-    
-    # Save best version
-    output_path = Path(__file__).resolve().parents[1] / 'data' / 'output' / 'best_cover_letter_meta.md'
-    output_path.write_text(f"""# Cover Letter - Meta AI Software Engineer
 
-**Score: {best['score']}/100** (Iteration {best['iteration']} of 8)
+
+def save_result(result, output_path):
+    output_path.write_text(f"""# Cover Letter - {result['company']} {result['job_title']}
+
+**Score: {result['best_score']}/100** (Iteration {result['best_iteration']} of {MAX_ITERATIONS})
 
 ---
 
-{best['letter']}
+{result['best_letter']}
 """)
     print(f'\n✓ Best version saved to: {output_path}')
 
 
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--jobs', type=Path, help='JSON list of jobs to optimise instead of the Meta sample')
+    args = parser.parse_args()
+
+    if args.jobs:
+        jobs = json.loads(args.jobs.read_text())
+    else:
+        jobs = [{
+            'job_title': job_title,
+            'company': company,
+            'location': location,
+            'job_description': job_description,
+            'style_notes': style_notes,
+        }]
+
+    print('=' * 70)
+    print(f'{MAX_ITERATIONS}-ITERATION COVER LETTER OPTIMIZATION ({len(jobs)} job(s))')
+    print('=' * 70)
+
+    results = run_jobs(jobs, max_iterations=MAX_ITERATIONS)
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    for result in results:
+        print_result(result)
+        if result['status'] != 'success':
+            continue
+        if args.jobs:
+            save_result(result, OUTPUT_DIR / f"best_cover_letter_{result['job_id']}.md")
+        else:
+            save_result(result, OUTPUT_DIR / 'best_cover_letter_meta.md')
+
+
 if __name__ == "__main__":
     main()
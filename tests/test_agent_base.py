@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from agents.common.agent_base import AgentBase
+
+
+def test_get_profile_picks_up_created_and_edited_files(tmp_path: Path) -> None:
+    profile = tmp_path / "profile.md"
+
+    assert AgentBase.get_profile(profile) is None
+
+    profile.write_text("First draft")
+    assert AgentBase.get_profile(profile) == "First draft"
+
+    profile.write_text("Second draft")
+    os.utime(profile, ns=(profile.stat().st_mtime_ns + 10**9,) * 2)
+    assert AgentBase.get_profile(profile) == "Second draft"
@@ -60,3 +60,9 @@ def test_choose_careers_page_raises_on_invalid_json() -> None:
 	llm = FakeLLM("not json")
 	with pytest.raises(ValueError):
 		choose_careers_page(SAMPLE_RESULTS, llm)
+
+
+def test_choose_careers_page_rejects_non_object_json() -> None:
+	llm = FakeLLM('["https://www.rockstargames.com/careers"]')
+	with pytest.raises(ValueError):
+		choose_careers_page(SAMPLE_RESULTS, llm)
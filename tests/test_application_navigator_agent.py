@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from pathlib import Path
+
+import pytest
+
+from agents.auto_apply import application_navigator_agent
+from agents.auto_apply.application_navigator_agent import ApplicationNavigatorAgent, read_snapshot
+from agents.auto_apply.context import AutoApplyContext
+from agents.auto_apply.playwright_client import PlaywrightClientError
+
+PAGE = """
+<html><head><script>var form = "<form><input name='fake'></form>";</script></head><body>
+<a href="/apply/1" data-ui="apply-button">Apply for this job</a>
+<a href="/privacy">Privacy</a>
+<form>
+  <div class="styles--3aPac"><strong>*</strong><strong>First name</strong><input name="firstname" required></div>
+  <label for="email">Email address</label><input id="email" type="email">
+  <span id="q1">Cover</span><span id="q2">letter</span><textarea name="cover" aria-labelledby="q1 q2"></textarea>
+  <select name="country"><option value="">Select</option><option value="uk">United Kingdom</option></select>
+  <fieldset><legend>Need sponsorship?</legend>
+    <label><input type="radio" name="sponsor" value="yes">Yes</label>
+    <label><input type="radio" name="sponsor" value="no">No</label>
+  </fieldset>
+  <input type="hidden" name="token"><input type="submit" value="Send">
+</form>
+</body></html>
+"""
+
+
+@pytest.fixture
+def agent(tmp_path: Path) -> ApplicationNavigatorAgent:
+    return ApplicationNavigatorAgent(tmp_path)
+
+
+@pytest.fixture(params=["plain", "zstd"])
+def snapshot_codec(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run a test with snapshots written uncompressed and, when available, as .zst."""
+    module = None if request.param == "plain" else pytest.importorskip("zstandard")
+    monkeypatch.setattr(application_navigator_agent, "zstandard", module)
+
+
+def _snapshots(agent: ApplicationNavigatorAgent, stem: str) -> list[Path]:
+    return sorted(agent.snapshot_dir.glob(f"{stem}.html*"))
+
+
+def test_detect_apply_methods(agent: ApplicationNavigatorAgent) -> None:
+    methods = agent._detect_apply_methods(agent._parse(PAGE))
+
+    assert [(method.label, method.selector, method.confidence) for method in methods] == [
+        ("Apply for this job", "[data-ui='apply-button']", 0.9)
+    ]
+
+
+def test_extract_fields_resolves_labels(agent: ApplicationNavigatorAgent) -> None:
+    fields = agent._extract_fields(agent._parse(PAGE), step_index=0)
+
+    assert [(field.field_id, field.label, field.input_type) for field in fields] == [
+        ("firstname", "First name", "input"),
+        ("email", "Email address", "input:email"),
+        ("cover", "Cover letter", "textarea"),
+        ("country", "country", "select"),
+        ("sponsor_0", "Need sponsorship?", "input:radio"),
+    ]
+    assert fields[0].required
+    assert fields[3].option_values == {"Select": "Select", "United Kingdom": "uk"}
+    assert fields[4].option_selectors == {
+        "Yes": "input[name='sponsor'][value='yes']",
+        "No": "input[name='sponsor'][value='no']",
+    }
+
+
+def test_parse_skips_head_but_finds_aria_targets_outside_kept_tags(agent: ApplicationNavigatorAgent) -> None:
+    dom = agent._parse(
+        '<html><head><style>p {}</style></head><body><p id="intro">Tell us about you</p>'
+        '<section><textarea name="about" aria-labelledby="intro"></textarea></section></body></html>'
+    )
+
+    assert dom.soup.find("style") is None
+    assert [field.label for field in agent._extract_fields(dom, step_index=0)] == ["Tell us about you"]
+
+
+def test_extract_fields_skips_search_forms(agent: ApplicationNavigatorAgent) -> None:
+    dom = agent._parse(
+        '<form role="search"><input name="keywords"></form>'
+        '<form><input type="search" name="q"><input type="hidden" name="page"></form>'
+        '<div><input name="fullname"></div>'
+    )
+
+    assert [field.field_id for field in agent._extract_fields(dom, step_index=0)] == ["fullname"]
+
+
+class FakeSession:
+    """Shows ``dom``; apply links serve ``links`` and the apply button reveals ``revealed``."""
+
+    def __init__(self, dom: str, *, links: dict[str, str] | None = None, revealed: str | None = None) -> None:
+        self.dom = dom
+        self.links = links or {}
+        self.revealed = revealed
+        self.visited: list[str] = []
+        self.clicks: list[str] = []
+        self.warmups = 0
+
+    async def warmup(self) -> None:
+        self.warmups += 1
+
+    async def goto(self, url: str, wait_until: str = "load") -> None:
+        self.visited.append(url)
+        self.dom = self.links.get(url, self.dom)
+
+    async def fetch_dom(self, url: str, wait_until: str = "load", wait_for=None, wait_timeout: float = 5) -> str:
+        if url not in self.links:
+            raise PlaywrightClientError(f"cannot load {url}")
+        return self.links[url]
+
+    async def wait_for_selector(self, selector: str, timeout: float | None = None) -> None:
+        raise PlaywrightClientError(f"no {selector}")
+
+    async def click(self, selector=None, text=None) -> None:
+        if self.revealed is None or selector != "[data-ui='apply-button']":
+            raise PlaywrightClientError("not clickable")
+        self.clicks.append(selector)
+        self.dom = self.revealed
+
+    async def click_first_matching(self, selector: str, text: re.Pattern[str]) -> str | None:
+        for _, label in re.findall(r"<(button|a)\b[^>]*>(.*?)</\1>", self.dom):
+            if text.search(label):
+                self.clicks.append(label)
+                return label
+        return None
+
+    async def get_dom(self) -> str:
+        return self.dom
+
+    async def count(self, selector: str) -> int:
+        return sum(self.dom.count(f"<{tag}") for tag in ("input", "textarea", "select"))
+
+
+def _context(tmp_path: Path) -> AutoApplyContext:
+    return AutoApplyContext(
+        job_url="https://jobs.example.com/1",
+        cover_letter="",
+        profile_path=tmp_path / "profile.json",
+        cv_path=tmp_path / "cv.pdf",
+        cover_letter_path=tmp_path / "cover_letter.txt",
+        knowledge_store_dir=tmp_path / "knowledge",
+        answers_dir=tmp_path / "answers",
+        job_name="acme",
+    )
+
+
+def test_run_async_loads_apply_links_and_opens_the_form(
+    agent: ApplicationNavigatorAgent, tmp_path: Path, snapshot_codec: None
+) -> None:
+    landing = (
+        '<a href="/apply/1" data-ui="apply-button">Apply for this job</a>'
+        '<a href="https://jobs.example.com/1#top">Apply</a><a href="/apply/broken">Apply with LinkedIn</a>'
+    )
+    session = FakeSession(landing, links={"https://jobs.example.com/apply/1": PAGE})
+
+    result = asyncio.run(agent.run_async(_context(tmp_path), session))
+
+    assert session.clicks == []
+    assert session.visited[-1] == "https://jobs.example.com/apply/1"
+    assert [field.field_id for field in result.fields][:2] == ["firstname", "email"]
+    assert read_snapshot(result.raw_dom_snapshot_path) == landing
+    assert [read_snapshot(path) for path in _snapshots(agent, "acme_step1")] == [PAGE]
+
+
+def test_run_async_clicks_apply_links_whose_prefetched_page_had_no_form(
+    agent: ApplicationNavigatorAgent, tmp_path: Path
+) -> None:
+    landing = '<a href="/apply/1" data-ui="apply-button">Apply for this job</a>'
+    session = FakeSession(landing, links={"https://jobs.example.com/apply/1": "<div id='root'></div>"}, revealed=PAGE)
+
+    result = asyncio.run(agent.run_async(_context(tmp_path), session))
+
+    assert session.clicks == ["[data-ui='apply-button']"]
+    assert [field.field_id for field in result.fields][:2] == ["firstname", "email"]
+
+
+def test_run_async_clicks_in_page_apply_button(agent: ApplicationNavigatorAgent, tmp_path: Path) -> None:
+    session = FakeSession('<button data-ui="apply-button">Apply</button>', revealed=PAGE)
+
+    result = asyncio.run(agent.run_async(_context(tmp_path), session))
+
+    assert session.warmups == 1
+    assert session.clicks == ["[data-ui='apply-button']"]
+    assert result.fields[0].step_index == 1
+
+
+def test_run_async_keeps_only_fields_new_to_the_clicked_step(agent: ApplicationNavigatorAgent, tmp_path: Path) -> None:
+    landing = '<button data-ui="apply-button">Apply</button>' + PAGE
+    session = FakeSession(landing, revealed=PAGE.replace("</form>", '<input name="linkedin"></form>'))
+
+    result = asyncio.run(agent.run_async(_context(tmp_path), session))
+
+    assert [(field.field_id, field.step_index) for field in result.fields][-2:] == [("sponsor_0", 0), ("linkedin", 1)]
+    assert len(result.fields) == 6
+
+
+def test_run_async_skips_clicks_that_change_nothing(
+    agent: ApplicationNavigatorAgent, tmp_path: Path, snapshot_codec: None
+) -> None:
+    landing = '<button data-ui="apply-button">Apply</button>'
+    session = FakeSession(landing, revealed=landing)
+
+    result = asyncio.run(agent.run_async(_context(tmp_path), session))
+
+    assert session.clicks == ["[data-ui='apply-button']"]
+    assert result.fields == []
+    assert _snapshots(agent, "acme_step1") == []
+
+
+def test_selectors_escape_quotes_in_attribute_values(agent: ApplicationNavigatorAgent) -> None:
+    fields = agent._extract_fields(agent._parse("<textarea placeholder=\"What's your story?\"></textarea>"), step_index=0)
+
+    assert fields[0].selector == "[placeholder='What\\'s your story?']"
+
+
+@pytest.mark.parametrize(
+    ("banner", "clicked"),
+    [
+        ("<button>Accept</button><button>Accept all</button>", ["Accept all"]),
+        ("<p>Please accept our terms.</p><a href='#'>Got it</a>", ["Got it"]),
+        ("<p>Please accept our terms.</p>", []),
+    ],
+)
+def test_dismiss_blocking_ui_clicks_controls_in_keyword_priority(
+    agent: ApplicationNavigatorAgent, banner: str, clicked: list[str]
+) -> None:
+    session = FakeSession(banner)
+
+    asyncio.run(agent._dismiss_blocking_ui(session))
+
+    assert session.clicks == clicked
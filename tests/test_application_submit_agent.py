@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from pathlib import Path
+
+import pytest
+
+from agents.auto_apply.application_submit_agent import SUBMIT_CANDIDATES, SUBMIT_RE, ApplicationSubmitAgent
+from agents.auto_apply.context import FieldDescriptor, FieldKind
+
+
+class FakeSession:
+    """Holds the texts of the page's buttons; the first ``broken`` of them cannot be clicked."""
+
+    def __init__(self, buttons: list[str], broken: int = 0) -> None:
+        self.buttons = buttons
+        self.broken = broken
+        self.queries: list[tuple[str, re.Pattern[str]]] = []
+
+    async def click_first_matching(self, selector: str, text: re.Pattern[str]) -> str | None:
+        self.queries.append((selector, text))
+        matches = [button for button in self.buttons if text.search(button)]
+        return matches[self.broken] if len(matches) > self.broken else None
+
+
+def test_click_submit_uses_first_clickable_match(tmp_path: Path) -> None:
+    agent = ApplicationSubmitAgent(tmp_path)
+    session = FakeSession(["Back", "Save draft", "SUBMIT application", "Send"], broken=1)
+    log: list[str] = []
+
+    asyncio.run(agent._click_submit(session, log))
+
+    assert session.queries == [(SUBMIT_CANDIDATES, SUBMIT_RE)]
+    assert log == ["Clicked submit button: Send"]
+
+
+def test_click_submit_reports_missing_button(tmp_path: Path) -> None:
+    log: list[str] = []
+
+    asyncio.run(ApplicationSubmitAgent(tmp_path)._click_submit(FakeSession(["Back"]), log))
+
+    assert log == ["No submit button detected; manual review may be required"]
+
+
+@pytest.mark.parametrize(
+    ("input_type", "label", "metadata", "kind"),
+    [
+        ("input:file", "Upload your Cover Letter", {}, FieldKind.COVER_LETTER_UPLOAD),
+        ("input:file", "Attachments", {}, FieldKind.CV_UPLOAD),
+        ("input", "Résumé", {}, FieldKind.CV_UPLOAD),
+        ("input:checkbox", "I agree to you storing my CV", {}, FieldKind.CHECKBOX),
+        ("input:radio", "Need sponsorship?", {}, FieldKind.RADIO),
+        ("select", "Country", {}, FieldKind.SELECT),
+        ("input", "Location", {"role": "combobox"}, FieldKind.COMBOBOX),
+        ("input", "Degree", {"readonly": "true", "aria-controls": "degree-list"}, FieldKind.COMBOBOX),
+        ("textarea", "Why us?", {}, FieldKind.TEXT),
+    ],
+)
+def test_field_kind_is_classified_once(input_type: str, label: str, metadata: dict[str, str], kind: FieldKind) -> None:
+    field = FieldDescriptor("f", label, label, input_type, 0, False, "#f", metadata=metadata)
+
+    assert field.kind is kind
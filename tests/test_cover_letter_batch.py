@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+
+from agents.cover_letter.batch_runner import run_jobs
+from agents.cover_letter.cover_letter_generator_agent import CoverLetterGeneratorAgent
+
+
+class FakeGenerator:
+    should_revise = staticmethod(CoverLetterGeneratorAgent.should_revise)
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str | None, int]] = []
+        self.lock = threading.Lock()
+
+    def generate(self, *, job_title, job_description, company, location, style_notes, iteration, job_id):
+        with self.lock:
+            self.calls.append(("generate", job_id, iteration))
+        return f"{company} draft {iteration}"
+
+    def revise(self, *, current_letter, feedback, iteration, style_notes, job_id):
+        with self.lock:
+            self.calls.append(("revise", job_id, iteration))
+        return current_letter.rsplit(" ", 1)[0] + f" {iteration}"
+
+
+class FakeHR:
+    def evaluate(self, *, cover_letter, job_title, job_description, company, iteration, job_id):
+        return {"score": 60 + iteration * 10, "negatives": ["vague"], "fix_suggestions": []}
+
+
+def test_run_jobs_preserves_order_and_keeps_jobs_apart() -> None:
+    jobs = [
+        {"company": "Acme", "job_title": "Engineer", "job_description": "Build things"},
+        {"company": "Globex", "job_title": "Engineer", "job_description": "Build more"},
+        {"company": "Acme", "job_title": "Engineer", "job_description": "Cross-listed"},
+    ]
+    generator = FakeGenerator()
+
+    results = run_jobs(jobs, generator=generator, hr_agent=FakeHR(), max_iterations=2, max_workers=4)
+
+    assert [r["company"] for r in results] == ["Acme", "Globex", "Acme"]
+    assert len({r["job_id"] for r in results}) == 3
+    assert all(r["best_score"] == 80 and r["best_iteration"] == 2 for r in results)
+    assert results[1]["best_letter"] == "Globex draft 2"
+    assert sum(1 for call in generator.calls if call[0] == "revise") == 3
+
+
+def test_run_jobs_skips_revision_once_letter_is_accepted() -> None:
+    class ApprovingHR:
+        def evaluate(self, **_):
+            return {"score": 92, "negatives": [], "fix_suggestions": []}
+
+    generator = FakeGenerator()
+    results = run_jobs(
+        [{"company": "Acme", "job_title": "Engineer", "job_description": "Build things"}],
+        generator=generator,
+        hr_agent=ApprovingHR(),
+        max_iterations=3,
+    )
+
+    assert results[0]["best_score"] == 92
+    assert [call[0] for call in generator.calls] == ["generate"]
+
+
+def test_should_revise_when_suggestions_remain() -> None:
+    assert CoverLetterGeneratorAgent.should_revise({"score": 95, "fix_suggestions": ["Tighten intro"]})
+    assert CoverLetterGeneratorAgent.should_revise({"score": 70, "fix_suggestions": []})
+    assert not CoverLetterGeneratorAgent.should_revise({"score": 85, "fix_suggestions": []})
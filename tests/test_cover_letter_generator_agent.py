@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from agents.cover_letter import cover_letter_generator_agent
+from agents.cover_letter.cover_letter_generator_agent import CoverLetterGeneratorAgent
+
+
+class FakeClient:
+    def __init__(self, response: str) -> None:
+        self.response = response
+        self.prompts: list[str] = []
+
+    def generate_text(self, prompt: str, **_) -> str:
+        self.prompts.append(prompt)
+        return self.response
+
+
+@pytest.fixture
+def agent(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> CoverLetterGeneratorAgent:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    (tmp_path / "data" / "writing_samples").mkdir(parents=True)
+    (tmp_path / "data" / "writing_samples" / "sample.md").write_text("I write plainly. Moreover, I am brief.")
+    (tmp_path / "data" / "profile.md").write_text("Python engineer")
+    agent = CoverLetterGeneratorAgent(tmp_path, use_context_cache=False)
+    agent.fingerprint_client = FakeClient("Plain, brief, favours 'moreover'.")
+    agent.generator_client = FakeClient("Dear Hiring Manager")
+    return agent
+
+
+def test_generate_uses_style_fingerprint_instead_of_raw_samples(agent: CoverLetterGeneratorAgent) -> None:
+    agent.generate(job_title="Engineer", job_description="Build things", company="Acme")
+
+    prompt = agent.generator_client.prompts[0]
+    assert "Plain, brief, favours 'moreover'." in prompt
+    assert "I write plainly." not in prompt
+    cached = json.loads(agent.fingerprint_file.read_text())
+    assert cached["fingerprint"] == "Plain, brief, favours 'moreover'."
+
+
+def test_style_fingerprint_is_reused_from_disk(agent: CoverLetterGeneratorAgent, tmp_path: Path) -> None:
+    agent.generate(job_title="Engineer", job_description="Build things", company="Acme")
+
+    fresh = CoverLetterGeneratorAgent(tmp_path, use_context_cache=False)
+    fresh.fingerprint_client = FakeClient("should not be called")
+    assert fresh._style_fingerprint() == "Plain, brief, favours 'moreover'."
+    assert fresh.fingerprint_client.prompts == []
+
+
+@pytest.mark.parametrize("canned", ["Mock style", None])
+def test_style_fingerprint_in_mock_mode_never_calls_gemini_or_writes_cache(
+    agent: CoverLetterGeneratorAgent, monkeypatch: pytest.MonkeyPatch, canned: str | None
+) -> None:
+    monkeypatch.setattr(cover_letter_generator_agent, "mock_enabled", lambda: True)
+    monkeypatch.setattr(cover_letter_generator_agent, "get_mock_response", lambda *_, **__: canned)
+
+    agent.generate(job_title="Engineer", job_description="Build things", company="Acme")
+
+    assert agent.fingerprint_client.prompts == []
+    assert not agent.fingerprint_file.exists()
+    expected = "Mock style" if canned else "I write plainly. Moreover, I am brief."
+    assert expected in agent.generator_client.prompts[0]
+
+
+def test_context_cache_is_reuploaded_when_the_profile_changes(agent: CoverLetterGeneratorAgent) -> None:
+    uploads: list[list[str]] = []
+
+    class CachingClient(FakeClient):
+        def create_cache(self, parts: list[str], *, ttl_seconds: int) -> str:
+            uploads.append(parts)
+            return f"cache-{len(uploads)}"
+
+    agent.generator_client = CachingClient("Dear Hiring Manager")
+    agent.use_context_cache = True
+
+    agent.generate(job_title="Engineer", job_description="Build things", company="Acme")
+    agent.generate(job_title="Engineer", job_description="Build more", company="Globex")
+    profile = agent.profile_file
+    profile.write_text("Go engineer")
+    os.utime(profile, ns=(profile.stat().st_mtime_ns + 10**9,) * 2)
+    agent.generate(job_title="Engineer", job_description="Build things", company="Acme")
+
+    assert len(uploads) == 2
+    assert "Go engineer" in uploads[1][0]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from agents.scoring.for_me_score_agent import ForMeScoreAgent
+
+
+class FakeClient:
+    """Scores each ``=== JOB n ===`` block with n * 10, optionally ignoring batches."""
+
+    def __init__(self, *, batch_ok: bool = True) -> None:
+        self.batch_ok = batch_ok
+        self.prompts: list[str] = []
+
+    async def agenerate_json(self, prompt: str, **kwargs) -> dict:
+        return self.generate_json(prompt, **kwargs)
+
+    def generate_json(self, prompt: str, *, metadata=None, **_) -> dict:
+        self.prompts.append(prompt)
+        jobs = re.findall(r"=== JOB \d+ ===\n(?:Company: \S+\nTitle: (\S+)|Role JSON:\n(.*?)\n=== END)", prompt, re.S)
+        titles = [title or json.loads(role)["role"] for title, role in jobs]
+        if len(titles) > 1 and not self.batch_ok:
+            return {"for_me_score": 1}
+        return {
+            "results": [
+                {"job": number, "for_me_score": float(title.split("-")[1]), "dimension_scores": {"location": 5}}
+                for number, title in reversed(list(enumerate(titles, start=1)))
+            ]
+        }
+
+
+@pytest.fixture
+def agent(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ForMeScoreAgent:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "profile.md").write_text("Profile text")
+    (tmp_path / "data" / "preferences.md").write_text("Preferences text")
+    return ForMeScoreAgent(tmp_path)
+
+
+def _jobs(count: int) -> list[dict]:
+    return [
+        {"job_title": f"role-{number}", "job_description": "Build things", "company": "Acme"}
+        if number % 2
+        else {"role": f"role-{number}", "company": "Acme"}
+        for number in range(count)
+    ]
+
+
+def test_evaluate_many_packs_jobs_and_keeps_order(agent: ForMeScoreAgent) -> None:
+    agent.client = FakeClient()
+
+    results = agent.evaluate_many(_jobs(5), batch_size=3)
+
+    assert [result.for_me_score for result in results] == [0, 1, 2, 3, 4]
+    assert len(agent.client.prompts) == 2
+    assert agent.client.prompts[0].count("Profile text") == 1
+
+    profile = agent.profile_file
+    profile.write_text("Updated profile")
+    os.utime(profile, ns=(profile.stat().st_mtime_ns + 10**9,) * 2)
+    agent.evaluate_many(_jobs(1))
+    assert "Updated profile" in agent.client.prompts[-1]
+
+
+def test_evaluate_many_falls_back_to_single_calls(agent: ForMeScoreAgent) -> None:
+    agent.client = FakeClient(batch_ok=False)
+
+    results = agent.evaluate_many(_jobs(2))
+
+    assert [result.for_me_score for result in results] == [0, 1]
+    assert len(agent.client.prompts) == 3
+    assert agent.evaluate(job_title="role-7", job_description="Build things").for_me_score == 7
+
+
+def test_batch_entries_rejects_replies_with_wrong_job_numbers() -> None:
+    jobs = _jobs(3)
+    entries = ForMeScoreAgent._batch_entries
+
+    assert entries(jobs, {"results": [{"job": 1}, {"job": 1}, {"job": 3}]}) is None
+    assert entries(jobs, {"results": [{"job": 0}, {"job": 1}, {"job": 2}]}) is None
+    assert entries(jobs, {"results": [{"for_me_score": 1}] * 3}) is None
+    assert entries(jobs, {"results": [{"job": 3}, {"job": 1}, {"job": 2}]}) == [{"job": 1}, {"job": 2}, {"job": 3}]
+    assert entries(jobs[:1], {"for_me_score": 1}) == [{"for_me_score": 1}]
+
+
+def test_aevaluate_many_sends_batches_concurrently(agent: ForMeScoreAgent) -> None:
+    agent.client = FakeClient(batch_ok=False)
+
+    results = asyncio.run(agent.aevaluate_many(_jobs(5), batch_size=2))
+
+    assert [result.for_me_score for result in results] == [0, 1, 2, 3, 4]
+    # Three batch attempts, then one call per job in the two rejected batches.
+    assert len(agent.client.prompts) == 7
+
+
+def test_aevaluate_many_holds_the_semaphore_for_each_call(agent: ForMeScoreAgent) -> None:
+    client = FakeClient()
+    in_flight = peak = 0
+
+    async def agenerate_json(prompt: str, **kwargs) -> dict:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return client.generate_json(prompt, **kwargs)
+
+    client.agenerate_json = agenerate_json
+    agent.client = client
+
+    async def run():
+        return await agent.aevaluate_many(_jobs(6), batch_size=1, sem=asyncio.Semaphore(2))
+
+    results = asyncio.run(run())
+
+    assert [result.for_me_score for result in results] == [0, 1, 2, 3, 4, 5]
+    assert peak == 2
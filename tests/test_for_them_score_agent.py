@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import pytest
+
+from agents.scoring import for_them_score_agent
+from agents.scoring.for_them_score_agent import _condense_jd
+
+
+def test_condense_jd_drops_boilerplate_sections() -> None:
+    raw = (
+        "<p>Backend Engineer</p>\n\n\n"
+        "About Us\nWe are a friendly  company   founded in 2010.\n\n"
+        "Responsibilities\n- Build APIs in Go\n- Run services on Kubernetes\n\n"
+        "Benefits\n- 25 days holiday\n- Pension &amp; gym\n\n"
+        "Requirements\n- 3+ years with Python"
+    )
+
+    assert _condense_jd(raw) == (
+        "Backend Engineer\n\n"
+        "Responsibilities\n- Build APIs in Go\n- Run services on Kubernetes\n\n"
+        "Requirements\n- 3+ years with Python"
+    )
+
+
+def test_condense_jd_skips_unbulleted_boilerplate_items_until_the_next_section() -> None:
+    raw = (
+        "Backend Engineer\n"
+        "Benefits\nPrivate health insurance\n25 days holiday\nCycle to work scheme\n"
+        "What you'll do\nBuild APIs in Go\n"
+        "About us\nFounded in 2010\nOffices in London\n"
+        "Requirements\n3+ years with Python"
+    )
+
+    assert _condense_jd(raw) == (
+        "Backend Engineer\n"
+        "What you'll do\nBuild APIs in Go\n"
+        "Requirements\n3+ years with Python"
+    )
+
+
+def test_condense_jd_prefers_requirement_paragraphs_when_too_long(monkeypatch) -> None:
+    monkeypatch.setattr(for_them_score_agent, "MAX_JD_CHARS", 80)
+    raw = "Intro paragraph that is long. " * 2 + "\n\nRequirements: Python, Go and SQL.\n\nClosing words."
+
+    condensed = _condense_jd(raw)
+
+    assert condensed.startswith("Requirements: Python, Go and SQL.")
+    assert len(condensed) <= 80
+
+
+def test_to_result_rejects_malformed_responses() -> None:
+    to_result = for_them_score_agent.ForThemScoreAgent._to_result
+
+    result = to_result({"for_them_score": 72, "dimension_scores": {"skills": 8}})
+
+    assert (result.for_them_score, result.reasoning) == (72.0, "No reasoning returned")
+    with pytest.raises(ValueError):
+        to_result({"for_them_score": "high", "dimension_scores": {}})
+    with pytest.raises(ValueError):
+        to_result({"for_them_score": 50, "dimension_scores": ["skills"]})
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+
+import httpx
+import pytest
+
+from agents.common import gemini_client
+from agents.common.gemini_client import GeminiClient, GeminiConfig
+
+
+class FakeStreamResponse:
+    status_code = 200
+
+    def __init__(self, chunks: list[str]) -> None:
+        self.lines = []
+        for chunk in chunks:
+            event = {"candidates": [{"content": {"parts": [{"text": chunk}]}}]}
+            self.lines += [f"data: {json.dumps(event)}", ""]
+        self.closed = False
+
+    def iter_lines(self, decode_unicode: bool = False):
+        return iter(self.lines)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_generate_json_stream_joins_sse_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    client = GeminiClient(GeminiConfig(model="gemini-test"))
+    response = FakeStreamResponse(['{"for_them_score": 8', '1, "reasoning": "fi', 't"}'])
+    requests_seen = []
+
+    def fake_post(url, payload, prompt, *, stream=False):
+        requests_seen.append((url, stream))
+        return response
+
+    monkeypatch.setattr(client, "_post_with_retries", fake_post)
+
+    assert client.generate_json("score this", stream=True) == {"for_them_score": 81, "reasoning": "fit"}
+    assert requests_seen == [(f"{client.BASE_URL}/models/gemini-test:streamGenerateContent?alt=sse", True)]
+    assert response.closed
+
+
+def test_agenerate_json_retries_server_errors_on_one_pooled_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    client = GeminiClient(GeminiConfig(model="gemini-test", system_instruction="Be brief."))
+    statuses = iter([503, 200, 200])
+    payloads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        status = next(statuses)
+        if status != 200:
+            return httpx.Response(status, headers={"Retry-After": "0"}, json={"error": {}})
+        return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": '{"ok": true}'}]}}]})
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(gemini_client, "retry_delay", lambda attempt: 0.0)
+    monkeypatch.setattr(httpx, "AsyncClient", functools.partial(httpx.AsyncClient, transport=transport))
+
+    async def generate_twice():
+        first = await client.agenerate_json("check")
+        pooled = client._async_client
+        await client.agenerate_json("check again")
+        assert client._async_client is pooled
+        await client.aclose()
+        assert pooled.is_closed
+        return first
+
+    assert asyncio.run(generate_twice()) == {"ok": True}
+    assert len(payloads) == 3
+    assert payloads[0]["systemInstruction"]["parts"][0]["text"] == "Be brief."
+    assert payloads[0]["generationConfig"]["responseMimeType"] == "application/json"
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import re
+from contextlib import asynccontextmanager
+
+import httpx
+
+from agents.discovery import job_url_extractor_agent as extractor
+from agents.discovery.job_url_extractor_agent import CompanyInfo, PageLinks
+
+
+class FakeLLM:
+    """Answers batched filter prompts by keeping every link ending in /1."""
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    def complete(self, prompt: str, *, temperature: float = 0.0, **_) -> str:
+        self.prompts.append(prompt)
+        blocks = re.findall(r"### Company (\d+):.*?Links:\n(\[.*?\])", prompt, re.S)
+        return json.dumps({index: [url for url in json.loads(links) if url.endswith("/1")] for index, links in blocks})
+
+
+class FakeBrowser:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self) -> None:
+        self.launched: list[FakeBrowser] = []
+
+    async def launch(self, headless: bool = True) -> FakeBrowser:
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = FakeChromium()
+
+
+def _write_companies(path, names):
+    path.write_text("Name,url\n" + "".join(f"{name},https://{name}.example/careers\n" for name in names))
+
+
+def test_extract_all_job_urls_runs_companies_concurrently(tmp_path, monkeypatch):
+    in_flight = 0
+    peak = 0
+    playwright = FakePlaywright()
+    used_browsers = set()
+
+    @asynccontextmanager
+    async def fake_browser_pool(size):
+        pool = extractor.BrowserPool(size)
+        await pool.start(playwright)
+        try:
+            yield pool
+        finally:
+            await pool.close()
+
+    async def fake_collect(company: CompanyInfo, llm, browser, timeout=60000, cache=None) -> PageLinks:
+        nonlocal in_flight, peak
+        used_browsers.add(id(browser))
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        links = [f"{company.careers_url}/1", f"{company.careers_url}/about"]
+        return PageLinks(company=company.name, careers_url=company.careers_url or "", links=links)
+
+    llm = FakeLLM()
+    monkeypatch.setattr(extractor, "GeminiClient", lambda **_: llm)
+    monkeypatch.setattr(extractor, "browser_pool", fake_browser_pool)
+    monkeypatch.setattr(extractor, "collect_company_links", fake_collect)
+    companies_csv = tmp_path / "companies.csv"
+    _write_companies(companies_csv, ["a", "b", "c", "d", "e"])
+
+    results = asyncio.run(
+        extractor.extract_all_job_urls(
+            companies_csv,
+            tmp_path / "urls.csv",
+            max_parallel=2,
+            filter_batch_size=3,
+            cache_path=tmp_path / "cache.sqlite3",
+        )
+    )
+
+    assert [result.company for result in results] == ["a", "b", "c", "d", "e"]
+    assert [result.job_urls for result in results] == [[f"https://{name}.example/careers/1"] for name in "abcde"]
+    assert len(llm.prompts) == 2
+    assert peak == 2
+    assert (tmp_path / "urls.csv").read_text().count("/careers/1") == 5
+    assert len(playwright.chromium.launched) == 2
+    assert used_browsers == {id(browser) for browser in playwright.chromium.launched}
+    assert all(browser.closed for browser in playwright.chromium.launched)
+
+    asyncio.run(
+        extractor.extract_all_job_urls(
+            companies_csv, tmp_path / "urls.csv", max_parallel=2, cache_path=tmp_path / "cache.sqlite3"
+        )
+    )
+    assert len(llm.prompts) == 2
+
+
+def test_filter_job_urls_batch_falls_back_per_company_on_bad_json():
+    class BrokenBatchLLM:
+        def __init__(self) -> None:
+            self.prompts: list[str] = []
+
+        def complete(self, prompt: str, *, temperature: float = 0.0, **_) -> str:
+            self.prompts.append(prompt)
+            if len(self.prompts) == 1:
+                return "not json"
+            return '["https://x.example/jobs/1"]'
+
+    llm = BrokenBatchLLM()
+    items = [
+        ("x", "https://x.example/careers", ["https://x.example/jobs/1"]),
+        ("y", "https://y.example/careers", ["https://y.example/jobs/2"]),
+    ]
+
+    assert extractor.filter_job_urls_batch(llm, items) == [["https://x.example/jobs/1"]] * 2
+    assert len(llm.prompts) == 3
+
+
+def test_prefilter_links_keeps_postings_on_site_and_ats():
+    links = [
+        "https://acme.com/careers/engineering/backend-developer",
+        "https://acme.com/careers/engineering/backend-developer/#apply",
+        "https://jobs.acme.com/jobs/1234",
+        "https://boards.greenhouse.io/acme/jobs/98765",
+        "https://acme.com/privacy",
+        "https://twitter.com/acme/status/123456",
+        "https://acme.com/careers",
+    ]
+
+    assert extractor.prefilter_links("https://www.acme.com/careers", links) == [
+        "https://acme.com/careers/engineering/backend-developer",
+        "https://jobs.acme.com/jobs/1234",
+        "https://boards.greenhouse.io/acme/jobs/98765",
+    ]
+
+
+def test_prefilter_links_falls_back_when_rules_match_too_little():
+    links = ["https://acme.com/open/a", "https://acme.com/open/b", "https://acme.com/open/a/"]
+
+    assert extractor.prefilter_links("https://acme.com/careers", links) == links[:2]
+
+
+def test_discovery_cache_round_trips_and_expires(tmp_path):
+    cache = extractor.DiscoveryCache(tmp_path / "cache.sqlite3")
+    cache.put_careers_url("Acme ", "https://acme.com/careers")
+    cache.put_job_urls("https://acme.com/careers", ["b", "a"], ["https://acme.com/jobs/1"])
+
+    assert cache.get_careers_url("acme") == "https://acme.com/careers"
+    assert cache.get_job_urls("https://acme.com/careers", ["a", "b"]) == ["https://acme.com/jobs/1"]
+    assert cache.get_job_urls("https://acme.com/careers", ["a", "b", "c"]) is None
+
+    cache.ttl_seconds = -1
+    assert cache.get_careers_url("acme") is None
+    cache.close()
+
+
+def test_static_links_are_resolved_and_narrowed_to_job_hints():
+    html = """
+        <a href="/jobs/1">One</a>
+        <a href="/jobs/2">Two</a>
+        <a href="https://acme.com/careers/backend">Backend</a>
+        <a href="/jobs/1">One again</a>
+        <a href="/about">About</a>
+        <a href="mailto:hr@acme.com">Mail</a>
+    """
+    hrefs = extractor._anchor_hrefs(html, "https://acme.com/careers")
+
+    assert extractor._select_job_links(hrefs) == [
+        "https://acme.com/jobs/1",
+        "https://acme.com/jobs/2",
+        "https://acme.com/careers/backend",
+    ]
+
+
+def test_write_back_careers_urls_fills_only_blank_urls_of_successful_companies(tmp_path):
+    companies_csv = tmp_path / "companies.csv"
+    companies_csv.write_text("Name,url,notes\nAcme,,keep\nBeta,https://beta.example/jobs,\nGamma,,\nDelta,,\n")
+    companies = list(extractor.read_companies_csv(companies_csv))
+    results = [
+        extractor.ExtractionResult("Acme", "https://acme.example/careers", ["https://acme.example/jobs/1"], "success"),
+        extractor.ExtractionResult("Beta", "https://beta.example/jobs", [], "success"),
+        extractor.ExtractionResult("Gamma", "", [], "no_careers_page"),
+        extractor.ExtractionResult("Delta", "https://delta.example/about", [], "no_jobs"),
+    ]
+
+    assert extractor.write_back_careers_urls(companies_csv, companies, results) == 1
+    assert companies_csv.read_text().splitlines() == [
+        "Name,url,notes",
+        "Acme,https://acme.example/careers,keep",
+        "Beta,https://beta.example/jobs,",
+        "Gamma,,",
+        "Delta,,",
+    ]
+
+
+def test_append_to_urls_csv_dedupes_via_index_and_rebuilds_after_edits(tmp_path):
+    output_csv = tmp_path / "urls.csv"
+    output_csv.write_text("url\nhttps://acme.example/jobs/1\n")
+
+    def result(*urls):
+        return extractor.ExtractionResult("Acme", "https://acme.example/careers", list(urls), "success")
+
+    first = result("https://acme.example/jobs/1", "https://acme.example/jobs/2", "https://acme.example/jobs/2")
+    assert extractor.append_to_urls_csv(output_csv, [first]) == 1
+    assert extractor.append_to_urls_csv(output_csv, [result("https://acme.example/jobs/2")]) == 0
+
+    output_csv.write_text("url\n")
+    assert extractor.append_to_urls_csv(output_csv, [result("https://acme.example/jobs/2")]) == 1
+    assert output_csv.read_text().splitlines() == ["url", "https://acme.example/jobs/2"]
+
+
+def test_filter_job_urls_with_batch_api_reruns_unusable_replies_live():
+    class BatchLLM:
+        def __init__(self) -> None:
+            self.live_prompts: list[str] = []
+
+        def complete_batch(self, prompts, **_):
+            assert len(prompts) == 2
+            return ['{"1": ["https://a.example/jobs/1"], "2": []}', ""]
+
+        def complete(self, prompt: str, *, temperature: float = 0.0, **_) -> str:
+            self.live_prompts.append(prompt)
+            return '{"1": ["https://c.example/jobs/3"], "2": ["https://d.example/jobs/4"]}'
+
+    def item(name):
+        return (name, f"https://{name}.example/careers", [f"https://{name}.example/jobs/1"])
+
+    llm = BatchLLM()
+    results = extractor.filter_job_urls_with_batch_api(llm, [[item("a"), item("b")], [item("c"), item("d")]])
+
+    assert results == [
+        [["https://a.example/jobs/1"], []],
+        [["https://c.example/jobs/3"], ["https://d.example/jobs/4"]],
+    ]
+    assert len(llm.live_prompts) == 1
+
+
+def test_reachable_sites_keeps_bot_walled_sites_for_the_browser(monkeypatch):
+    statuses = {"a": 200, "b": 403, "c": 404, "d": 429, "e": 405, "f": 500}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses[request.url.host.split(".")[0]])
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(httpx, "AsyncClient", functools.partial(httpx.AsyncClient, transport=transport))
+
+    urls = [f"https://{name}.example" for name in statuses]
+    assert asyncio.run(extractor._reachable_sites(urls)) == [
+        "https://a.example", "https://b.example", "https://d.example", "https://e.example"
+    ]
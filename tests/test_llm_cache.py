@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from agents.common import llm_cache
+
+
+def test_store_then_lookup_round_trips_by_key(tmp_path: Path) -> None:
+    key = llm_cache.cache_key("prompt", model="m", temperature=0.0)
+
+    assert llm_cache.lookup(key, bucket="test", cache_dir=tmp_path) is None
+    llm_cache.store(key, "response", bucket="test", cache_dir=tmp_path)
+
+    assert llm_cache.lookup(key, bucket="test", cache_dir=tmp_path) == "response"
+    assert llm_cache.cache_key("prompt", model="other", temperature=0.0) != key
+    assert [path.name for path in (tmp_path / "test").glob("*/*.json")] == [f"{key}.json"]
+
+
+def test_unreadable_entries_are_misses(tmp_path: Path) -> None:
+    key = llm_cache.cache_key("prompt", model="m", temperature=0.0)
+    path = tmp_path / "test" / key[:2] / f"{key}.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+
+    assert llm_cache.lookup(key, bucket="test", cache_dir=tmp_path) is None
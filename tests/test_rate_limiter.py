@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from agents.common.rate_limiter import TokenBucket
+
+
+def test_token_bucket_spaces_requests_and_backs_off() -> None:
+    bucket = TokenBucket(rate_per_min=1200, burst=1)
+
+    async def burst() -> float:
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+        return time.monotonic() - started
+
+    assert 0.14 <= asyncio.run(burst()) < 0.5
+
+    bucket.backoff(retry_after=0.1)
+    assert bucket.rate == bucket.max_rate / 2
+    started = time.monotonic()
+    with bucket:
+        pass
+    assert time.monotonic() - started >= 0.09
+    bucket.record_success()
+    assert bucket.rate > bucket.max_rate / 2
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from agents.common.insight_generator_agent import InsightResult
+from agents.scoring.for_me_score_agent import ForMeScoreResult
+from agents.scoring.for_them_score_agent import ForThemScoreResult
+from agents.scoring.role_evaluation_engine import RoleEvaluationEngine
+from agents.scoring.role_validation_agent import RoleValidationResult
+
+
+class FakeValidator:
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+
+    async def aevaluate(self, role):
+        self.seen.append(role["role"])
+        await asyncio.sleep(0)
+        valid = role["role"] != "skip-me"
+        return RoleValidationResult(valid, [] if valid else ["missing title"], [], 0.9, "checked")
+
+
+class FakeForMe:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def aevaluate_many(self, roles, sem=None):
+        self.batches.append([role["role"] for role in roles])
+        await asyncio.sleep(0.01)
+        return [ForMeScoreResult(float(len(role["role"])), "fits", {}) for role in roles]
+
+
+class FakeForThem:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def aevaluate(self, role):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return ForThemScoreResult(50.0, "strong", {})
+
+
+class FakeInsight:
+    async def asynthesize(self, role, for_me, for_them):
+        return InsightResult(f"{role['role']}: {for_me['for_me_score']}/{for_them['for_them_score']}")
+
+
+def _engine(tmp_path: Path, roles: list[dict]) -> RoleEvaluationEngine:
+    output = tmp_path / "data" / "output"
+    output.mkdir(parents=True)
+    (output / "all_jobs.json").write_text(json.dumps(roles))
+    engine = RoleEvaluationEngine(tmp_path)
+    engine.validator = FakeValidator()
+    engine.for_me_agent = FakeForMe()
+    engine.for_them_agent = FakeForThem()
+    engine.insight_agent = FakeInsight()
+    return engine
+
+
+def test_arun_scores_roles_concurrently_in_input_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    roles = [{"company": "Acme", "role": name} for name in ("eng", "skip-me", "data-eng", "ml")]
+    engine = _engine(tmp_path, roles)
+    output = tmp_path / "data" / "output"
+
+    results = engine.run(max_concurrent=2)
+
+    assert [result["role"] for result in results] == ["eng", "skip-me", "data-eng", "ml"]
+    assert results[1]["status"] == "skipped"
+    assert results[2]["insight"]["insight"] == "data-eng: 8.0/50.0"
+    assert engine.for_me_agent.batches == [["eng", "data-eng", "ml"]]
+    assert engine.for_them_agent.peak == 2
+    with (output / "job_scores.csv").open(newline="") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0][0] == "Company"
+    assert [row[1] for row in rows[1:]] == ["eng", "data-eng", "ml"]
+    assert not engine.progress_file.exists()
+
+
+def test_arun_resumes_from_progress_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    roles = [{"company": "Acme", "role": name} for name in ("eng", "ml")]
+    engine = _engine(tmp_path, roles)
+    earlier = {
+        "company": "Acme",
+        "role": "eng",
+        "for_me": {"for_me_score": 99},
+        "for_them": {"for_them_score": 10},
+        "insight": {"insight": "from before"},
+    }
+    engine.progress_file.write_text(json.dumps(earlier) + "\n" + '{"company": "Acme", "ro')
+
+    results = engine.run()
+
+    assert engine.validator.seen == ["ml"]
+    assert results[0] == earlier
+    assert results[1]["insight"]["insight"] == "ml: 2.0/50.0"
+    assert json.loads(engine.output_file.read_text()) == results
+    assert "99,10,from before" in (tmp_path / "data" / "output" / "job_scores.csv").read_text()
+
+
+class FakePrefilter:
+    def below_threshold(self, roles):
+        return [role["role"] == "chef" for role in roles]
+
+
+def test_prefiltered_roles_skip_for_them(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    engine = _engine(tmp_path, [{"company": "Acme", "role": name} for name in ("eng", "chef")])
+    engine.prefilter = FakePrefilter()
+
+    results = engine.run()
+
+    assert results[0]["for_them"]["for_them_score"] == 50.0
+    assert results[1]["for_them"] == {
+        "for_them_score": 0.0,
+        "reasoning": "Prefiltered by low semantic similarity",
+        "dimension_scores": {},
+    }
+    assert engine.for_them_agent.peak == 1
+
+
+def test_arun_evaluates_same_title_at_each_location(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    roles = [{"company": "Acme", "role": "eng", "location": city} for city in ("London", "Berlin")]
+    engine = _engine(tmp_path, roles)
+
+    results = engine.run()
+
+    assert engine.validator.seen == ["eng", "eng"]
+    assert engine.for_me_agent.batches == [["eng", "eng"]]
+    assert [result["location"] for result in results] == ["London", "Berlin"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import csv
 import json
 from pathlib import Path
@@ -11,6 +12,7 @@ from agents.discovery.role_normaliser_agent import (
     ConversionResult,
     convert_raw_text,
     convert_roles_csv,
+    RoleIndex,
     _load_text,
 )
 
@@ -109,9 +111,132 @@ def test_convert_roles_csv_skips_duplicates(tmp_path: Path) -> None:
     assert second_results[0].status == "unchanged"
 
 
+def test_convert_roles_csv_runs_rows_concurrently_in_order(tmp_path: Path) -> None:
+    csv_path = tmp_path / "roles.csv"
+    with csv_path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(["raw_text"])
+        for number in range(6):
+            writer.writerow([f"Role {number} description" if number != 2 else " "])
+
+    class AsyncLLM:
+        def __init__(self) -> None:
+            self.in_flight = 0
+            self.peak = 0
+
+        def complete(self, prompt: str, *, temperature: float = 0.0) -> str:  # pragma: no cover - unused
+            pytest.fail("sync path should not be used")
+
+        async def acomplete(self, prompt: str, *, temperature: float = 0.0) -> str:
+            number = int(prompt.split("Role ")[-1].split()[0])
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            # Later rows finish first to prove results are reordered.
+            await asyncio.sleep(0.01 * (6 - number))
+            self.in_flight -= 1
+            return json.dumps({"id": f"role-{number}"})
+
+    llm = AsyncLLM()
+    results = convert_roles_csv(
+        csv_path,
+        llm=llm,
+        output_dir=tmp_path / "output",
+        max_rows=4,
+        max_concurrent=3,
+    )
+
+    assert [result.index for result in results] == [1, 2, 4, 5]
+    assert [result.payload["id"] for result in results] == ["role-0", "role-1", "role-3", "role-4"]
+    assert llm.peak == 3
+
+
+def test_convert_roles_csv_sees_pending_writes_for_repeated_ids(tmp_path: Path) -> None:
+    csv_path = tmp_path / "roles.csv"
+    csv_path.write_text("raw_text\nFirst listing\nCross-posted listing\n", encoding="utf-8")
+    payload = json.dumps({"id": "role-one", "company_name": "Foo"})
+
+    results = convert_roles_csv(csv_path, llm=FakeLLM([payload, payload]), output_dir=tmp_path / "output")
+
+    assert [result.status for result in results] == ["created", "unchanged"]
+    assert [path.name for path in (tmp_path / "output").iterdir()] == ["role-one.json"]
+
+
+def test_convert_roles_csv_calls_llm_once_per_distinct_text(tmp_path: Path) -> None:
+    csv_path = tmp_path / "roles.csv"
+    csv_path.write_text("raw_text\nSame listing\n  Same listing \nOther listing\n", encoding="utf-8")
+    llm = FakeLLM([json.dumps({"company_name": "Foo"})] * 2)
+
+    results = convert_roles_csv(csv_path, llm=llm, output_dir=tmp_path / "output")
+
+    assert len(llm.prompts) == 2
+    assert [result.index for result in results] == [1, 2, 3]
+    assert results[0].payload is results[1].payload
+
+
+def test_semantic_cache_hits_skip_llm_only_for_same_company(tmp_path: Path) -> None:
+    class FakeSemanticCache:
+        def __init__(self) -> None:
+            self.stored: list[tuple[str, dict]] = []
+
+        def get(self, text: str) -> dict:
+            return {"id": "acme-engineer", "company_name": "Acme", "raw_text": "old"}
+
+        def put(self, text: str, payload: dict) -> None:
+            self.stored.append((text, payload))
+
+    cache = FakeSemanticCache()
+    llm = FakeLLM([json.dumps({"id": "globex-engineer", "company_name": "Globex"})])
+    template = "{example_json}{raw_text}"
+
+    reused, _ = convert_raw_text("Acme is hiring an engineer", llm=llm, prompt_template=template, semantic_cache=cache)
+    fresh, _ = convert_raw_text("Globex is hiring an engineer", llm=llm, prompt_template=template, semantic_cache=cache)
+
+    assert reused == {"id": "acme-engineer", "company_name": "Acme", "raw_text": "Acme is hiring an engineer"}
+    assert fresh["company_name"] == "Globex"
+    assert len(llm.prompts) == 1
+    assert cache.stored == [("Globex is hiring an engineer", fresh)]
+
+
+def test_semantic_cache_hits_are_not_reused_for_another_location() -> None:
+    class FakeSemanticCache:
+        def get(self, text: str) -> dict:
+            return {"id": "acme_engineer_london", "company_name": "Acme", "location": "London", "raw_text": "old"}
+
+        def put(self, text: str, payload: dict) -> None:
+            pass
+
+    llm = FakeLLM([json.dumps({"id": "acme_engineer_berlin", "company_name": "Acme", "location": "Berlin"})])
+
+    payload, _ = convert_raw_text(
+        "Acme is hiring an engineer in Berlin",
+        llm=llm,
+        prompt_template="{example_json}{raw_text}",
+        semantic_cache=FakeSemanticCache(),
+    )
+
+    assert payload["id"] == "acme_engineer_berlin"
+    assert len(llm.prompts) == 1
+
+
+def test_role_index_reads_files_only_until_id_is_found(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.json").write_text(json.dumps({"id": f"id-{name}"}), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    monkeypatch.setattr(RoleIndex, "READ_WORKERS", 1)
+
+    index = RoleIndex(tmp_path)
+    found = index.find_by_id("id-b")
+
+    assert found == tmp_path / "b.json"
+    assert len(index._unread) < 4
+    assert index.find_by_name("c.json") == tmp_path / "c.json"
+    assert index.find_by_id("missing") is None
+    assert index.find_by_id("id-a") == tmp_path / "a.json"
+
+
 def test_load_text_missing_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     missing_path = tmp_path / "missing.json"
     result = _load_text(missing_path)
     captured = capsys.readouterr()
     assert result is None
-    assert "auxiliary file not found" in captured.err
\ No newline at end of file
+    assert "auxiliary file not found" in captured.err
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+
+from pipeline import scrape_and_normalize
+from pipeline.scrape_and_normalize import ScraperTimeoutError, _job_text_from_html
+
+DESCRIPTION = "We are hiring a backend engineer to build and operate distributed services in Go and Python. " * 2
+
+
+def test_job_text_from_server_rendered_html() -> None:
+    html = (
+        "<html><body><nav>Jobs</nav><main><script>track()</script>"
+        f"<h1>Backend Engineer</h1><p>{DESCRIPTION}</p></main></body></html>"
+    )
+
+    text = _job_text_from_html(html)
+
+    assert text is not None
+    assert text.startswith("Backend Engineer\nWe are hiring")
+    assert "track()" not in text
+
+
+def test_job_text_needs_browser_for_client_rendered_shell() -> None:
+    html = '<html><body><div id="root"></div><main>Loading…</main><script src="/app.js"></script></body></html>'
+
+    assert _job_text_from_html(html) is None
+
+
+def test_scrape_urls_to_csv_scrapes_concurrently_in_order(tmp_path, monkeypatch) -> None:
+    in_flight = {"now": 0, "peak": 0}
+
+    async def fake_scrape(url, timeout=30.0, *, session=None):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        if url.endswith("/broken"):
+            raise ScraperTimeoutError("timed out")
+        return f"content of {url}"
+
+    monkeypatch.setattr(scrape_and_normalize, "scrape_job_page", fake_scrape)
+    input_csv = tmp_path / "urls.csv"
+    urls = ["https://jobs.example.com/1", "https://jobs.example.com/broken", "https://jobs.example.com/3"]
+    input_csv.write_text("url\n" + "\n".join(urls) + "\n")
+    output_csv = tmp_path / "scraped.csv"
+
+    counts = asyncio.run(
+        scrape_and_normalize.scrape_urls_to_csv(input_csv, output_csv, clean_with_llm=False, concurrency=2)
+    )
+
+    assert counts == (2, 1)
+    assert in_flight["peak"] == 2
+    with output_csv.open(newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["url"] for row in rows] == urls
+    assert [row["status"] for row in rows] == ["success", "failed: ScraperTimeoutError", "success"]
+    assert rows[2]["raw_text"] == "content of https://jobs.example.com/3"
+
+
+def test_scrape_pages_caps_requests_per_host(monkeypatch) -> None:
+    in_flight: dict[str, int] = {}
+    peaks: dict[str, int] = {}
+
+    async def fake_scrape(url, timeout=30.0, *, session=None):
+        host = url.split("/")[2]
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peaks[host] = max(peaks.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return url
+
+    monkeypatch.setattr(scrape_and_normalize, "scrape_job_page", fake_scrape)
+    urls = [f"https://{host}/{number}" for number in range(4) for host in ("a.example.com", "b.example.com")]
+
+    results = asyncio.run(scrape_and_normalize.scrape_pages(urls, concurrency=8, session=object()))
+
+    assert results == urls
+    assert peaks == {"a.example.com": 2, "b.example.com": 2}
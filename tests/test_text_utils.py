@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import pytest
+
+from agents.common.text_utils import strip_code_fence
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('```json\n{"a": 1}\n```', '{"a": 1}'),
+        ('  {"a": 1}\n', '{"a": 1}'),
+        ("```\n{}", "{}"),
+        ('```json\n{"a": "```x```"}\n```  \n', '{"a": "```x```"}'),
+    ],
+)
+def test_strip_code_fence(text: str, expected: str) -> None:
+    assert strip_code_fence(text) == expected
@@ -74,7 +74,7 @@ class QuestionDiscoveryService:
             context.job_name = f"{company_name}_{job_title}"
             
             # Navigate and extract fields using the navigator agent
-            async with PlaywrightSession() as session:
+            async with PlaywrightSession(self.orchestrator.session_config) as session:
                 navigator_result = await self.orchestrator.navigator.run_async(
                     context, 
                     session